@@ -0,0 +1,183 @@
+"""Corpus benchmark with JSON results and a baseline gate.
+
+Run with ``uv run python benchmarks/benchmark_corpus.py``. The documents come
+from `corpus_fixtures.make_corpus()`, so the benchmark runs offline and the
+same `--seed` measures the same text. Pass ``--output results.json`` to keep
+the results and ``--baseline results.json`` to compare a later run with them;
+the run exits with status 1 if a metric is worse than the baseline by more than
+``--tolerance``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from time import perf_counter
+
+from corpus_fixtures import make_corpus
+
+from citation_utils import CitableDocument, StageProfiler
+from citation_utils.citation import CountedCitationRecord
+from citation_utils.identity import aggregate_occurrences
+
+STAGES = ("normalize", "dockets", "reports", "occurrences", "aggregate", "rows")
+HIGHER_IS_BETTER = {"mb_per_s", "citations_per_s"}
+
+
+def get_versions() -> dict[str, str | None]:
+    """Installed versions of this library and of its parsing dependencies."""
+    versions: dict[str, str | None] = {}
+    for name in ("citation-utils", "citation-date", "citation-report"):
+        try:
+            versions[name] = version(name)
+        except PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def stage_of(name: str) -> str:
+    """The benchmark stage of a `StageProfiler` stage: the docket stages and the
+    docket span index are `dockets`, the merge of `iter_occurrences()` is
+    `occurrences`, and `normalize`, `reports` and `aggregate` keep their names."""
+    if name.startswith("dockets.") or name == "span_index":
+        return "dockets"
+    if name == "occurrences.merge":
+        return "occurrences"
+    return name
+
+
+def run_stages(
+    texts: list[str], window: int | None = None
+) -> tuple[dict[str, float], int]:
+    """Seconds spent in each stage of `CountedCitation.extract_rows()` over
+    `texts`, as recorded by a `StageProfiler`, and the number of occurrences
+    found. Building the rows from the groups is timed here."""
+    profiler = StageProfiler()
+    rows = 0.0
+    found = 0
+    for text in texts:
+        document = CitableDocument(text, window=window, profiler=profiler)
+        occurrences = list(document.iter_occurrences())
+        groups = aggregate_occurrences(
+            (item.to_parts() for item in occurrences), profiler=profiler
+        )
+        start = perf_counter()
+        [CountedCitationRecord.from_group(group) for group in groups]
+        rows += perf_counter() - start
+        found += len(occurrences)
+    timings = dict.fromkeys(STAGES, 0.0)
+    for name, seconds in profiler.seconds.items():
+        timings[stage_of(name)] += seconds
+    timings["rows"] = rows
+    return timings, found
+
+
+def peak_memory(texts: list[str], window: int | None = None) -> int:
+    """Peak bytes allocated while extracting the rows of the largest text."""
+    text = max(texts, key=len)
+    tracemalloc.start()
+    run_stages([text], window)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def profile(texts: list[str], window: int | None = None) -> dict:
+    """The `StageProfiler` stages of one pass over `texts`, e.g. the time of each
+    docket style's matches; reported but not compared with a baseline."""
+    profiler = StageProfiler()
+    for text in texts:
+        document = CitableDocument(text, window=window, profiler=profiler)
+        aggregate_occurrences(document.iter_parts(), profiler=profiler)
+    return profiler.to_dict()
+
+
+def measure(seed: int, documents: int, repeats: int, window: int | None = None) -> dict:
+    texts = make_corpus(seed, documents)
+    size = sum(len(text.encode()) for text in texts)
+    runs = [run_stages(texts, window) for _ in range(repeats)]
+    stages = {stage: min(timings[stage] for timings, _ in runs) for stage in STAGES}
+    total = min(sum(timings.values()) for timings, _ in runs)
+    citations = runs[0][1]
+    return {
+        "meta": {
+            "seed": seed,
+            "documents": documents,
+            "repeats": repeats,
+            "window": window,
+            "bytes": size,
+            "citations": citations,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "versions": get_versions(),
+        },
+        "metrics": {
+            "mb_per_s": size / 1e6 / total,
+            "citations_per_s": citations / total,
+            "peak_memory_bytes": peak_memory(texts, window),
+            "total_s": total,
+            **{f"{stage}_s": seconds for stage, seconds in stages.items()},
+        },
+        "profile": profile(texts, window),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """The metrics of `results` worse than `baseline` by more than `tolerance`,
+    a fraction of the baseline value."""
+    corpus = ("seed", "documents", "window")
+    if [results["meta"][key] for key in corpus] != [
+        baseline["meta"].get(key) for key in corpus
+    ]:
+        raise ValueError("The baseline was measured on a different corpus.")
+    regressions = []
+    for name, value in results["metrics"].items():
+        expected = baseline["metrics"].get(name)
+        if not expected:
+            continue
+        change = value / expected - 1
+        if name not in HIGHER_IS_BETTER:
+            change = -change
+        marker = ""
+        if change < -tolerance:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        print(f"{name}: {value:.4g} vs {expected:.4g} ({change:+.1%}){marker}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--window", type=int, help="see `CitableDocument.window`")
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="results JSON to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="allowed fraction by which a metric may be worse (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    results = measure(args.seed, args.documents, args.repeats, args.window)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if not args.baseline:
+        print(json.dumps(results, indent=2))
+        return
+    baseline = json.loads(args.baseline.read_text())
+    if regressions := compare(results, baseline, args.tolerance):
+        print(f"Slower than baseline beyond {args.tolerance:.0%}: {regressions}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,20 @@ inputs so results remain meaningful across machines.
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from collections.abc import Callable
 from time import perf_counter
 
-from citation_utils import CitableDocument, CountedCitation, Docket
+from citation_utils import CitableDocument, Citation, CountedCitation, Docket
 from citation_utils.identity import CitationParts, display_report, render_parts
 
+COLD_START = (
+    "from citation_utils import Citation; "
+    "Citation.extract_citation('G.R. No. 1, Jan. 1, 2000, 1 SCRA 1')"
+)
+
 
 def measure(name: str, operation: Callable[[], object], repeats: int = 5) -> None:
     timings = []
@@ -27,6 +35,30 @@ def extract(text: str) -> None:
     list(CitableDocument(text).get_citations())
 
 
+def run_python(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def thread_scaling(texts: list[str]) -> None:
+    """Time the `thread` batch backend with 1, 2, 4, ... threads up to the CPU
+    count; the threads run in parallel only on a free-threaded build."""
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"thread scaling ({'GIL enabled' if gil else 'free-threaded'}):")
+    sources = list(enumerate(texts))
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        measure(
+            f"  {workers} thread(s)",
+            lambda: list(
+                Citation.extract_citations_many(
+                    sources, workers=workers, backend="thread"
+                )
+            ),
+            repeats=3,
+        )
+        workers *= 2
+
+
 def main() -> None:
     dense = "; ".join(
         f"G.R. No. {index}, Jan. 1, 2000, {index} SCRA 1" for index in range(1000, 3000)
@@ -52,6 +84,8 @@ def main() -> None:
         phil="1 Phil. 2", scra="3 SCRA 4", offg="47 O.G. Supp. 43"
     )
 
+    measure("interpreter startup", lambda: run_python("pass"))
+    measure("cold import and first extraction", lambda: run_python(COLD_START))
     measure(
         "short valid snippet",
         lambda: extract("G.R. No. 1, Jan. 1, 2000, 1 SCRA 1"),
@@ -62,6 +96,10 @@ def main() -> None:
     measure("dense docket/report pairs", lambda: extract(dense))
     measure("overlapping ownership", lambda: extract(overlapping_ownership))
     measure("adversarial AM near miss", lambda: extract(adversarial_near_miss))
+    measure(
+        "mixed categories as models", lambda: list(Citation.extract_citations(mixed))
+    )
+    measure("mixed categories as rows", lambda: list(Citation.extract_rows(mixed)))
     measure("counted reports", lambda: CountedCitation.counted_reports(report_only))
     measure(
         "canonical report rendering",
@@ -79,6 +117,7 @@ def main() -> None:
         "legacy GR repair",
         lambda: [Docket.clean_serial("L-I9863", "GR") for _ in range(10_000)],
     )
+    thread_scaling([mixed, dense, overlapping_ownership] * 8)
 
 
 if __name__ == "__main__":
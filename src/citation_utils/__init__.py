@@ -1,3 +1,6 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .citation import Citation, CountedCitation
 from .dockets import (
     DOCKET_DATE_FORMAT,
@@ -36,4 +39,37 @@ from .dockets import (
 )
 from .document import CitableDocument
 from .identity import CitationOccurrence
+from .profiling import StageProfiler
 from .special import extract_docket_meta
+
+if TYPE_CHECKING:
+    from .aggregator import CorpusAggregator
+    from .columns import OccurrenceColumns, OccurrenceTable
+    from .guard import GuardedExtraction, extract_guarded
+    from .incremental import IncrementalDocument
+    from .index import CitationIndex
+    from .offsets import ByteOffsets
+
+_LAZY = {
+    "ByteOffsets": "offsets",
+    "CitationIndex": "index",
+    "CorpusAggregator": "aggregator",
+    "GuardedExtraction": "guard",
+    "IncrementalDocument": "incremental",
+    "OccurrenceColumns": "columns",
+    "OccurrenceTable": "columns",
+    "extract_guarded": "guard",
+}
+"""Names whose modules are imported on first access rather than with the package."""
+
+
+def __getattr__(name: str):
+    if module := _LAZY.get(name):
+        value = getattr(import_module(f".{module}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
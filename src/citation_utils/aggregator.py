@@ -0,0 +1,357 @@
+"""Corpus-wide aggregation of citation occurrences in bounded memory.
+
+`CorpusAggregator` applies the rule of `aggregate_occurrences()` to a whole
+corpus rather than to one document: a report-only occurrence counts as a
+mention of a docket only if that report is attached to exactly one docket
+identity anywhere in the corpus, e.g. "100 SCRA 1" is "G.R. No. 1" because no
+other G.R. number was ever cited with it.
+
+Its state is a table of partial docket groups keyed by `docket_key`, and a
+table of the dockets and report-only mentions of each report identity. When
+the tables hold more than `max_entries` keys, they are written to disk in
+`partitions` files each and emptied. A partial group combines with another of
+the same key regardless of order, so aggregators of separate worker processes
+can be merged, and `groups()` reads one partition at a time.
+
+`max_entries` bounds what `add()` holds. `groups()` holds, besides, the keys
+of one partition of a table, about `1 / partitions` of the distinct identities
+of the corpus, and up to `max_entries` linked report-only mentions. For a
+corpus of `n` distinct identities, `partitions` of `n / max_entries` or more
+keep `groups()` within about three times `max_entries` keys.
+"""
+
+import logging
+import pickle
+import shutil
+import tempfile
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from .dockets import DocketCategory
+from .identity import CitationParts
+from .index import DocketKey, ReportKey, link_dockets, linked_docket
+
+AGGREGATOR_PARTITIONS = 16
+"""Files per table when spilling; `groups()` loads one at a time."""
+AGGREGATOR_MAX_ENTRIES = 500_000
+"""Keys held in memory by a `CorpusAggregator` before it spills to disk."""
+
+REPORT_FIELDS = ("phil", "scra", "offg")
+
+Order = tuple[int, int]
+"""The position of an occurrence in the corpus: document order and offset."""
+Evidence = tuple[Order, str] | None
+"""The first-seen value of a report field and where it was seen."""
+
+
+@dataclass(slots=True)
+class _DocketPartial:
+    first: Order
+    category: DocketCategory | None
+    serial: str | None
+    docket_date: date | None
+    mentions: int
+    reports: list[Evidence]
+
+    def combine(self, other: "_DocketPartial", key: Any) -> None:
+        if other.first < self.first:
+            self.category, self.serial = other.category, other.serial
+            self.docket_date = other.docket_date
+        self.enrich(other, key)
+
+    def enrich(self, other: "_DocketPartial", key: Any) -> None:
+        """Add the mentions and reports of `other` but not its docket fields."""
+        self.first = min(self.first, other.first)
+        self.mentions += other.mentions
+        self.reports = [
+            _earliest(name, key, mine, theirs)
+            for name, mine, theirs in zip(REPORT_FIELDS, self.reports, other.reports)
+        ]
+
+
+@dataclass(slots=True)
+class _ReportPartial:
+    dockets: tuple[DocketKey, ...] = ()
+    """The dockets that carry the report, see `link_dockets()`."""
+    only: _DocketPartial | None = None
+    """Report-only mentions, as a group without a docket."""
+
+    def combine(self, other: "_ReportPartial", key: Any) -> None:
+        self.dockets = link_dockets(self.dockets, *other.dockets)
+        if other.only is None:
+            return
+        if self.only is None:
+            self.only = other.only
+        else:
+            self.only.combine(other.only, key)
+
+
+@dataclass(frozen=True, slots=True)
+class CorpusGroup:
+    """A citation identity of the corpus with all its mentions.
+
+    Attributes:
+        parts: The first-seen docket fields and, per report field, the first-seen report
+        mentions: Occurrences, linked report-only mentions included
+        first: Document order and offset of the first occurrence
+    """  # noqa: E501
+
+    parts: CitationParts
+    mentions: int
+    first: Order
+
+
+def _earliest(name: str, key: Any, mine: Evidence, theirs: Evidence) -> Evidence:
+    if mine is None or theirs is None:
+        return mine or theirs
+    if mine[1].casefold() != theirs[1].casefold():
+        kept, dropped = sorted([mine, theirs])
+        logging.warning(
+            "Conflicting %s evidence for %s; retaining first-seen %r over %r",
+            name,
+            key,
+            kept[1],
+            dropped[1],
+        )
+    return min(mine, theirs)
+
+
+def _partition(key: tuple[str, ...], partitions: int) -> int:
+    """Stable across processes, unlike `hash()` of strings."""
+    return zlib.crc32("\0".join(key).encode()) % partitions
+
+
+@dataclass
+class CorpusAggregator:
+    """Aggregate the occurrences of many documents into `CorpusGroup` records.
+
+    Examples:
+        >>> from citation_utils import CitableDocument
+        >>> aggregator = CorpusAggregator()
+        >>> for text in ["G.R. No. 1, Jan. 1, 2000, 100 SCRA 1", "see 100 SCRA 1", "1 Phil. 1"]:
+        ...     aggregator.add(CitableDocument(text).iter_parts())
+        >>> groups = sorted(aggregator.groups(), key=lambda group: group.first)
+        >>> [(group.first, group.parts.serial, group.parts.scra, group.mentions) for group in groups]
+        [((0, 0), '1', '100 SCRA 1', 2), ((2, 0), None, None, 1)]
+
+    Args:
+        partitions (int, optional): Files per table when spilling; at least the expected distinct identities divided by `max_entries` to bound `groups()`. Defaults to `AGGREGATOR_PARTITIONS`.
+        max_entries (int, optional): Keys held in memory. Defaults to `AGGREGATOR_MAX_ENTRIES`.
+        spill_dir (str | Path | None, optional): Where to create the spill directory. Defaults to the system's temporary directory.
+    """  # noqa: E501
+
+    partitions: int = AGGREGATOR_PARTITIONS
+    max_entries: int = AGGREGATOR_MAX_ENTRIES
+    spill_dir: str | Path | None = None
+    documents: int = field(default=0, init=False)
+    _dockets: dict[DocketKey, _DocketPartial] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _reports: dict[ReportKey, _ReportPartial] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _directory: Path | None = field(default=None, init=False, repr=False)
+    _files: dict[tuple[str, int], Path] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __enter__(self) -> "CorpusAggregator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(
+        self, occurrences: Iterable[CitationParts], order: int | None = None
+    ) -> None:
+        """Add the occurrences of one document, in source order.
+
+        Args:
+            occurrences (Iterable[CitationParts]): e.g. `CitableDocument.iter_parts()`
+            order (int | None, optional): The document's position in the corpus, to rank first-seen values; required when aggregators of the same corpus are merged. Defaults to the number of documents added before.
+        """  # noqa: E501
+        order = self.documents if order is None else order
+        self.documents += 1
+        for item in occurrences:
+            first = (order, item.start)
+            reports: list[Evidence] = [
+                (first, value) if value else None
+                for value in (item.phil, item.scra, item.offg)
+            ]
+            partial = _DocketPartial(
+                first, item.category, item.serial, item.docket_date, 1, reports
+            )
+            if docket_key := item.docket_key:
+                self._add_docket(docket_key, partial)
+                for report_key in item.report_keys:
+                    self._add_report(report_key, _ReportPartial((docket_key,)))
+            elif len(report_keys := item.report_keys) == 1:
+                self._add_report(report_keys[0], _ReportPartial(only=partial))
+        if len(self._dockets) + len(self._reports) > self.max_entries:
+            self.spill()
+
+    def _add_docket(self, key: DocketKey, partial: _DocketPartial) -> None:
+        if (found := self._dockets.get(key)) is None:
+            self._dockets[key] = partial
+        else:
+            found.combine(partial, key)
+
+    def _add_report(self, key: ReportKey, partial: _ReportPartial) -> None:
+        if (found := self._reports.get(key)) is None:
+            self._reports[key] = partial
+        else:
+            found.combine(partial, key)
+
+    def merge(self, other: "CorpusAggregator") -> None:
+        """Add the state of `other`, e.g. of another worker process, whose
+        documents were added with a distinct `order` each. The spill files of
+        `other` are moved into this aggregator's directory."""
+        if other.partitions != self.partitions:
+            raise ValueError("Aggregators with different partitions cannot merge.")
+        self.documents += other.documents
+        for key, partial in other._dockets.items():
+            self._add_docket(key, partial)
+        for key, report in other._reports.items():
+            self._add_report(key, report)
+        other._dockets, other._reports = {}, {}
+        for (table, partition), path in other._files.items():
+            self._append(table, partition, _read(path))
+            path.unlink()
+        other._files.clear()
+        if len(self._dockets) + len(self._reports) > self.max_entries:
+            self.spill()
+
+    def spill(self) -> None:
+        """Write the in-memory tables to the partition files and empty them."""
+        for table, items in (("dockets", self._dockets), ("reports", self._reports)):
+            buckets: list[list[tuple]] = [[] for _ in range(self.partitions)]
+            for key, partial in items.items():
+                buckets[_partition(key, self.partitions)].append((key, partial))
+            for partition, bucket in enumerate(buckets):
+                if bucket:
+                    self._append(table, partition, [bucket])
+        self._dockets, self._reports = {}, {}
+
+    def _append(self, table: str, partition: int, chunks: Iterable[list]) -> None:
+        if self._directory is None:
+            self._directory = Path(
+                tempfile.mkdtemp(prefix="citation-utils-", dir=self.spill_dir)
+            )
+        path = self._files.setdefault(
+            (table, partition), self._directory / f"{table}-{partition}.pickle"
+        )
+        with path.open("ab") as file:
+            for chunk in chunks:
+                pickle.dump(chunk, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _load(self, table: str, partition: int) -> dict:
+        if table == "dockets":
+            memory: dict = self._dockets
+        else:
+            memory = self._reports
+        loaded: dict = {}
+        if path := self._files.get((table, partition)):
+            for chunk in _read(path):
+                for key, partial in chunk:
+                    if (found := loaded.get(key)) is None:
+                        loaded[key] = partial
+                    else:
+                        found.combine(partial, key)
+        for key, partial in memory.items():
+            if _partition(key, self.partitions) != partition:
+                continue
+            if (found := loaded.get(key)) is None:
+                # a copy, as `groups()` changes what it loads
+                loaded[key] = replace(partial)
+            else:
+                found.combine(partial, key)
+        return loaded
+
+    def groups(self) -> Iterator[CorpusGroup]:
+        """Resolve the report-only mentions and yield every group once, one
+        partition at a time; within a partition, in first-seen order.
+
+        Reports whose only docket is known are first moved, partition by
+        partition, to the partition of that docket, on disk once more than
+        `max_entries` of them are held; the remaining report-only mentions are
+        yielded as groups without a docket. The aggregator can still take more
+        documents afterwards.
+        """
+        linked: list[list[tuple[DocketKey, _DocketPartial]]] = [
+            [] for _ in range(self.partitions)
+        ]
+        held = 0
+        try:
+            for partition in range(self.partitions):
+                standalone = []
+                for report in self._load("reports", partition).values():
+                    if report.only is None:
+                        continue
+                    if docket_key := linked_docket(report.dockets):
+                        target = _partition(docket_key, self.partitions)
+                        linked[target].append((docket_key, report.only))
+                        held += 1
+                    else:
+                        standalone.append(report.only)
+                if held > self.max_entries:
+                    for target, bucket in enumerate(linked):
+                        if bucket:
+                            self._append("linked", target, [bucket])
+                    linked, held = [[] for _ in range(self.partitions)], 0
+                yield from _to_groups(standalone)
+
+            for partition in range(self.partitions):
+                dockets = self._load("dockets", partition)
+                for docket_key, partial in self._linked(partition, linked[partition]):
+                    dockets[docket_key].enrich(partial, docket_key)
+                linked[partition] = []
+                yield from _to_groups(dockets.values())
+        finally:
+            for partition in range(self.partitions):
+                if path := self._files.pop(("linked", partition), None):
+                    path.unlink(missing_ok=True)
+
+    def _linked(
+        self, partition: int, held: list[tuple[DocketKey, _DocketPartial]]
+    ) -> Iterator[tuple[DocketKey, _DocketPartial]]:
+        if path := self._files.get(("linked", partition)):
+            for chunk in _read(path):
+                yield from chunk
+        yield from held
+
+    def close(self) -> None:
+        """Delete the spill files."""
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+        self._directory = None
+        self._files.clear()
+
+
+def _read(path: Path) -> Iterator[list]:
+    with path.open("rb") as file:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
+
+def _to_groups(partials: Iterable[_DocketPartial]) -> list[CorpusGroup]:
+    groups = []
+    for partial in sorted(partials, key=lambda partial: partial.first):
+        phil, scra, offg = (item and item[1] for item in partial.reports)
+        parts = CitationParts(
+            partial.category,
+            partial.serial,
+            partial.docket_date,
+            phil,
+            scra,
+            offg,
+            start=partial.first[1],
+        )
+        groups.append(CorpusGroup(parts, partial.mentions, partial.first))
+    return groups
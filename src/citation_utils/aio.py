@@ -0,0 +1,141 @@
+"""Extraction from `asyncio` code without blocking the event loop.
+
+Extraction is CPU-bound, so the coroutines here run it in an executor: by
+default a thread pool that is created on first use and that `set_executor()`
+can replace. Cancelling the awaiting task also stops the extraction in its
+worker thread at the next regex call of the docket stages, rather than let it
+run to the end; report references are found in a single pass that runs to its
+end.
+
+Examples:
+    >>> import asyncio
+    >>> from citation_utils import Citation
+    >>> asyncio.run(Citation.aextract_citations("G.R. No. 1, Jan. 1, 2000; 100 SCRA 1"))
+    [<Citation: GR No. 1, Jan. 01, 2000>, <Citation: 100 SCRA 1>]
+"""  # noqa: E501
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TypeVar
+
+from .document import AIO_BATCH_SIZE, CitableDocument
+from .identity import CitationOccurrence
+from .profiling import StageProfiler
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_is_default = False
+_executor_lock = threading.Lock()
+
+
+class ExtractionCancelled(Exception):
+    """Raised in a worker thread to stop the extraction of a cancelled task."""
+
+
+@dataclass
+class _Cancellation(StageProfiler):
+    """A `StageProfiler` that raises `ExtractionCancelled` after any stage once
+    `event` is set, and passes each stage on to the document's own profiler."""
+
+    event: threading.Event = field(default_factory=threading.Event)
+    inner: StageProfiler | None = None
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        if self.inner:
+            self.inner.add(stage, seconds, calls)
+        if self.event.is_set():
+            raise ExtractionCancelled(stage)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """The thread pool of the coroutines here, created on first use unless
+    replaced with `set_executor()`."""
+    global _executor, _executor_is_default
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="citation-utils")
+            _executor_is_default = True
+        return _executor
+
+
+def set_executor(executor: ThreadPoolExecutor | None) -> None:
+    """Use `executor`, e.g. one sized for the web server, or `None` to create a
+    default thread pool on next use. A replaced default pool is shut down;
+    an executor passed in is left to its owner.
+
+    Only a thread pool can run the extraction, since a cancelled task stops it
+    through an `Event` shared with the worker thread; other executors raise
+    `TypeError`."""
+    global _executor, _executor_is_default
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise TypeError(f"Expected a ThreadPoolExecutor, got {executor!r}")
+    with _executor_lock:
+        previous, is_default = _executor, _executor_is_default
+        _executor, _executor_is_default = executor, False
+    if previous is not None and is_default:
+        previous.shutdown(wait=False)
+
+
+async def run_cancellable(
+    func: Callable[[_Cancellation], T],
+    executor: ThreadPoolExecutor | None = None,
+    cancellation: _Cancellation | None = None,
+) -> T:
+    """Await `func(cancellation)` in `executor`; if the awaiting task is
+    cancelled, `cancellation` stops `func` at the next stage it records."""
+    cancellation = cancellation or _Cancellation()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor or get_executor(), func, cancellation)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        cancellation.event.set()
+        raise
+
+
+async def aiter_occurrences(
+    document: CitableDocument,
+    batch_size: int = AIO_BATCH_SIZE,
+    executor: ThreadPoolExecutor | None = None,
+) -> AsyncIterator[CitationOccurrence]:
+    """Yield `document.iter_occurrences()`, producing `batch_size` of them at a time
+    in `executor` and returning control to the event loop between batches; see
+    `CitableDocument.aiter_occurrences()`.
+
+    Only the output is batched: the first batch finds every docket and report
+    of the document, and the later ones build occurrences from what it found.
+    The first item thus waits for the whole detection, which cancelling the
+    task stops at its next docket regex call.
+
+    Examples:
+        >>> async def main(text):
+        ...     document = CitableDocument(text)
+        ...     return [item.raw_text async for item in aiter_occurrences(document, batch_size=1)]
+        >>> asyncio.run(main("G.R. No. 1, Jan. 1, 2000; 100 SCRA 1"))
+        ['G.R. No. 1, Jan. 1, 2000', '100 SCRA 1']
+
+    Args:
+        document (CitableDocument): A document that is not in use elsewhere until the iteration ends
+        batch_size (int, optional): Occurrences per executor call. Defaults to `AIO_BATCH_SIZE`.
+        executor (ThreadPoolExecutor | None, optional): Defaults to `get_executor()`.
+
+    Yields:
+        AsyncIterator[CitationOccurrence]: Occurrences in source order
+    """  # noqa: E501
+    cancellation = _Cancellation(inner=document.profiler)
+    document.profiler = cancellation
+    occurrences = document.iter_occurrences()
+    try:
+        while batch := await run_cancellable(
+            lambda _: list(islice(occurrences, batch_size)), executor, cancellation
+        ):
+            for item in batch:
+                yield item
+            await asyncio.sleep(0)
+    finally:
+        document.profiler = cancellation.inner
@@ -0,0 +1,58 @@
+"""A time or step budget for the docket stages of a `CitableDocument`.
+
+A single regex call cannot be interrupted, so `DocketScanner.detect()` spends
+the budget between calls and stops once it is gone. The document keeps the
+dockets found before the position reached; see `CitableDocument.reached`.
+"""
+
+from dataclasses import dataclass, field
+from time import perf_counter
+
+
+class BudgetExceeded(Exception):
+    """Raised from `ExtractionBudget.spend()` to stop the docket stages after
+    `stage`: every docket that starts before `position` has been found."""
+
+    def __init__(self, stage: str, position: int = 0):
+        super().__init__(f"Extraction budget spent in {stage}")
+        self.stage = stage
+        self.position = position
+
+
+@dataclass
+class ExtractionBudget:
+    """Stops the docket stages of `CitableDocument(text, budget=...)` once more
+    than `limit_seconds` have passed since its creation, or more than
+    `limit_steps` regex calls were made by them. Either limit may be `None`.
+
+    Examples:
+        >>> from citation_utils import CitableDocument
+        >>> text = "G.R. No. 1, Jan. 1, 2000; G.R. No. 2, Jan. 1, 2000"
+        >>> budget = ExtractionBudget(limit_steps=4)
+        >>> document = CitableDocument(text, budget=budget)
+        >>> [item.raw_text for item in document.iter_occurrences()]
+        ['G.R. No. 1, Jan. 1, 2000']
+        >>> budget.stage, document.reached
+        ('dockets.search', 26)
+    """
+
+    limit_seconds: float | None = None
+    limit_steps: int | None = None
+    steps: int = 0
+    stage: str | None = None
+    """The stage in which the budget was spent, if it was."""
+    started: float = field(default_factory=perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self.started
+
+    def spend(self, stage: str, position: int) -> None:
+        """Count a regex call of `stage`, made with every docket before
+        `position` found, and raise `BudgetExceeded` if that was one too many."""
+        self.steps += 1
+        if (self.limit_steps is not None and self.steps > self.limit_steps) or (
+            self.limit_seconds is not None and self.elapsed > self.limit_seconds
+        ):
+            self.stage = stage
+            raise BudgetExceeded(stage, position)
@@ -1,8 +1,12 @@
 import datetime
 import logging
+import os
 import re
-from collections.abc import Iterator
-from typing import Self
+import sys
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, Self
 
 from citation_date import DOCKET_DATE_FORMAT
 from citation_report import Report
@@ -11,14 +15,240 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    PrivateAttr,
     field_serializer,
     field_validator,
     model_serializer,
 )
 
-from .dockets import Docket, DocketCategory
+from .dockets import Docket, DocketCategory, docket_scanner
 from .document import CitableDocument
-from .identity import CitationParts, aggregate_occurrences, display_report
+from .identity import (
+    CitationGroup,
+    CitationParts,
+    aggregate_occurrences,
+    display_report,
+    report_display_form,
+)
+from .profiling import StageProfiler
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, ThreadPoolExecutor
+
+WARM_UP_TEXT = "; ".join(
+    [
+        "G.R. No. 1, Jan. 1, 2000, 1 SCRA 1",
+        "A.M. No. P-13-3116, Jan. 1, 2000, 1 Phil. 1",
+        "A.C. No. 10179, Jan. 1, 2000, 1 O.G. 1",
+        "B.M. No. 1678, Jan. 1, 2000",
+        "OCA IPI No. 10-3450-P, Jan. 1, 2000",
+        "P.E.T. Case No. 001, Jan. 1, 2000",
+        "UDK 16915, Jan. 1, 2000",
+        "JIB FPI No. 21-018-MTJ, Jan. 1, 2000",
+    ]
+)
+"""Touches every docket style so that a worker process compiles all patterns."""
+
+PRELOAD_MODULE = "citation_utils.preload"
+FORK_SERVER_PRELOAD = ["__main__", PRELOAD_MODULE]
+"""Modules the fork server imports before it forks any worker."""
+BATCH_PREFETCH = 2
+"""Chunks of documents queued per worker of `map_sources()`, besides the chunk it
+runs; the rest of the sources are read only as results are taken."""
+
+PartsRow = tuple[
+    DocketCategory | None,
+    str | None,
+    datetime.date | None,
+    str | None,
+    str | None,
+    str | None,
+    int,
+]
+"""Picklable `CitationParts` fields and mentions of one aggregated citation."""
+
+
+def warm_up() -> None:
+    """Compile the docket and report patterns of the current process."""
+    list(CitableDocument(WARM_UP_TEXT).iter_occurrences())
+
+
+def extract_source_parts(source: tuple[Any, str]) -> tuple[Any, list[PartsRow]]:
+    """Aggregate the citations of a `(document id, text)` pair into rows."""
+    key, text = source
+    return key, [
+        (
+            group.parts.category,
+            group.parts.serial,
+            group.parts.docket_date,
+            group.parts.phil,
+            group.parts.scra,
+            group.parts.offg,
+            group.mentions,
+        )
+        for group in aggregate_occurrences(CitableDocument(text=text).iter_parts())
+    ]
+
+
+def extract_chunk_parts(
+    chunk: list[tuple[Any, str]],
+) -> list[tuple[Any, list[PartsRow]]]:
+    """`extract_source_parts()` of each pair of a chunk."""
+    return [extract_source_parts(source) for source in chunk]
+
+
+def map_chunks(
+    executor: "Executor",
+    func: Callable[[list[Any]], list[Any]],
+    items: Iterable[Any],
+    chunksize: int,
+    pending_limit: int,
+) -> Iterator[Any]:
+    """Yield `func()` of the chunks of `items` in input order, submitting a chunk
+    only while fewer than `pending_limit` are pending, unlike `Executor.map()`,
+    which reads all of `items` up front. Pending chunks are cancelled if the
+    iteration stops early."""
+    iterator = iter(items)
+    pending: deque = deque()
+    try:
+        while chunk := list(islice(iterator, chunksize)):
+            if len(pending) >= pending_limit:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(func, chunk))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def warm_up_forked() -> None:
+    """`warm_up()` a worker of the `fork` backend, unless its fork server has
+    imported `PRELOAD_MODULE` already, as a worker forked from it then shows.
+
+    The server is one per process and imports its preload once, when it
+    starts. If another pool started it first, e.g. a `process` pool where
+    `forkserver` is the default start method, a warning is logged and each
+    worker compiles the patterns itself."""
+    if PRELOAD_MODULE in sys.modules:
+        return
+    logging.warning(
+        "The fork server of this process was started without %s; "
+        "each worker compiles the patterns itself",
+        PRELOAD_MODULE,
+    )
+    warm_up()
+
+
+BatchBackend = Literal["process", "fork", "thread"]
+"""How the batch methods spread documents over `workers`:
+
+Backend | Workers | Results
+:--|:--|:--
+`process` | processes, each warmed up once | pickled back to the calling process
+`fork` | processes forked from a server that compiled the patterns once | pickled back to the calling process
+`thread` | threads sharing the patterns, compiled up front | returned as they are
+
+A `fork` worker starts with the modules and patterns of the fork server,
+shared copy-on-write, so it adds less memory per core than a `process`
+worker; it is available where the `forkserver` start method is, i.e. not on
+Windows. The fork server is shared by every pool of the process and imports
+its modules once, when it starts; see `warm_up_forked()`. Threads run in parallel only on a free-threaded build of Python, e.g.
+`python3.14t`; with the GIL enabled they take turns.
+"""  # noqa: E501
+
+
+def map_sources(
+    sources: Iterable[tuple[Any, str]],
+    workers: int | None = None,
+    chunksize: int = 1,
+    backend: BatchBackend = "process",
+) -> Iterator[tuple[Any, list[PartsRow]]]:
+    """Run `extract_source_parts()` over `sources` in input order, using a pool of
+    `workers` processes (each warmed up once) or threads, unless `workers` is 1.
+    Sources are read `chunksize` at a time as workers become free, see
+    `BATCH_PREFETCH`, so a generator over a large corpus is never read whole."""
+    if backend not in ("process", "fork", "thread"):
+        raise ValueError(f"Unknown batch backend {backend!r}")
+    if workers == 1:
+        yield from map(extract_source_parts, sources)
+        return
+    workers = workers or os.cpu_count() or 1
+    pending_limit = workers * (1 + BATCH_PREFETCH)
+    if backend == "thread":
+        from concurrent.futures import ThreadPoolExecutor
+
+        warm_up()
+        docket_scanner.precompile()
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="citation-utils"
+        ) as executor:
+            yield from map_chunks(
+                executor, extract_chunk_parts, sources, chunksize, pending_limit
+            )
+        return
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context, initializer = None, warm_up
+    if backend == "fork":
+        context, initializer = multiprocessing.get_context("forkserver"), warm_up_forked
+        context.set_forkserver_preload(FORK_SERVER_PRELOAD)
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=initializer
+    ) as executor:
+        yield from map_chunks(
+            executor, extract_chunk_parts, sources, chunksize, pending_limit
+        )
+
+
+def dump_parts(
+    parts: CitationParts,
+) -> tuple[str | None, str | None, str | None, str | None, str | None, str | None]:
+    """The `cat`, `num`, `date`, `phil`, `scra` and `offg` values that
+    `Citation.model_dump()` would give for `parts`, without the model."""
+    category, serial = parts.category, parts.serial and parts.serial.strip()
+    return (
+        category.name.lower() if category else None,
+        Docket.clean_serial(serial, category) if serial else None,
+        parts.docket_date.isoformat() if parts.docket_date else None,
+        *(
+            value.strip().lower() or None if value else None
+            for value in (parts.phil, parts.scra, parts.offg)
+        ),
+    )
+
+
+class CitationRecord(NamedTuple):
+    """A `Citation.model_dump()` as a named tuple; see `Citation.extract_rows()`."""
+
+    cat: str | None
+    num: str | None
+    date: str | None
+    phil: str | None
+    scra: str | None
+    offg: str | None
+
+    @classmethod
+    def from_parts(cls, parts: CitationParts) -> Self:
+        return cls(*dump_parts(parts))
+
+
+class CountedCitationRecord(NamedTuple):
+    """A `CountedCitation.model_dump()` as a named tuple; see
+    `CountedCitation.extract_rows()`."""
+
+    cat: str | None
+    num: str | None
+    date: str | None
+    phil: str | None
+    scra: str | None
+    offg: str | None
+    mentions: int
+
+    @classmethod
+    def from_group(cls, group: CitationGroup) -> Self:
+        return cls(*dump_parts(group.parts), group.mentions)
 
 
 class Citation(BaseModel):
@@ -60,6 +290,11 @@ class Citation(BaseModel):
     phil: str | None = Field(default=None)
     scra: str | None = Field(default=None)
     offg: str | None = Field(default=None)
+    _displayed: tuple[str | None, str | None, str | None] | None = PrivateAttr(
+        default=None
+    )
+    """The `phil`, `scra` and `offg` values when they were set from parts whose
+    reports are in display form, so that `__str__()` need not parse them."""
 
     @field_validator("docket_category", mode="before")
     @classmethod
@@ -74,15 +309,14 @@ class Citation(BaseModel):
 
     def __str__(self) -> str:
         docket_str = self.get_docket_display()
-        report_str = ", ".join(
-            value
-            for value in (
+        reports = (self.phil, self.scra, self.offg)
+        if reports != self._displayed:
+            reports = (
                 display_report(self.phil, "phil"),
                 display_report(self.scra, "scra"),
                 display_report(self.offg, "offg"),
             )
-            if value
-        )
+        report_str = ", ".join(value for value in reports if value)
         if docket_str and report_str:
             return f"{docket_str}, {report_str}"
         elif docket_str:
@@ -299,7 +533,7 @@ class Citation(BaseModel):
 
     @classmethod
     def _from_parts(cls, parts: CitationParts, **extra):
-        return cls(
+        citation = cls(
             cat=parts.category,
             num=parts.serial,
             date=parts.docket_date,
@@ -308,6 +542,9 @@ class Citation(BaseModel):
             offg=parts.offg,
             **extra,
         )
+        if parts.displayed:
+            citation._displayed = (citation.phil, citation.scra, citation.offg)
+        return citation
 
     @classmethod
     def extract_citations(cls, text: str) -> Iterator[Self]:
@@ -333,6 +570,87 @@ class Citation(BaseModel):
         for group in aggregate_occurrences(document.iter_parts()):
             yield cls._from_parts(group.parts)
 
+    @classmethod
+    async def aextract_citations(
+        cls, text: str, executor: "ThreadPoolExecutor | None" = None
+    ) -> list[Self]:
+        """`extract_citations()` for async code: the extraction runs in `executor`,
+        by default the managed pool of `citation_utils.aio`, so that the event
+        loop keeps serving other requests. Cancelling the awaiting task also
+        stops the extraction.
+
+        Examples:
+            >>> import asyncio
+            >>> asyncio.run(Citation.aextract_citations("31 SCRA 562"))
+            [<Citation: 31 SCRA 562>]
+        """
+        from .aio import run_cancellable
+
+        def extract(profiler: StageProfiler) -> list[Self]:
+            document = CitableDocument(text, profiler=profiler)
+            groups = aggregate_occurrences(document.iter_parts(), profiler=profiler)
+            return [cls._from_parts(group.parts) for group in groups]
+
+        return await run_cancellable(extract, executor)
+
+    @classmethod
+    def extract_rows(cls, text: str) -> Iterator[CitationRecord]:
+        """Like `extract_citations()` but yields each citation's `model_dump()`
+        values as a `CitationRecord`, without constructing any pydantic model.
+
+        Examples:
+            >>> text = "G.R. No. 147033, April 30, 2003, 374 Phil. 1; 31 SCRA 562"
+            >>> rows = list(Citation.extract_rows(text))
+            >>> rows[0]
+            CitationRecord(cat='gr', num='147033', date='2003-04-30', phil='374 phil. 1', scra=None, offg=None)
+            >>> [row._asdict() for row in rows] == [c.model_dump() for c in Citation.extract_citations(text)]
+            True
+
+        Args:
+            text (str): Text to evaluate
+
+        Yields:
+            Iterator[CitationRecord]: Rows in first-seen source order
+        """  # noqa: E501
+        for group in aggregate_occurrences(CitableDocument(text=text).iter_parts()):
+            yield CitationRecord.from_parts(group.parts)
+
+    @classmethod
+    def extract_citations_many(
+        cls,
+        texts: Iterable[tuple[Hashable, str]],
+        workers: int | None = None,
+        chunksize: int = 1,
+        backend: BatchBackend = "process",
+    ) -> Iterator[tuple[Hashable, list[Self]]]:
+        """Apply `extract_citations()` to many `(document id, text)` pairs in a pool
+        of processes or threads. Each worker process compiles the patterns once;
+        only plain rows are sent back and the models are built in the calling
+        process. Threads share patterns compiled before they start.
+
+        Examples:
+            >>> texts = [("a", "G.R. No. 1, Jan. 1, 2000"), ("b", "Hello World"), ("c", "12 Phil. 24")]
+            >>> dict(Citation.extract_citations_many(texts, workers=1))
+            {'a': [<Citation: GR No. 1, Jan. 01, 2000>], 'b': [], 'c': [<Citation: 12 Phil. 24>]}
+
+        Args:
+            texts (Iterable[tuple[Hashable, str]]): Pairs of a caller's document id and its text
+            workers (int | None, optional): Number of processes or threads; `1` runs in the current thread. Defaults to None, i.e. one per CPU.
+            chunksize (int, optional): Documents sent to a worker at a time. Defaults to 1.
+            backend (BatchBackend, optional): `process`, `fork` or `thread`; see `BatchBackend`. Defaults to "process".
+
+        Yields:
+            Iterator[tuple[Hashable, list[Self]]]: Each document id and its citations, in the order of `texts`.
+        """  # noqa: E501
+        for key, rows in map_sources(texts, workers, chunksize, backend):
+            yield key, [cls._from_row(row) for row in rows]
+
+    @classmethod
+    def _from_row(cls, row: PartsRow, **extra):
+        *fields, _ = row
+        # rows come from `CitableDocument.iter_parts()` in `extract_source_parts()`
+        return cls._from_parts(CitationParts(*fields, displayed=True), **extra)
+
     @classmethod
     def extract_citation(cls, text: str) -> Self | None:
         """Thin wrapper over `cls.extract_citations()`.
@@ -413,14 +731,7 @@ class Citation(BaseModel):
         for field, raw in (("phil", phil), ("scra", scra), ("offg", offg)):
             if not raw:
                 continue
-            report = next(Report.extract_reports(raw), None)
-            value = (
-                report.qualified_offg
-                if field == "offg" and report
-                else getattr(report, field, None)
-                if report
-                else None
-            )
+            value = report_display_form(raw, field)
             if not value:
                 raise ValueError(f"Invalid {field} report: {raw!r}")
             if field == "scra":
@@ -475,6 +786,52 @@ class CountedCitation(Citation):
             for group in aggregate_occurrences(document.iter_parts())
         ]
 
+    @classmethod
+    def extract_rows(cls, text: str) -> Iterator[CountedCitationRecord]:  # type: ignore[override]
+        """Like `from_source()` but yields each citation's `model_dump()` values as
+        a `CountedCitationRecord`, without constructing any pydantic model.
+
+        Examples:
+            >>> list(CountedCitation.extract_rows("100 SCRA 1; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1"))
+            [CountedCitationRecord(cat='gr', num='1', date='2000-01-01', phil=None, scra='100 scra 1', offg=None, mentions=2)]
+
+        Args:
+            text (str): Text to evaluate
+
+        Yields:
+            Iterator[CountedCitationRecord]: Rows in first-seen source order
+        """  # noqa: E501
+        for group in aggregate_occurrences(CitableDocument(text=text).iter_parts()):
+            yield CountedCitationRecord.from_group(group)
+
+    @classmethod
+    def from_sources(
+        cls,
+        texts: Iterable[tuple[Hashable, str]],
+        workers: int | None = None,
+        chunksize: int = 1,
+        backend: BatchBackend = "process",
+    ) -> Iterator[tuple[Hashable, list[Self]]]:
+        """Apply `from_source()` to many `(document id, text)` pairs in a pool of
+        processes or threads; see `Citation.extract_citations_many()`.
+
+        Examples:
+            >>> texts = [(1, "100 SCRA 1; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1"), (2, "")]
+            >>> dict(CountedCitation.from_sources(texts, workers=1))
+            {1: [GR No. 1, Jan. 01, 2000, 100 SCRA 1: 2], 2: []}
+
+        Args:
+            texts (Iterable[tuple[Hashable, str]]): Pairs of a caller's document id and its text
+            workers (int | None, optional): Number of processes or threads; `1` runs in the current thread. Defaults to None, i.e. one per CPU.
+            chunksize (int, optional): Documents sent to a worker at a time. Defaults to 1.
+            backend (BatchBackend, optional): `process`, `fork` or `thread`; see `BatchBackend`. Defaults to "process".
+
+        Yields:
+            Iterator[tuple[Hashable, list[Self]]]: Each document id and its counted citations, in the order of `texts`.
+        """  # noqa: E501
+        for key, rows in map_sources(texts, workers, chunksize, backend):
+            yield key, [cls._from_row(row, mentions=row[-1]) for row in rows]
+
     @classmethod
     def from_repr_format(cls, repr_texts: list[str]) -> Iterator[Self]:
         """Generate their pydantic counterparts from `<cat> <id>: <mentions>` format.
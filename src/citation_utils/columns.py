@@ -0,0 +1,251 @@
+"""Occurrences as column arrays for data frame libraries.
+
+`OccurrenceColumns` holds one `array` or list per field, so that occurrences
+load into Polars or Arrow without a dict per row:
+
+Column | Type | Values
+:--|:--|:--
+`document` | `array("q")` | index into `documents`
+`start`, `end` | `array("q")` | character offsets
+`category` | `array("b")` | index into `CATEGORY_NAMES`, or `NO_CATEGORY`
+`serial` | `list[str \\| None]` | the serial as found
+`date` | `array("i")` | days since 1970-01-01, Arrow's `date32`, or `NO_DATE`
+`phil`, `scra`, `offg` | `list[str \\| None]` | interned report strings
+
+Equal strings share one object, so a report cited across a corpus is stored
+once. The arrays support the buffer protocol, e.g. `numpy.frombuffer()`.
+
+`OccurrenceTable` keeps the occurrences of a corpus in memory in the same
+encoding, with every string replaced by an id, and gives `CitationOccurrence`
+records back only when read.
+"""
+
+from array import array
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+from typing import overload
+
+from .dockets import DocketCategory
+from .identity import CitationOccurrence
+
+CATEGORY_NAMES = tuple(category.name for category in DocketCategory)
+"""The dictionary of the `category` codes."""
+NO_CATEGORY = -1
+NO_DATE = -(2**31)
+"""The smallest `int32`, as Arrow's `date32` never holds it for a real date."""
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_CATEGORIES = tuple(DocketCategory)
+_CATEGORY_CODES = {category: code for code, category in enumerate(_CATEGORIES)}
+
+
+def _category_code(category: DocketCategory | None) -> int:
+    return _CATEGORY_CODES[category] if category else NO_CATEGORY
+
+
+def _days(value: date | None) -> int:
+    return value.toordinal() - EPOCH_ORDINAL if value else NO_DATE
+
+
+@dataclass
+class OccurrenceColumns:
+    """`CitationOccurrence` fields of one or more documents as columns.
+
+    Examples:
+        >>> from citation_utils import CitableDocument
+        >>> columns = OccurrenceColumns()
+        >>> columns.extend(CitableDocument("G.R. No. 1, Jan. 2, 1970, 1 SCRA 1; 1 SCRA 1").iter_occurrences(), "a")
+        >>> columns.start, columns.category, columns.date
+        (array('q', [0, 36]), array('b', [0, -1]), array('i', [1, -2147483648]))
+        >>> columns.scra[0] is columns.scra[1]
+        True
+        >>> columns.documents, len(columns)
+        (['a'], 2)
+    """  # noqa: E501
+
+    document: array = field(default_factory=lambda: array("q"))
+    start: array = field(default_factory=lambda: array("q"))
+    end: array = field(default_factory=lambda: array("q"))
+    category: array = field(default_factory=lambda: array("b"))
+    serial: list[str | None] = field(default_factory=list)
+    date: array = field(default_factory=lambda: array("i"))
+    phil: list[str | None] = field(default_factory=list)
+    scra: list[str | None] = field(default_factory=list)
+    offg: list[str | None] = field(default_factory=list)
+    documents: list[Hashable] = field(default_factory=list)
+    _strings: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def _intern(self, value: str | None) -> str | None:
+        return value if value is None else self._strings.setdefault(value, value)
+
+    def extend(
+        self, occurrences: Iterable[CitationOccurrence], document: Hashable = None
+    ) -> None:
+        """Append the `occurrences` of `document`, an id kept in `documents`."""
+        index = len(self.documents)
+        self.documents.append(document)
+        for item in occurrences:
+            self.document.append(index)
+            self.start.append(item.start)
+            self.end.append(item.end)
+            self.category.append(_category_code(item.category))
+            self.serial.append(self._intern(item.serial))
+            self.date.append(_days(item.docket_date))
+            self.phil.append(self._intern(item.phil))
+            self.scra.append(self._intern(item.scra))
+            self.offg.append(self._intern(item.offg))
+
+    def to_dict(self) -> dict[str, array | list]:
+        """The columns by name, e.g. for `polars.DataFrame()`."""
+        return {
+            name: getattr(self, name)
+            for name in (
+                "document",
+                "start",
+                "end",
+                "category",
+                "serial",
+                "date",
+                "phil",
+                "scra",
+                "offg",
+            )
+        }
+
+
+@dataclass
+class OccurrenceTable:
+    """Occurrences of many documents kept as ids in `array` columns, rather than
+    as `CitationOccurrence` records.
+
+    A record holds a date and up to five strings, its `raw_text` included; a
+    row here is a few dozen bytes of integers. Raw texts, serials and reports
+    are ids into `strings`, in which each distinct value is stored once, so a
+    citation repeated across a corpus costs one string. The texts of the
+    documents are not kept.
+
+    Column | Values
+    :--|:--
+    `document` | index into `documents`
+    `start`, `end` | character offsets into the text
+    `category` | index into `CATEGORY_NAMES`, or `NO_CATEGORY`
+    `date` | days since 1970-01-01, or `NO_DATE`
+    `raw`, `serial`, `phil`, `scra`, `offg` | index into `strings`, or `-1`
+
+    The encoding of `document`, `category` and `date` is that of
+    `OccurrenceColumns`.
+
+    Examples:
+        >>> table = OccurrenceTable.from_sources([("a", "G.R. No. 1, Jan. 1, 2000, 1 SCRA 1"), ("b", "1 SCRA 1")])
+        >>> len(table), table.strings
+        (2, ['G.R. No. 1, Jan. 1, 2000, 1 SCRA 1', '1', '1 SCRA 1'])
+        >>> table[1]
+        CitationOccurrence(raw_text='1 SCRA 1', start=0, end=8, category=None, serial=None, docket_date=None, phil=None, scra='1 SCRA 1', offg=None)
+        >>> [item.category for item in table.iter_document("a")]
+        ['GR']
+    """  # noqa: E501
+
+    documents: list[Hashable] = field(default_factory=list)
+    document: array = field(default_factory=lambda: array("q"), repr=False)
+    start: array = field(default_factory=lambda: array("q"), repr=False)
+    end: array = field(default_factory=lambda: array("q"), repr=False)
+    category: array = field(default_factory=lambda: array("b"), repr=False)
+    date: array = field(default_factory=lambda: array("i"), repr=False)
+    raw: array = field(default_factory=lambda: array("i"), repr=False)
+    serial: array = field(default_factory=lambda: array("i"), repr=False)
+    phil: array = field(default_factory=lambda: array("i"), repr=False)
+    scra: array = field(default_factory=lambda: array("i"), repr=False)
+    offg: array = field(default_factory=lambda: array("i"), repr=False)
+    strings: list[str] = field(default_factory=list, repr=False)
+    _string_ids: dict[str, int] = field(default_factory=dict, repr=False)
+    _indexes: dict[Hashable, int] = field(default_factory=dict, repr=False)
+    _rows: list[int] = field(default_factory=lambda: [0], repr=False)
+
+    @classmethod
+    def from_sources(
+        cls, sources: Iterable[tuple[Hashable, str]], window: int | None = None
+    ) -> "OccurrenceTable":
+        """A table of the occurrences of each `(document id, text)` pair."""
+        table = cls()
+        for document_id, text in sources:
+            table.add(document_id, text, window)
+        return table
+
+    def add(self, document: Hashable, text: str, window: int | None = None) -> None:
+        """Find and append the occurrences of `text`."""
+        from .document import CitableDocument
+
+        self.extend(CitableDocument(text, window=window).iter_occurrences(), document)
+
+    def extend(
+        self, occurrences: Iterable[CitationOccurrence], document: Hashable = None
+    ) -> None:
+        """Append the `occurrences` of `document`, an id kept in `documents`."""
+        index = len(self.documents)
+        self.documents.append(document)
+        self._indexes.setdefault(document, index)
+        for item in occurrences:
+            self.document.append(index)
+            self.start.append(item.start)
+            self.end.append(item.end)
+            self.category.append(_category_code(item.category))
+            self.date.append(_days(item.docket_date))
+            self.raw.append(self._string_id(item.raw_text))
+            self.serial.append(self._string_id(item.serial))
+            self.phil.append(self._string_id(item.phil))
+            self.scra.append(self._string_id(item.scra))
+            self.offg.append(self._string_id(item.offg))
+        self._rows.append(len(self.start))
+
+    def _string_id(self, value: str | None) -> int:
+        if value is None:
+            return -1
+        if (found := self._string_ids.get(value)) is None:
+            found = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return found
+
+    def _string(self, value: int) -> str | None:
+        return None if value < 0 else self.strings[value]
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @overload
+    def __getitem__(self, row: int) -> CitationOccurrence: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> list[CitationOccurrence]: ...
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[index] for index in range(*row.indices(len(self)))]
+        code, days = self.category[row], self.date[row]
+        return CitationOccurrence(
+            raw_text=self.strings[self.raw[row]],
+            start=self.start[row],
+            end=self.end[row],
+            category=_CATEGORIES[code] if code != NO_CATEGORY else None,
+            serial=self._string(self.serial[row]),
+            docket_date=date.fromordinal(days + EPOCH_ORDINAL)
+            if days != NO_DATE
+            else None,
+            phil=self._string(self.phil[row]),
+            scra=self._string(self.scra[row]),
+            offg=self._string(self.offg[row]),
+        )
+
+    def __iter__(self) -> Iterator[CitationOccurrence]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def iter_document(self, document: Hashable) -> Iterator[CitationOccurrence]:
+        """The occurrences of the first document with id `document`."""
+        if (index := self._indexes.get(document)) is None:
+            raise ValueError(f"{document!r} is not in the table")
+        for row in range(self._rows[index], self._rows[index + 1]):
+            yield self[row]
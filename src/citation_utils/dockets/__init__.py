@@ -49,17 +49,24 @@ from .constructed_udk import (
 )
 from .models import (
     DOCKET_DATE_FORMAT,
+    DOCKET_DATE_PATTERN,
+    SERIAL_CACHE_SIZE,
     CitationConstructor,
     Docket,
     DocketCategory,
+    DocketDates,
     DocketReportCitation,
     Num,
+    configure_serial_cache,
     cull_extra,
     formerly,
     gr_prefix_clean,
     is_statutory_rule,
+    is_statutory_serial,
     pp,
+    serial_cache_info,
 )
+from .scanner import DocketScanner, docket_scanner
 
 DocketReport = (
     CitationAC
@@ -119,6 +119,7 @@ constructed_ac = CitationConstructor(
     docket_regex=ac_phrases,
     key_regex=ac_key,
     num_regex=Num.AC.allowed,
+    initials="a",
 )
 
 
@@ -145,6 +145,7 @@ constructed_am = CitationConstructor(
     docket_regex=am_phrases,
     key_regex=am_key,
     num_regex=Num.AM.allowed,
+    initials="a",
 )
 
 
@@ -102,6 +102,7 @@ constructed_bm = CitationConstructor(
     docket_regex=bm_phrases,
     key_regex=bm_key,
     num_regex=Num.BM.allowed,
+    initials="b",
 )
 
 
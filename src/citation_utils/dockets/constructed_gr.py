@@ -122,12 +122,18 @@ constructed_gr = CitationConstructor(
     docket_regex=gr_phrases,
     key_regex=gr_key,
     num_regex=Num.GR.allowed,
+    initials="gil,",  # G.R., L- or I-, and ", Nos."
 )
 
 
 class CitationGR(DocketReportCitation):
     ...
 
+    @classmethod
+    def names_category(cls, result: dict) -> bool:
+        """An `L-` or `, Nos.` serial only implies the General Register."""
+        return result["context"].lstrip().casefold().startswith("g")
+
     @classmethod
     def search(cls, text: str) -> Iterator[Self]:
         """Get all dockets matching the `GR` docket pattern, inclusive of their optional Report object.
@@ -145,5 +151,6 @@ class CitationGR(DocketReportCitation):
             Iterator[Self]: Combination of Docket and Report pydantic model.
         """  # noqa E501
         for result in constructed_gr.detect_with_spans(text):
-            explicit = result["context"].lstrip().casefold().startswith("g")
-            yield cls.from_detected(result, explicit_category=explicit)
+            yield cls.from_detected(
+                result, explicit_category=cls.names_category(result)
+            )
@@ -68,6 +68,7 @@ constructed_jib = CitationConstructor(
     docket_regex=jib_phrases,
     key_regex=jib_key,
     num_regex=NUMBER_KEYWORD,
+    initials="j",
 )
 
 
@@ -70,6 +70,7 @@ constructed_oca = CitationConstructor(
     docket_regex=oca_phrases,
     key_regex=oca_key,
     num_regex=NUMBER_KEYWORD,
+    initials="ao",  # A.M. OCA, OCA
 )
 
 
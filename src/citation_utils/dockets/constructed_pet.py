@@ -44,6 +44,7 @@ constructed_pet = CitationConstructor(
     docket_regex=pet_phrases,
     key_regex=pet_key,
     num_regex=NUMBER_KEYWORD,
+    initials="p",
 )
 
 
@@ -50,6 +50,7 @@ constructed_udk = CitationConstructor(
     docket_regex=udk_phrases,
     key_regex=udk_key,
     num_regex=NUMBER_KEYWORD,
+    initials="u",
 )
 
 
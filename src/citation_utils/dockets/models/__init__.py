@@ -1,8 +1,16 @@
-from .constructor import CitationConstructor
+from .constructor import DOCKET_TAIL_REGEX, CitationConstructor
 from .docket_category import DocketCategory
 from .docket_citation import DocketReportCitation
-from .docket_model import DB_SERIAL_NUM, DOCKET_DATE_FORMAT, Docket
-from .docket_rules import is_statutory_rule
+from .docket_dates import DOCKET_DATE_PATTERN, DocketDates
+from .docket_model import (
+    DB_SERIAL_NUM,
+    DOCKET_DATE_FORMAT,
+    SERIAL_CACHE_SIZE,
+    Docket,
+    configure_serial_cache,
+    serial_cache_info,
+)
+from .docket_rules import is_statutory_rule, is_statutory_serial
 from .gr_clean import gr_prefix_clean
 from .misc.extra import cull_extra, formerly, pp
 from .misc.num import Num
@@ -1,4 +1,5 @@
 import re
+import threading
 from collections.abc import Iterator
 from typing import Any
 
@@ -6,9 +7,22 @@ from citation_date import DOCKET_DATE_REGEX, decode_date
 from citation_report import REPORT_REGEX, get_publisher_label
 from pydantic import BaseModel, Field, PrivateAttr
 
+from .docket_dates import DocketDates
 from .docket_model import Docket
 from .misc import cull_extra, formerly, pp
 
+DOCKET_TAIL_REGEX = "".join(
+    [
+        rf"(?P<extra_phrase>{formerly}?{pp}?){DOCKET_DATE_REGEX}",
+        rf"(?P<opt_report>\,\s*{REPORT_REGEX})?",
+    ]
+)
+"""The date and optional report shared by every docket style after its `docket_regex`."""  # noqa: E501
+
+_compile_lock = threading.Lock()
+"""Held while a pattern is compiled, so that threads sharing a constructor,
+e.g. under free threading, compile each pattern once."""
+
 
 class CitationConstructor(BaseModel):
     """Prefatorily, regex strings are defined so that a
@@ -75,6 +89,15 @@ class CitationConstructor(BaseModel):
         title="Regex Num",
         description="Regex portion for the num keyword to get the serial ids",
     )
+    initials: str | None = Field(
+        default=None,
+        title="Regex Initial Characters",
+        description=(
+            "Contents of a character class, e.g. 'gil,', covering every character"
+            " that can begin a match of `docket_regex`; used as a lookahead so that"
+            " a search can skip other positions."
+        ),
+    )
     _pattern_cache: tuple[str, re.Pattern] | None = PrivateAttr(default=None)
     _key_num_pattern_cache: tuple[str, re.Pattern] | None = PrivateAttr(default=None)
 
@@ -89,16 +112,20 @@ class CitationConstructor(BaseModel):
         Returns:
             Pattern: Combination of Docket and Report styles.
         """
-        regex = "".join(
-            [
-                rf"{self.docket_regex}",
-                rf"(?P<extra_phrase>{formerly}?{pp}?){DOCKET_DATE_REGEX}",
-                rf"(?P<opt_report>\,\s*{REPORT_REGEX})?",
-            ]
-        )
-        if self._pattern_cache is None or self._pattern_cache[0] != regex:
-            self._pattern_cache = (regex, re.compile(regex, re.I | re.X))
-        return self._pattern_cache[1]
+        regex = rf"{self.initials_regex}{self.docket_regex}{DOCKET_TAIL_REGEX}"
+        cached = self._pattern_cache
+        if cached is None or cached[0] != regex:
+            with _compile_lock:
+                cached = self._pattern_cache
+                if cached is None or cached[0] != regex:
+                    cached = (regex, re.compile(regex, re.I | re.X))
+                    self._pattern_cache = cached
+        return cached[1]
+
+    @property
+    def initials_regex(self) -> str:
+        """A lookahead for `initials`, if declared."""
+        return rf"(?=[{self.initials}])" if self.initials else ""
 
     @property
     def key_num_pattern(self) -> re.Pattern:
@@ -106,51 +133,83 @@ class CitationConstructor(BaseModel):
         just the key and number elements, e.g. "GR No. 123" or "BP Blg. 45"
         """
         regex = rf"{self.key_regex}({self.num_regex})?"
-        if (
-            self._key_num_pattern_cache is None
-            or self._key_num_pattern_cache[0] != regex
-        ):
-            self._key_num_pattern_cache = (regex, re.compile(regex, re.I | re.X))
-        return self._key_num_pattern_cache[1]
-
-    def detect_with_spans(self, raw: str) -> Iterator[dict[str, Any]]:
+        cached = self._key_num_pattern_cache
+        if cached is None or cached[0] != regex:
+            with _compile_lock:
+                cached = self._key_num_pattern_cache
+                if cached is None or cached[0] != regex:
+                    cached = (regex, re.compile(regex, re.I | re.X))
+                    self._key_num_pattern_cache = cached
+        return cached[1]
+
+    def detect_with_spans(
+        self, raw: str, dates: DocketDates | None = None
+    ) -> Iterator[dict[str, Any]]:
         """Logic: if `self.init_name` Match group exists, get entire
         regex based on `self.group_name`, extract subgroups which will
         consist of `Docket` and `Report` parts.
 
         Args:
             raw (str): Text to evaluate
+            dates (DocketDates | None, optional): Dates of `raw` shared with other styles. Defaults to None.
 
         Yields:
             Iterator[dict[str, Any]]: A dict that can fill up a Docket + Report pydantic BaseModel
         """  # noqa: E501
-        pattern = self.pattern
         key_num_pattern = self.key_num_pattern
-        for match in pattern.finditer(raw):
-            if match.group(self.init_name):
-                if ctx := match.group(self.group_name).strip(", "):
-                    raw_id = cull_extra(key_num_pattern.sub("", ctx))
-                    ids = raw_id.strip("()[] .,;")
-                    raw_date = match.group("docket_date")
-                    date_found = decode_date(raw_date, True)
-                    if ids and date_found:
-                        if not Docket.clean_serial(ids, self.short_category):
-                            continue
-                        yield dict(
-                            context=ctx,
-                            short_category=self.short_category,
-                            category=self.label,
-                            ids=ids,
-                            docket_date=date_found,
-                            publisher=get_publisher_label(match),
-                            volpubpage=match.group("volpubpage"),
-                            volume=match.group("volume"),
-                            page=match.group("page"),
-                            supplement=(True if match.group("OG_SUPPLEMENT") else None),
-                            issue_number=match.group("OG_ISSUE_NUMBER"),
-                            _source_start=match.start(),
-                            _source_end=match.end(),
-                        )
+        dates = dates or DocketDates(raw)
+        for match in self.pattern.finditer(raw):
+            if result := self.detect_match(match, key_num_pattern, dates):
+                yield result
+
+    def detect_match(
+        self,
+        match: re.Match,
+        key_num_pattern: re.Pattern | None = None,
+        dates: DocketDates | None = None,
+    ) -> dict[str, Any] | None:
+        """Convert a single match of `@pattern`, or of any pattern that embeds
+        `docket_regex` and the shared docket tail, into `Docket` and `Report` parts.
+
+        Args:
+            match (re.Match): Match object containing this constructor's group names
+            key_num_pattern (re.Pattern | None, optional): Precomputed `@key_num_pattern`
+            dates (DocketDates | None, optional): Decodes each date text once. Defaults to None.
+
+        Returns:
+            dict[str, Any] | None: A dict that can fill up a Docket + Report pydantic BaseModel
+        """  # noqa: E501
+        if not match.group(self.init_name):
+            return None
+        if not (ctx := match.group(self.group_name).strip(", ")):
+            return None
+        key_num_pattern = key_num_pattern or self.key_num_pattern
+        raw_id = cull_extra(key_num_pattern.sub("", ctx))
+        ids = raw_id.strip("()[] .,;")
+        raw_date = match.group("docket_date")
+        if dates is None:
+            date_found = decode_date(raw_date, True)
+        else:
+            date_found = dates.decode(raw_date)
+        if not (ids and date_found):
+            return None
+        if not Docket.clean_serial(ids, self.short_category):
+            return None
+        return dict(
+            context=ctx,
+            short_category=self.short_category,
+            category=self.label,
+            ids=ids,
+            docket_date=date_found,
+            publisher=get_publisher_label(match),
+            volpubpage=match.group("volpubpage"),
+            volume=match.group("volume"),
+            page=match.group("page"),
+            supplement=(True if match.group("OG_SUPPLEMENT") else None),
+            issue_number=match.group("OG_ISSUE_NUMBER"),
+            _source_start=match.start(),
+            _source_end=match.end(),
+        )
 
     def detect(self, raw: str) -> Iterator[dict[str, Any]]:
         """Public compatibility wrapper without internal source metadata."""
@@ -56,6 +56,12 @@ class DocketReportCitation(Docket, Report, abc.ABC):
     _source_span: tuple[int, int] = PrivateAttr(default=(-1, -1))
     _explicit_category: bool = PrivateAttr(default=True)
 
+    @classmethod
+    def names_category(cls, result: dict) -> bool:
+        """Whether a detected `result` states its category in the matched context,
+        as opposed to a category implied by the shape of the serial alone."""
+        return True
+
     @classmethod
     def from_detected(cls, result: dict, *, explicit_category: bool = True) -> Self:
         """Build a public model while retaining extraction-only metadata."""
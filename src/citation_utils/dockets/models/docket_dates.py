@@ -0,0 +1,64 @@
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from functools import cached_property
+
+from citation_date import DOCKET_DATE_REGEX, decode_date
+
+DOCKET_DATE_PATTERN = re.compile(DOCKET_DATE_REGEX, re.I | re.X)
+
+
+@dataclass
+class DocketDates:
+    """The docket dates of one normalized text, shared by every docket style.
+
+    A date in a string cite can be matched by several styles, and the same date
+    often recurs in a footnote, e.g. a resolution and its motion. Each distinct
+    date text is decoded once per document; `spans` finds the offsets of every
+    date in a single pass, only when a caller needs them, e.g. for the `window`
+    intervals of `CitableDocument`.
+
+    Examples:
+        >>> dates = DocketDates("G.R. No. 1, Jan. 1, 2000; G.R. No. 2, Jan. 1, 2000")
+        >>> dates.spans
+        [(12, 24), (38, 50)]
+        >>> dates.decode("Jan. 1, 2000")
+        datetime.date(2000, 1, 1)
+        >>> dates.decoded
+        {'Jan. 1, 2000': datetime.date(2000, 1, 1)}
+        >>> dates.windows(5)
+        [(7, 24), (33, 50)]
+    """
+
+    text: str
+    decoded: dict[str, date | None] = field(default_factory=dict, repr=False)
+
+    @cached_property
+    def spans(self) -> list[tuple[int, int]]:
+        return [match.span() for match in DOCKET_DATE_PATTERN.finditer(self.text)]
+
+    def any(self) -> bool:
+        """Whether the text has a docket date, without finding all of them."""
+        if "spans" in self.__dict__:
+            return bool(self.spans)
+        return DOCKET_DATE_PATTERN.search(self.text) is not None
+
+    def windows(self, window: int) -> list[tuple[int, int]]:
+        """Merge the `window` characters before each docket date, and the date
+        itself, into sorted, non-overlapping intervals."""
+        windows: list[tuple[int, int]] = []
+        for date_start, end in self.spans:
+            start = max(0, date_start - window)
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], end)
+            else:
+                windows.append((start, end))
+        return windows
+
+    def decode(self, raw: str) -> date | None:
+        """`decode_date(raw, True)`, once per distinct `raw` text."""
+        try:
+            return self.decoded[raw]
+        except KeyError:
+            found = self.decoded[raw] = decode_date(raw, True)  # type: ignore[assignment]
+            return found
@@ -5,6 +5,7 @@ from typing import Self
 from citation_date import DOCKET_DATE_FORMAT
 from pydantic import BaseModel, Field
 
+from ...lru import CacheInfo, LRUCache
 from .docket_category import DocketCategory
 from .gr_clean import gr_prefix_clean
 
@@ -19,6 +20,9 @@ _PREFIXED_DIGITS = re.compile(r"(?i)^([a-z]+)\s+(?=-?\d)")
 _SUFFIXED_LETTERS = re.compile(r"(?i)(?<=\d)\s+(?=[a-z]+$)")
 _WHITESPACE = re.compile(r"\s+")
 
+SERIAL_CACHE_SIZE = 16_384
+"""Distinct `(text, category)` pairs that `Docket.clean_serial()` remembers."""
+
 
 class Docket(BaseModel):
     """
@@ -97,13 +101,31 @@ class Docket(BaseModel):
             extract the `@first_id` found to deal with compound ids, e.g.
             ids separated by 'and' and ','
 
+        Returns:
+            str: Singular text identifier
+        """
+        return self.make_serial_text(self.ids, self.category)
+
+    @classmethod
+    def make_serial_text(cls, ids: str, category: DocketCategory) -> str:
+        """The `@serial_text` of a docket with these `ids` and `category`, without
+        constructing the docket.
+
+        Examples:
+            >>> Docket.make_serial_text("138570, 138572", DocketCategory.GR)
+            '138570'
+
+        Args:
+            ids (str): Raw serial ids, possibly compound
+            category (DocketCategory): Category of the docket
+
         Returns:
             str: Singular text identifier
         """
         return (
-            self.clean_serial(self.ids, self.category)
-            or self.first_id
-            or self.ids.strip()
+            cls.clean_serial(ids, category)
+            or _SERIAL_SPLIT.split(ids, maxsplit=1)[0].strip()
+            or ids.strip()
         )
 
     @property
@@ -137,30 +159,61 @@ class Docket(BaseModel):
         2. Characters that can be included `a-z`, `0-9`, `-`
         3. Must only contain a single alpha-numeric reference
 
+        The same serials recur throughout a corpus, so results are kept in a
+        bounded, thread-safe cache; see `configure_serial_cache()`.
+
         Args:
             text (str): Raw text to clean
+            category (DocketCategory | str | None, optional): Docket category, which enables GR prefix cleaning
 
         Returns:
             str: Cleaned serial text fit for database input.
-        """
-        raw = _SERIAL_SPLIT.split(text.strip().rstrip("*•[]"), maxsplit=1)[0]
-        raw = _NUMBER_PREFIX.sub("", raw)
-        if raw.isascii() and raw.isdigit():
-            return raw
-
+        """  # noqa: E501
         category_name = (
             category.name if isinstance(category, DocketCategory) else (category or "")
         ).upper()
+        return _serial_cache(text, category_name)
 
-        if category_name == DocketCategory.GR.name:
-            raw = gr_prefix_clean(raw) or raw
 
-        raw = _DOTTED_ACRONYM.sub(lambda match: match.group().replace(".", ""), raw)
-        raw = _SPACED_HYPHEN.sub("-", raw)
-        raw = _PREFIXED_DIGITS.sub(r"\1-", raw)
-        raw = _SUFFIXED_LETTERS.sub("-", raw)
-        raw = _WHITESPACE.sub("", raw).lower()
+def _clean_serial(text: str, category_name: str) -> str | None:
+    raw = _SERIAL_SPLIT.split(text.strip().rstrip("*•[]"), maxsplit=1)[0]
+    raw = _NUMBER_PREFIX.sub("", raw)
+    if raw.isascii() and raw.isdigit():
+        return raw
 
-        if match := DB_SERIAL_NUM.fullmatch(raw):
-            return match.group("serial")
-        return None
+    if category_name == DocketCategory.GR.name:
+        raw = gr_prefix_clean(raw) or raw
+
+    raw = _DOTTED_ACRONYM.sub(lambda match: match.group().replace(".", ""), raw)
+    raw = _SPACED_HYPHEN.sub("-", raw)
+    raw = _PREFIXED_DIGITS.sub(r"\1-", raw)
+    raw = _SUFFIXED_LETTERS.sub("-", raw)
+    raw = _WHITESPACE.sub("", raw).lower()
+
+    if match := DB_SERIAL_NUM.fullmatch(raw):
+        return match.group("serial")
+    return None
+
+
+_serial_cache = LRUCache(_clean_serial, SERIAL_CACHE_SIZE)
+
+
+def serial_cache_info() -> CacheInfo:
+    """Statistics of the `Docket.clean_serial()` cache since it was last
+    configured or cleared.
+
+    Examples:
+        >>> configure_serial_cache(2)
+        >>> [Docket.clean_serial(text, "GR") for text in ("1", "2", "1", "3")]
+        ['1', '2', '1', '3']
+        >>> serial_cache_info()
+        CacheInfo(hits=1, misses=3, evictions=1, currsize=2, maxsize=2)
+        >>> configure_serial_cache()
+    """
+    return _serial_cache.cache_info()
+
+
+def configure_serial_cache(maxsize: int | None = SERIAL_CACHE_SIZE) -> None:
+    """Empty the `Docket.clean_serial()` cache and let it hold up to `maxsize`
+    serials; see `LRUCache.configure()`."""
+    _serial_cache.configure(maxsize)
@@ -103,14 +103,23 @@ def is_statutory_rule(citeable):
     """  # noqa: E501
 
     if isinstance(citeable, Docket):  # excludes solo reports
-        if citeable.category == DocketCategory.BM:
-            serial = Docket.clean_serial(citeable.ids, citeable.category)
-            if not serial:
-                return False
-            return serial in STATUTORY_BM_SERIALS
-        if citeable.category == DocketCategory.AM:
-            serial = Docket.clean_serial(citeable.ids, citeable.category)
-            if not serial:
-                return False
-            return serial in STATUTORY_AM_SERIALS
+        return is_statutory_serial(citeable.category, citeable.ids)
+    return False
+
+
+def is_statutory_serial(category: DocketCategory, ids: str) -> bool:
+    """Like `is_statutory_rule()` but for the raw `category` and `ids` of a docket.
+
+    Examples:
+        >>> is_statutory_serial(DocketCategory.BM, "803")
+        True
+        >>> is_statutory_serial(DocketCategory.GR, "803")
+        False
+    """
+    if category == DocketCategory.BM:
+        serial = Docket.clean_serial(ids, category)
+        return bool(serial) and serial in STATUTORY_BM_SERIALS
+    if category == DocketCategory.AM:
+        serial = Docket.clean_serial(ids, category)
+        return bool(serial) and serial in STATUTORY_AM_SERIALS
     return False
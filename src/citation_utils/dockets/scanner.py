@@ -0,0 +1,320 @@
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from .constructed_ac import CitationAC, constructed_ac
+from .constructed_am import CitationAM, constructed_am
+from .constructed_bm import CitationBM, constructed_bm
+from .constructed_gr import CitationGR, constructed_gr, gr_key, l_key, n_irregular
+from .constructed_jib import CitationJIB, constructed_jib
+from .constructed_oca import CitationOCA, constructed_oca
+from .constructed_pet import CitationPET, constructed_pet
+from .constructed_udk import CitationUDK, constructed_udk
+from .models import (
+    DOCKET_TAIL_REGEX,
+    CitationConstructor,
+    DocketDates,
+    DocketReportCitation,
+)
+
+if TYPE_CHECKING:
+    from ..budget import ExtractionBudget
+    from ..profiling import StageProfiler
+
+GR_HINT_REGEX = rf"(?:{gr_key}|{l_key}|{n_irregular})"
+"""Unlike `constructed_gr.key_num_pattern`, includes the `L-` and `, Nos.` forms."""
+
+
+@dataclass
+class DocketScanner:
+    """Search several docket styles with a single alternation, i.e.
+    `(?:<ac>|<am>|...)<date><report>`, so that the text is traversed once
+    rather than once per `CitationConstructor`.
+
+    Each entry is a `CitationConstructor`, its `DocketReportCitation` class and
+    the regex of a conservative hint, or `None` for the style's own
+    `key_num_pattern`; no pattern is compiled before first use. The alternation
+    of every style is compiled once; it is only attempted at the positions of
+    the hints, and a style whose hint is not found in the text is not matched.
+
+    The results are the same as calling each category's `search()` in turn:
+
+    1. The alternation finds the leftmost position where _any_ style matches;
+    2. The first style (in `entries` order) that matches at that position wins,
+    which is also the match its own `@pattern` would produce there;
+    3. Later styles are tried at the same position with an anchored `match()`
+    since styles can overlap, e.g. `A.C. No. L-363` is also a `L-363` GR; and
+    4. A style is not matched again inside its own previous match, mirroring
+    `finditer()`.
+
+    Examples:
+        >>> text = "A.C. No. L-363, Jan. 1, 2000; G.R. No. 1, Jan. 1, 2000"
+        >>> [(r.category.name, r.ids) for r in docket_scanner.search(text)]
+        [('AC', 'L-363'), ('GR', 'L-363'), ('GR', '1')]
+    """
+
+    entries: tuple[
+        tuple[CitationConstructor, type[DocketReportCitation], str | None], ...
+    ]
+    _hints: list[re.Pattern] | None = field(default=None, init=False, repr=False)
+    _pattern: re.Pattern | None = field(default=None, init=False, repr=False)
+    _hint_pattern: re.Pattern | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @property
+    def pattern(self) -> re.Pattern:
+        """The `docket_regex` of every style in `entries` order, alternated and
+        followed by the shared docket tail. When every style declares its
+        `initials`, the alternation is only attempted at positions starting with
+        one of them."""
+        if (pattern := self._pattern) is None:
+            with self._lock:
+                if (pattern := self._pattern) is None:
+                    constructors = [constructor for constructor, _, _ in self.entries]
+                    styles = "|".join(
+                        f"(?:\n{constructor.docket_regex}\n)"
+                        for constructor in constructors
+                    )
+                    lead = ""
+                    if all(constructor.initials for constructor in constructors):
+                        initials = "".join(
+                            constructor.initials for constructor in constructors
+                        )
+                        lead = rf"(?=[{initials}])"
+                    regex = rf"{lead}(?:{styles}){DOCKET_TAIL_REGEX}"
+                    pattern = self._pattern = re.compile(regex, re.I | re.X)
+        return pattern
+
+    @property
+    def hints(self) -> list[re.Pattern]:
+        """The compiled hint of each style in `entries`."""
+        if (hints := self._hints) is None:
+            with self._lock:
+                if (hints := self._hints) is None:
+                    hints = self._hints = [
+                        constructor.key_num_pattern
+                        if regex is None
+                        else re.compile(regex, re.I | re.X)
+                        for constructor, _, regex in self.entries
+                    ]
+        return hints
+
+    @property
+    def hint_pattern(self) -> re.Pattern:
+        """A zero-width pattern that matches wherever the hint of any style in
+        `entries` does, attempted only at the `initials` of the styles if every
+        style declares them."""
+        if (pattern := self._hint_pattern) is None:
+            compiled = self.hints  # outside the lock, which `hints` takes
+            with self._lock:
+                if (pattern := self._hint_pattern) is None:
+                    hints = "|".join(f"(?:\n{hint.pattern}\n)" for hint in compiled)
+                    lead = ""
+                    if all(constructor.initials for constructor, _, _ in self.entries):
+                        initials = "".join(
+                            constructor.initials for constructor, _, _ in self.entries
+                        )
+                        lead = rf"(?=[{initials}])"
+                    pattern = re.compile(rf"{lead}(?=(?:{hints}))", re.I | re.X)
+                    self._hint_pattern = pattern
+        return pattern
+
+    def keyword_positions(
+        self, text: str, windows: Iterable[tuple[int, int]] | None = None
+    ) -> dict[str, list[int]]:
+        """The positions at which the hint of each style matches, by category, in
+        a single pass over `text` or its `windows`. A docket of a style starts
+        at one of the positions of its style, since each hint matches the key
+        that begins the style's `docket_regex`.
+
+        Examples:
+            >>> text = "G.R. No. 1 and A.M. No. P-1; G.R. No. 2"
+            >>> {key: value for key, value in docket_scanner.keyword_positions(text).items() if value}
+            {'AM': [15], 'GR': [0, 29]}
+
+        Args:
+            text (str): Text to look for keywords
+            windows (Iterable[tuple[int, int]] | None, optional): See `search()`.
+
+        Returns:
+            dict[str, list[int]]: Sorted positions of each category, in `entries` order
+        """  # noqa: E501
+        positions, _ = self._find_keywords(text, windows)
+        return {
+            constructor.short_category: found
+            for (constructor, _, _), found in zip(self.entries, positions)
+        }
+
+    def _find_keywords(
+        self, text: str, windows: Iterable[tuple[int, int]] | None = None
+    ) -> tuple[list[list[int]], list[int]]:
+        """`keyword_positions()` in `entries` order, and every position at which
+        some hint matches. Each position found by `hint_pattern` is checked
+        against each hint with the same bounds, so a hint whose match starts
+        where an earlier alternative also matches is not missed."""
+        positions: list[list[int]] = [[] for _ in self.entries]
+        starts: list[int] = []
+        hints = self.hints
+        for start, end in [(0, len(text))] if windows is None else windows:
+            for match in self.hint_pattern.finditer(text, start, end):
+                position = match.start()
+                for found, hint in zip(positions, hints):
+                    if hint.match(text, position, end):
+                        found.append(position)
+                starts.append(position)
+        return positions, starts
+
+    def precompile(self) -> None:
+        """Compile the alternation of every style and each style's own patterns
+        now, e.g. before threads share this scanner, rather than on first use."""
+        for constructor, _, _ in self.entries:
+            constructor.pattern
+            constructor.key_num_pattern
+        self.pattern
+        self.hints
+        self.hint_pattern
+
+    def search(
+        self, text: str, windows: Iterable[tuple[int, int]] | None = None
+    ) -> Iterator[DocketReportCitation]:
+        """Yield category-tagged docket citations ordered by start position and,
+        at the same position, by `entries` order.
+
+        With `windows`, a citation is only looked for if its docket phrase
+        starts and its date ends inside one of the sorted, non-overlapping
+        `(start, end)` intervals. Its report tail may extend past the interval.
+
+        Examples:
+            >>> text = "G.R. No. 1, Jan. 1, 2000, 1 SCRA 1; G.R. No. 2, Jan. 2, 2000"
+            >>> [r.ids for r in docket_scanner.search(text, [(30, 60)])]
+            ['2']
+
+        Args:
+            text (str): Text to look for citation objects
+            windows (Iterable[tuple[int, int]] | None, optional): Limit the
+                search to these intervals of `text`. Defaults to the whole text.
+
+        Yields:
+            Iterator[DocketReportCitation]: Any of the `entries` citation types.
+        """
+        for citation, result, explicit_category in self.detect(text, windows):
+            yield citation.from_detected(result, explicit_category=explicit_category)
+
+    def detect(
+        self,
+        text: str,
+        windows: Iterable[tuple[int, int]] | None = None,
+        profiler: "StageProfiler | None" = None,
+        dates: DocketDates | None = None,
+        budget: "ExtractionBudget | None" = None,
+    ) -> Iterator[tuple[type[DocketReportCitation], dict[str, Any], bool]]:
+        """Like `search()` but without constructing the citation models.
+
+        Args:
+            text (str): Text to look for citation objects
+            windows (Iterable[tuple[int, int]] | None, optional): See `search()`.
+            profiler (StageProfiler | None, optional): Records the time of each
+                style's hint, of the alternation and of each style's matches.
+            dates (DocketDates | None, optional): Dates of `text`, decoded once
+                for all styles. Defaults to new `DocketDates`.
+            budget (ExtractionBudget | None, optional): Spent on each regex call;
+                `BudgetExceeded` ends the scan once it is gone.
+
+        Yields:
+            Iterator[tuple[type[DocketReportCitation], dict[str, Any], bool]]: The
+                citation type, its `CitationConstructor.detect_match()` result and
+                whether the matched context names the category.
+        """
+        windows = [(0, len(text))] if windows is None else list(windows)
+        dates = dates or DocketDates(text)
+        pos = 0
+        recorded = profiler is not None or budget is not None
+
+        def record(stage: str, clock: float) -> None:
+            if profiler:
+                profiler.add(stage, perf_counter() - clock)
+            if budget:
+                budget.spend(stage, pos)
+
+        clock = perf_counter() if profiler else 0.0
+        positions, starts = self._find_keywords(text, windows)
+        if recorded:
+            record("dockets.hint", clock)
+        hinted = [bool(found) for found in positions]
+        if not any(hinted):
+            return
+        pattern = self.pattern
+        styles = [(constructor, citation) for constructor, citation, _ in self.entries]
+        # a style's own pattern is compiled only if an anchored match needs it
+        own_patterns: list[re.Pattern | None] = [None] * len(styles)
+        # a style without hints is never matched, as if it resumed past the text
+        resume_at = [0 if hint else len(text) + 1 for hint in hinted]
+        for window_start, window_end in windows:
+            # a match against a truncated text may lack its report tail
+            truncated = window_end < len(text)
+            pos = max(pos, window_start)
+            while pos < window_end:
+                # every match starts at a keyword, so skip the text up to the next
+                index = bisect_left(starts, pos)
+                if index == len(starts) or starts[index] >= window_end:
+                    break
+                pos = starts[index]
+                clock = perf_counter() if profiler else 0.0
+                match = pattern.search(text, pos, window_end)
+                if recorded:
+                    record("dockets.search", clock)
+                if not match:
+                    break
+                start = match.start()
+                winner, anchored = 0, truncated
+                if not anchored:
+                    winner = next(
+                        index
+                        for index, (constructor, _) in enumerate(styles)
+                        if match.group(constructor.group_name) is not None
+                    )
+                    if not hinted[winner]:
+                        # only the anchored matches of the hinted styles count
+                        winner, anchored = 0, True
+                for index in range(winner, len(styles)):
+                    if start < resume_at[index]:
+                        continue
+                    clock = perf_counter() if profiler else 0.0
+                    constructor, citation = styles[index]
+                    if index == winner and not anchored:
+                        found = match
+                    else:
+                        if (own_pattern := own_patterns[index]) is None:
+                            own_pattern = own_patterns[index] = constructor.pattern
+                        found = own_pattern.match(text, start)
+                    result = None
+                    if found:
+                        resume_at[index] = found.end()
+                        result = constructor.detect_match(
+                            found, constructor.key_num_pattern, dates
+                        )
+                    if recorded:
+                        record(f"dockets.match.{constructor.short_category}", clock)
+                    if result:
+                        yield citation, result, citation.names_category(result)
+                pos = max(start + 1, min(resume_at))
+
+
+docket_scanner = DocketScanner(
+    (
+        (constructed_ac, CitationAC, None),
+        (constructed_am, CitationAM, None),
+        (constructed_oca, CitationOCA, None),
+        (constructed_bm, CitationBM, None),
+        (constructed_gr, CitationGR, GR_HINT_REGEX),
+        (constructed_pet, CitationPET, None),
+        (constructed_udk, CitationUDK, None),
+        (constructed_jib, CitationJIB, None),
+    )
+)
@@ -1,41 +1,49 @@
+import logging
+import os
 import re
-from collections.abc import Iterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Hashable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field, replace
 from functools import cached_property
 from heapq import merge
+from itertools import takewhile
+from typing import TYPE_CHECKING, Any, TextIO
 
-from citation_date import DOCKET_DATE_REGEX
 from citation_report import Report, normalize_report_text
 
-from .dockets import (
-    CitationAC,
-    CitationAM,
-    CitationBM,
-    CitationGR,
-    CitationJIB,
-    CitationOCA,
-    CitationPET,
-    CitationUDK,
+from .budget import BudgetExceeded
+from .dockets import (  # DOCKET_DATE_PATTERN, once defined here, is re-exported
+    DOCKET_DATE_PATTERN,
+    Docket,
+    DocketCategory,
+    DocketDates,
     DocketReport,
-    constructed_ac,
-    constructed_am,
-    constructed_bm,
-    constructed_jib,
-    constructed_oca,
-    constructed_pet,
-    constructed_udk,
-    is_statutory_rule,
+    DocketReportCitation,
+    docket_scanner,
+    is_statutory_serial,
 )
-from .dockets.constructed_gr import gr_key, l_key, n_irregular
 from .identity import (
     CitationOccurrence,
     CitationParts,
     aggregate_occurrences,
     render_parts,
 )
-
-DOCKET_DATE_PATTERN = re.compile(DOCKET_DATE_REGEX, re.I | re.X)
-GR_HINT_PATTERN = re.compile(rf"(?:{gr_key}|{l_key}|{n_irregular})", re.I | re.X)
+from .profiling import StageProfiler
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .budget import ExtractionBudget
+    from .columns import OccurrenceColumns
+    from .offsets import ByteOffsets
+
+DOCKET_WINDOW = 400
+"""A `window` longer than the observed docket phrases, serial lists included."""
+AIO_BATCH_SIZE = 256
+"""Occurrences handed from the executor to the event loop at a time."""
+STREAM_CHUNK_SIZE = 1 << 20
+STREAM_OVERLAP = 2_000
+"""Longer than a docket phrase, its date and its report tail taken together."""
 IMPLICIT_GR_OWNER_PATTERN = re.compile(
     r"(?:\bca\s*-?\s*g\.?r\.?|\bc\.a\.\s*g\.?r\.?|"
     r"\ba\.?c\.?|\ba\.?m\.?|\bb\.?m\.?|"
@@ -45,6 +53,19 @@ IMPLICIT_GR_OWNER_PATTERN = re.compile(
 )
 
 
+def _last_nfc_boundary(raw: str) -> int:
+    """The position of the last ASCII character of `raw` after its first, or
+    the end of `raw` if there is none."""
+    for index in range(len(raw) - 1, 0, -1):
+        if raw[index].isascii():
+            return index
+    return len(raw)
+
+
+def _stage(profiler: StageProfiler | None, name: str) -> AbstractContextManager:
+    return profiler.stage(name) if profiler else nullcontext()
+
+
 @dataclass(frozen=True)
 class _SpanIndex:
     """Exact containment checks for sorted source intervals."""
@@ -72,6 +93,43 @@ class _SpanIndex:
         return index >= 0 and self.max_ends[index] >= end
 
 
+@dataclass(slots=True)
+class _DocketHit:
+    """A detected docket, before (or instead of) constructing its citation model."""
+
+    citation: type[DocketReportCitation]
+    result: dict[str, Any]
+    explicit_category: bool
+    category: DocketCategory = field(init=False)
+    serial_text: str = field(init=False)
+
+    def __post_init__(self):
+        self.category = DocketCategory[self.result["short_category"]]
+        self.serial_text = Docket.make_serial_text(self.result["ids"], self.category)
+
+    @property
+    def span(self) -> tuple[int, int]:
+        return self.result["_source_start"], self.result["_source_end"]
+
+    @property
+    def reports(self) -> tuple[str | None, str | None, str | None]:
+        """The `phil`, `scra` and qualified `offg` of the docket's report tail."""
+        result = self.result
+        report = Report(
+            publisher=result["publisher"],
+            volume=result["volume"],
+            page=result["page"],
+            supplement=result["supplement"],
+            issue_number=result["issue_number"],
+        )
+        return report.phil, report.scra, report.qualified_offg or report.offg
+
+    def to_model(self) -> DocketReport:
+        return self.citation.from_detected(
+            self.result, explicit_category=self.explicit_category
+        )
+
+
 @dataclass
 class CitableDocument:
     """Creates three main reusable lists:
@@ -82,6 +140,12 @@ class CitableDocument:
     `@reports` | list of `Report` found in the text (which may already be included in `@docketed_reports`)
     `@undocketed_reports` | reports not attached to any docket match
 
+    For long documents, a `window` limits the docket search to that many characters
+    before each docket date; see `get_docketed_reports()`. A `StageProfiler` passed
+    as `profiler` records the time spent in each stage of the extraction. An
+    `ExtractionBudget` passed as `budget` stops looking for dockets once it is spent;
+    the dockets and occurrences are then those before `reached`.
+
     Examples:
         >>> text_statutes = "Bar Matter No. 803, Jan. 1, 2000; Bar Matter No. 411, Feb. 1, 2000"
         >>> len(CitableDocument(text=text_statutes).docketed_reports) # no citations, since these are 'statutory dockets'
@@ -99,23 +163,128 @@ class CitableDocument:
     """  # noqa: E501
 
     text: str
+    window: int | None = field(default=None, kw_only=True)
+    profiler: StageProfiler | None = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
+    budget: "ExtractionBudget | None" = field(
+        default=None, kw_only=True, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        self.text = normalize_report_text(self.text)
+        with _stage(self.profiler, "normalize"):
+            self.text = normalize_report_text(self.text)
+
+    @classmethod
+    def from_path(
+        cls,
+        path: str | os.PathLike,
+        window: int | None = None,
+        profiler: StageProfiler | None = None,
+    ) -> "CitableDocument":
+        """A document of the UTF-8 file at `path`, decoded once from a memory map
+        of it rather than read into bytes first. Line endings are kept as they
+        are, unlike a file opened in text mode, so the offsets of `byte_offsets`
+        are those of the file.
+
+        Normalization keeps the decoded text itself when it is already NFC, as
+        almost every file is; otherwise the byte offsets are those of the
+        normalized text and a warning is logged.
+
+        Examples:
+            >>> import tempfile
+            >>> with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as file:
+            ...     _ = file.write("Señor, G.R. No. 1, Jan. 1, 2000".encode())
+            >>> document = CitableDocument.from_path(file.name)
+            >>> item = next(document.iter_occurrences())
+            >>> item.start, document.byte_offsets.span(item.start, item.end)
+            (7, (8, 32))
+
+        Args:
+            path (str | os.PathLike): A UTF-8 encoded file
+            window (int | None, optional): See `get_docketed_reports()`. Defaults to None.
+            profiler (StageProfiler | None, optional): See `CitableDocument`. Defaults to None.
+
+        Returns:
+            CitableDocument: The document, offsets counting characters
+        """  # noqa: E501
+        import mmap
+
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                decoded = ""
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    decoded = str(mapped, "utf-8")
+        document = cls(decoded, window=window, profiler=profiler)
+        if document.text is not decoded and document.text != decoded:
+            logging.warning(
+                "%s is not NFC normalized; byte offsets are of the normalized text",
+                path,
+            )
+        return document
+
+    @cached_property
+    def byte_offsets(self) -> "ByteOffsets":
+        """Converts the offsets of `text` to those of its UTF-8 encoding and back."""
+        from .offsets import ByteOffsets
+
+        return ByteOffsets.of(self.text)
 
     @cached_property
     def _report_occurrences(self) -> list[tuple[tuple[int, int], Report]]:
-        return list(
-            Report.extract_reports_with_spans(self.text, text_is_normalized=True)
-        )
+        with _stage(self.profiler, "reports"):
+            return list(
+                Report.extract_reports_with_spans(self.text, text_is_normalized=True)
+            )
+
+    @cached_property
+    def _report_identities(
+        self,
+    ) -> list[tuple[tuple[int, int], str | None, str | None, str | None]]:
+        """Spans with the `phil`, `scra` and qualified `offg` values of the reports
+        outside the docket spans. A report inside a docket span is the docket's
+        report tail, i.e. `_DocketHit.reports`."""
+        spans = [hit.span for hit in self._docket_hits]
+        with _stage(self.profiler, "span_index"):
+            docket_spans = _SpanIndex.from_spans(spans)
+        return [
+            (span, report.phil, report.scra, report.qualified_offg or report.offg)
+            for span, report in self._report_occurrences
+            if not docket_spans.contains_span(*span)
+        ]
 
     @cached_property
     def reports(self) -> list[Report]:
         return [report for _, report in self._report_occurrences]
 
+    @cached_property
+    def _docket_dates(self) -> DocketDates:
+        return DocketDates(self.text)
+
+    @cached_property
+    def _docket_scan(self) -> tuple[list[_DocketHit], int]:
+        return self._select_docket_hits(
+            self.text,
+            window=self.window,
+            profiler=self.profiler,
+            dates=self._docket_dates,
+            budget=self.budget,
+        )
+
+    @property
+    def _docket_hits(self) -> list[_DocketHit]:
+        return self._docket_scan[0]
+
+    @property
+    def reached(self) -> int:
+        """Offset of `text` before which every docket was looked for, i.e. the
+        length of `text` unless the `budget` was spent first."""
+        return self._docket_scan[1]
+
     @cached_property
     def docketed_reports(self) -> list[DocketReport]:
-        return list(self._get_docketed_reports_from_normalized_text(self.text))
+        return [hit.to_model() for hit in self._docket_hits]
 
     @cached_property
     def undocketed_reports(self) -> set[str]:
@@ -123,12 +292,17 @@ class CitableDocument:
 
     @classmethod
     def get_docketed_reports(
-        cls, text: str, exclude_docket_rules: bool = True
+        cls, text: str, exclude_docket_rules: bool = True, window: int | None = None
     ) -> Iterator[DocketReport]:
         """Extract from `raw` text all raw citations which should include their `Docket` and `Report` component parts.
         This may however include statutory rules since some docket categories like AM and BM use this convention.
         To exclude statutory rules, a flag is included as a default.
 
+        Every docket citation ends with a date. With a `window`, each docket date is found first and the docket
+        patterns only search the `window` characters preceding it, so the cost follows the number of dates
+        rather than the length of the text. A docket phrase longer than `window`, e.g. a very long list of serials,
+        is then missed.
+
         Examples:
             >>> cite = next(CitableDocument.get_docketed_reports("Bagong Alyansang Makabayan v. Zamora, G.R. Nos. 138570, 138572, 138587, 138680, 138698, October 10, 2000, 342 SCRA 449"))
             >>> cite.model_dump(exclude_none=True)
@@ -138,61 +312,112 @@ class CitableDocument:
             Traceback (most recent call last):
                 ...
             StopIteration
+            >>> prose = "Lorem ipsum. " * 1000 + "G.R. No. 147033, April 30, 2003, 374 Phil. 1"
+            >>> str(next(CitableDocument.get_docketed_reports(prose, window=DOCKET_WINDOW)))
+            'GR No. 147033, Apr. 30, 2003, 374 Phil. 1'
 
         Args:
             text (str): Text to look for `Dockets` and `Reports`
+            exclude_docket_rules (bool, optional): Skip known statutory serials. Defaults to True.
+            window (int | None, optional): Characters to search before each docket date. Defaults to None, i.e. the whole text.
 
         Yields:
             Iterator[DocketReport]: Any of custom `Docket` with `Report` types, e.g. `CitationAC`, etc.
         """  # noqa: E501
         text = normalize_report_text(text)
         yield from cls._get_docketed_reports_from_normalized_text(
-            text, exclude_docket_rules
+            text, exclude_docket_rules, window
         )
 
     @classmethod
     def _get_docketed_reports_from_normalized_text(
-        cls, text: str, exclude_docket_rules: bool = True
+        cls, text: str, exclude_docket_rules: bool = True, window: int | None = None
     ) -> Iterator[DocketReport]:
         """Extract dockets from already normalized text."""
-        if not DOCKET_DATE_PATTERN.search(text):
-            return
-
-        candidates: list[DocketReport] = []
-        for hint, search_func in (
-            (constructed_ac.key_num_pattern, CitationAC.search),
-            (constructed_am.key_num_pattern, CitationAM.search),
-            (constructed_oca.key_num_pattern, CitationOCA.search),
-            (constructed_bm.key_num_pattern, CitationBM.search),
-            (GR_HINT_PATTERN, CitationGR.search),
-            (constructed_pet.key_num_pattern, CitationPET.search),
-            (constructed_udk.key_num_pattern, CitationUDK.search),
-            (constructed_jib.key_num_pattern, CitationJIB.search),
-        ):
-            if hint.search(text):
-                candidates.extend(search_func(text))
+        hits, _ = cls._select_docket_hits(text, exclude_docket_rules, window)
+        for hit in hits:
+            yield hit.to_model()
 
-        explicit_spans = _SpanIndex.from_spans(
-            [result._source_span for result in candidates if result._explicit_category]
-        )
+    @classmethod
+    def _select_docket_hits(
+        cls,
+        text: str,
+        exclude_docket_rules: bool = True,
+        window: int | None = None,
+        profiler: StageProfiler | None = None,
+        dates: DocketDates | None = None,
+        budget: "ExtractionBudget | None" = None,
+    ) -> tuple[list[_DocketHit], int]:
+        """Detect dockets in already normalized text, then drop statutory rules,
+        implicit GR serials owned by another docket, and duplicates.
+
+        Also returns the offset before which every docket was looked for: the
+        length of `text`, or the position of the scan when `budget` ran out.
+        Only the dockets that start before it are kept."""
+        candidates: list[_DocketHit] = []
+        reached = len(text)
+        try:
+            for item in cls._detect_dockets(text, window, profiler, dates, budget):
+                candidates.append(_DocketHit(*item))
+        except BudgetExceeded as exc:
+            reached = exc.position
+            candidates = [hit for hit in candidates if hit.span[0] < reached]
+        hits = cls._filter_docket_hits(text, candidates, exclude_docket_rules, profiler)
+        return hits, reached
+
+    @staticmethod
+    def _detect_dockets(
+        text: str,
+        window: int | None = None,
+        profiler: StageProfiler | None = None,
+        dates: DocketDates | None = None,
+        budget: "ExtractionBudget | None" = None,
+    ) -> Iterator[tuple[type[DocketReportCitation], dict[str, Any], bool]]:
+        """`DocketScanner.detect()` over the whole text, or over the `window`
+        characters before each docket date; nothing if there is no docket date.
+        Every style decodes its dates through the same `DocketDates`."""
+        dates = dates or DocketDates(text)
+        with _stage(profiler, "dockets.dates"):
+            if window is None:
+                windows = None if dates.any() else []
+            else:
+                windows = dates.windows(window)
+        if budget:
+            budget.spend("dockets.dates", 0)
+        if windows != []:
+            yield from docket_scanner.detect(text, windows, profiler, dates, budget)
+
+    @classmethod
+    def _filter_docket_hits(
+        cls,
+        text: str,
+        candidates: list[_DocketHit],
+        exclude_docket_rules: bool = True,
+        profiler: StageProfiler | None = None,
+    ) -> list[_DocketHit]:
+        with _stage(profiler, "span_index"):
+            explicit_spans = _SpanIndex.from_spans(
+                [hit.span for hit in candidates if hit.explicit_category]
+            )
         seen: set[tuple[int, int, str, str]] = set()
-        selected: list[DocketReport] = []
-        for result in candidates:
-            start, end = result._source_span
-            if exclude_docket_rules and is_statutory_rule(result):
-                continue
-            if (
-                result.category.name == "GR"
-                and not result._explicit_category
-                and cls._implicit_gr_is_owned(text, start, explicit_spans)
+        selected: list[_DocketHit] = []
+        for hit in candidates:
+            start, end = hit.span
+            if exclude_docket_rules and is_statutory_serial(
+                hit.category, hit.result["ids"]
             ):
                 continue
-            key = (start, end, result.category.name, result.serial_text.casefold())
+            if hit.category == DocketCategory.GR and not hit.explicit_category:
+                with _stage(profiler, "dockets.implicit_gr_owner"):
+                    owned = cls._implicit_gr_is_owned(text, start, explicit_spans)
+                if owned:
+                    continue
+            key = (start, end, hit.category.name, hit.serial_text.casefold())
             if key not in seen:
                 seen.add(key)
-                selected.append(result)
+                selected.append(hit)
 
-        yield from sorted(selected, key=lambda result: result._source_span)
+        return sorted(selected, key=lambda hit: hit.span)
 
     @staticmethod
     def _implicit_gr_is_owned(
@@ -204,50 +429,179 @@ class CitableDocument:
         return bool(IMPLICIT_GR_OWNER_PATTERN.search(prefix))
 
     def iter_occurrences(self) -> Iterator[CitationOccurrence]:
-        """Yield lossless source occurrences without double-counting reports."""
-        docket_events = (
-            (result._source_span[0], 0, "docket", result)
-            for result in self.docketed_reports
-        )
-        docket_span_index = _SpanIndex.from_spans(
-            [result._source_span for result in self.docketed_reports]
+        """Yield lossless source occurrences without double-counting reports.
+
+        Built from the detected dockets and report spans directly, i.e. no
+        `DocketReportCitation` model is constructed. If the `budget` was spent,
+        only the occurrences that start before `reached` are yielded.
+        """
+        occurrences = self._merge_occurrences(
+            self._docket_hits, self._report_identities
         )
+        if (reached := self.reached) < len(self.text):
+            occurrences = takewhile(lambda item: item.start < reached, occurrences)
+        if self.profiler:
+            occurrences = self.profiler.iterate("occurrences.merge", occurrences)
+        yield from occurrences
+
+    def _merge_occurrences(
+        self,
+        hits: list[_DocketHit],
+        identities: list[tuple[tuple[int, int], str | None, str | None, str | None]],
+    ) -> Iterator[CitationOccurrence]:
+        docket_events = ((hit.span[0], 0, "docket", hit) for hit in hits)
         report_events = (
-            (span[0], 1, "report", (span, report))
-            for span, report in self._report_occurrences
-            if not docket_span_index.contains_span(*span)
+            (identity[0][0], 1, "report", identity) for identity in identities
         )
         for start, _, kind, value in merge(
             docket_events, report_events, key=lambda event: event[:2]
         ):
             if kind == "docket":
-                end = value._source_span[1]
+                end = value.span[1]
+                phil, scra, offg = value.reports
                 yield CitationOccurrence(
                     raw_text=self.text[start:end],
                     start=start,
                     end=end,
                     category=value.category,
                     serial=value.serial_text,
-                    docket_date=value.docket_date,
-                    phil=value.phil,
-                    scra=value.scra,
-                    offg=value.qualified_offg or value.offg,
+                    docket_date=value.result["docket_date"],
+                    phil=phil,
+                    scra=scra,
+                    offg=offg,
                 )
             else:
-                span, report = value
+                (_, end), phil, scra, offg = value
                 yield CitationOccurrence(
-                    raw_text=self.text[span[0] : span[1]],
-                    start=span[0],
-                    end=span[1],
-                    phil=report.phil,
-                    scra=report.scra,
-                    offg=report.qualified_offg or report.offg,
+                    raw_text=self.text[start:end],
+                    start=start,
+                    end=end,
+                    phil=phil,
+                    scra=scra,
+                    offg=offg,
                 )
 
+    @classmethod
+    def iter_occurrences_stream(
+        cls,
+        fp: TextIO,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        overlap: int = STREAM_OVERLAP,
+        window: int | None = None,
+    ) -> Iterator[CitationOccurrence]:
+        """Like `iter_occurrences()` but reads `fp` in chunks so that only about
+        `chunk_size + 2 * overlap` characters are held at a time.
+
+        Consecutive buffers share `overlap` characters. An occurrence is only
+        yielded from a buffer when it starts at least `overlap` characters before
+        the buffer's end, and is skipped when a previous buffer already yielded it,
+        so a citation that crosses a chunk boundary is found once, complete. Each
+        raw chunk is cut at its last whitespace before normalization, keeping the
+        offsets equal to those of the whole normalized text; past `overlap`
+        characters without whitespace, at its last ASCII character, which NFC
+        never composes with the text before it, or else at the chunk's end.
+
+        Examples:
+            >>> import io
+            >>> text = "G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; 12 Phil. 24; 100 SCRA 1"
+            >>> stream = CitableDocument.iter_occurrences_stream(io.StringIO(text), chunk_size=8, overlap=40)
+            >>> [(item.start, item.raw_text) for item in stream]
+            [(0, 'G.R. No. 1, Jan. 1, 2000, 100 SCRA 1'), (38, '12 Phil. 24'), (51, '100 SCRA 1')]
+
+        Args:
+            fp (TextIO): Text stream to read from, e.g. an open file
+            chunk_size (int, optional): Characters read at a time. Defaults to STREAM_CHUNK_SIZE.
+            overlap (int, optional): Longest citation to find whole. Defaults to STREAM_OVERLAP.
+            window (int | None, optional): See `get_docketed_reports()`. Defaults to None.
+
+        Yields:
+            Iterator[CitationOccurrence]: Occurrences with offsets into the whole stream.
+        """  # noqa: E501
+        buffer = ""
+        held = ""  # raw text after the last whitespace of the chunks read
+        offset = 0  # position of `buffer` in the stream
+        emitted = 0  # occurrences starting before this position were yielded
+        while True:
+            chunk = fp.read(chunk_size)
+            raw, held = held + chunk, ""
+            if chunk:
+                cut = max(raw.rfind(" "), raw.rfind("\n")) + 1
+                if len(raw) - cut > overlap:
+                    cut = _last_nfc_boundary(raw)
+                raw, held = raw[:cut], raw[cut:]
+            buffer += normalize_report_text(raw)
+            limit = len(buffer) if not chunk else len(buffer) - overlap
+            if chunk and offset + limit <= emitted:
+                continue
+            for occurrence in cls(buffer, window=window).iter_occurrences():
+                if occurrence.start >= limit:
+                    break
+                if offset + occurrence.start >= emitted:
+                    yield replace(
+                        occurrence,
+                        start=offset + occurrence.start,
+                        end=offset + occurrence.end,
+                    )
+            if not chunk:
+                return
+            emitted = offset + limit
+            keep = max(0, limit - overlap)
+            buffer = buffer[keep:]
+            offset += keep
+
+    def aiter_occurrences(
+        self,
+        batch_size: int = AIO_BATCH_SIZE,
+        executor: "ThreadPoolExecutor | None" = None,
+    ) -> AsyncIterator[CitationOccurrence]:
+        """An async iterator over `iter_occurrences()` that runs the extraction in
+        `executor`, by default the managed pool of `citation_utils.aio`, and
+        returns control to the event loop after every `batch_size` occurrences.
+        The detection itself runs in the first batch. Cancelling the consuming
+        task also stops the extraction."""
+        from .aio import aiter_occurrences
+
+        return aiter_occurrences(self, batch_size, executor)
+
+    def to_columns(self) -> "OccurrenceColumns":
+        """`iter_occurrences()` as `OccurrenceColumns`, e.g. for a data frame.
+
+        Examples:
+            >>> from citation_utils.columns import CATEGORY_NAMES
+            >>> columns = CitableDocument("G.R. No. 1, Jan. 1, 2000; 100 SCRA 1").to_columns()
+            >>> columns.start, [CATEGORY_NAMES[code] for code in columns.category if code >= 0]
+            (array('q', [0, 26]), ['GR'])
+        """  # noqa: E501
+        from .columns import OccurrenceColumns
+
+        columns = OccurrenceColumns()
+        columns.extend(self.iter_occurrences())
+        return columns
+
+    @classmethod
+    def to_columns_many(
+        cls, sources: Iterable[tuple[Hashable, str]], window: int | None = None
+    ) -> "OccurrenceColumns":
+        """The occurrences of each `(document id, text)` pair of `sources` in one
+        `OccurrenceColumns`, whose `document` column indexes the ids.
+
+        Examples:
+            >>> columns = CitableDocument.to_columns_many([("a", "100 SCRA 1"), ("b", "1 Phil. 1; 100 SCRA 1")])
+            >>> columns.documents, columns.document, columns.scra
+            (['a', 'b'], array('q', [0, 1, 1]), ['100 SCRA 1', None, '100 SCRA 1'])
+        """  # noqa: E501
+        from .columns import OccurrenceColumns
+
+        columns = OccurrenceColumns()
+        for document_id, text in sources:
+            columns.extend(cls(text, window=window).iter_occurrences(), document_id)
+        return columns
+
     def iter_parts(self) -> Iterator[CitationParts]:
-        """Compatibility adapter over the occurrence contract."""
+        """Compatibility adapter over the occurrence contract. The reports of
+        each part are in display form, see `CitationParts.displayed`."""
         for occurrence in self.iter_occurrences():
-            yield occurrence.to_parts()
+            yield occurrence.to_parts(displayed=True)
 
     def get_undocketed_reports(self):
         """Steps:
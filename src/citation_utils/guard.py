@@ -0,0 +1,116 @@
+"""Extraction with a time or step budget per document.
+
+A docket pattern is a long alternation whose cost on malformed text, e.g. OCR
+output with thousands of `A.M. No.` fragments, is hard to bound in advance.
+`extract_guarded()` checks a budget between the regex calls of the docket
+stages and, once it is spent, stops looking for dockets. It returns the
+occurrences that are complete up to that point with a `GuardDiagnostics`
+record, rather than keep a worker busy.
+
+A single regex call cannot be interrupted, so the budget is checked between
+calls. With the default `window`, each docket search is confined to the
+`DOCKET_WINDOW` characters before a docket date, which bounds each call.
+Report references are found in a single pass that is not budgeted.
+"""
+
+from dataclasses import dataclass, field
+
+from .budget import ExtractionBudget
+from .document import DOCKET_WINDOW, CitableDocument
+from .identity import CitationOccurrence
+from .profiling import StageProfiler
+
+
+@dataclass(frozen=True, slots=True)
+class GuardDiagnostics:
+    """What a guarded extraction spent and, if it stopped early, where.
+
+    Attributes:
+        complete: Whether every docket was looked for
+        reached: Offset of the normalized text before which the occurrences are complete
+        elapsed: Seconds spent
+        steps: Regex calls made by the docket stages
+        stage: The `StageProfiler` stage in which the budget was spent
+        category: The docket category whose match stage took the most time
+        stages: `StageProfiler.to_dict()` of the extraction
+    """  # noqa: E501
+
+    complete: bool
+    reached: int
+    elapsed: float
+    steps: int
+    stage: str | None = None
+    category: str | None = None
+    stages: dict[str, dict[str, float | int]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class GuardedExtraction:
+    """The occurrences found within the budget and the `GuardDiagnostics`."""
+
+    occurrences: list[CitationOccurrence]
+    diagnostics: GuardDiagnostics
+
+
+def slowest_category(profiler: StageProfiler) -> str | None:
+    """The category with the most time in its `dockets.match.<category>` stage."""
+    totals: dict[str, float] = {}
+    for stage, seconds in profiler.seconds.items():
+        kind, _, category = stage.partition(".match.")
+        if kind == "dockets" and category:
+            totals[category] = totals.get(category, 0.0) + seconds
+    return max(totals, key=totals.__getitem__) if totals else None
+
+
+def extract_guarded(
+    text: str,
+    seconds: float | None = 1.0,
+    steps: int | None = None,
+    window: int | None = DOCKET_WINDOW,
+) -> GuardedExtraction:
+    """Like `CitableDocument(text, window=window).iter_occurrences()` but stop
+    looking for dockets once `seconds` or `steps` are spent.
+
+    If the budget runs out, the occurrences are those that start before the
+    position the docket scan had reached, i.e. the part of the text that was
+    fully examined; the diagnostics name the stage and category where the time
+    went.
+
+    Examples:
+        >>> result = extract_guarded("G.R. No. 1, Jan. 1, 2000; 100 SCRA 1")
+        >>> [item.raw_text for item in result.occurrences]
+        ['G.R. No. 1, Jan. 1, 2000', '100 SCRA 1']
+        >>> result.diagnostics.complete
+        True
+        >>> text = "".join(f"A.M. No. RTJ-00-{i}, Jan. 1, 2000; " for i in range(1, 6))
+        >>> result = extract_guarded(text, steps=7, window=None)
+        >>> [item.raw_text for item in result.occurrences]
+        ['A.M. No. RTJ-00-1, Jan. 1, 2000', 'A.M. No. RTJ-00-2, Jan. 1, 2000']
+        >>> result.diagnostics.complete, result.diagnostics.stage
+        (False, 'dockets.match.AM')
+
+    Args:
+        text (str): Text of the document
+        seconds (float | None, optional): Time budget, including normalization. Defaults to 1.0.
+        steps (int | None, optional): Budget of docket regex calls. Defaults to None.
+        window (int | None, optional): See `CitableDocument`. Defaults to `DOCKET_WINDOW`.
+
+    Returns:
+        GuardedExtraction: Occurrences and diagnostics
+    """  # noqa: E501
+    budget = ExtractionBudget(limit_seconds=seconds, limit_steps=steps)
+    profiler = StageProfiler()
+    document = CitableDocument(text, window=window, profiler=profiler, budget=budget)
+    occurrences = list(document.iter_occurrences())
+    return GuardedExtraction(
+        occurrences,
+        GuardDiagnostics(
+            complete=budget.stage is None,
+            reached=document.reached,
+            elapsed=budget.elapsed,
+            steps=budget.steps,
+            stage=budget.stage,
+            category=slowest_category(profiler),
+            stages=profiler.to_dict(),
+        ),
+    )
@@ -7,14 +7,21 @@ be useful evidence, but it is not a transitive Python equality relation.
 import hashlib
 import logging
 from dataclasses import dataclass, replace
+from dataclasses import field as dataclass_field
 from datetime import date
-from functools import lru_cache
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable, Literal
 
 from citation_date import DOCKET_DATE_FORMAT
 from citation_report import Report
 
 from .dockets import Docket, DocketCategory
+from .lru import CacheInfo, LRUCache
+
+if TYPE_CHECKING:
+    from .profiling import StageProfiler
+
+REPORT_DISPLAY_CACHE_SIZE = 65_536
+"""Report strings whose display form `display_report()` keeps, by default."""
 
 
 @dataclass(slots=True)
@@ -26,6 +33,10 @@ class CitationParts:
     scra: str | None = None
     offg: str | None = None
     start: int = -1
+    displayed: bool = False
+    """Whether `phil`, `scra` and `offg` are already the display forms of their
+    reports, i.e. what `display_report()` would give, as when they were read
+    off the `Report` models found during extraction."""
 
     @property
     def docket_key(self) -> tuple[str, str, str] | None:
@@ -49,6 +60,17 @@ class CitationParts:
         )
 
 
+OccurrenceKeyScheme = Literal["sha256", "blake2b", "tuple"]
+"""How `CitationOccurrence.key()` identifies an occurrence:
+
+Scheme | Key | Use
+:--|:--|:--
+`sha256` | 64 hex digits | stable ids to persist; the `occurrence_key`
+`blake2b` | 32 hex digits, a 128-bit BLAKE2b digest | shorter stable ids
+`tuple` | the fields themselves | deduplication within a process, without hashing
+"""
+
+
 @dataclass(frozen=True, slots=True)
 class CitationOccurrence:
     """One lossless, source-ordered citation occurrence."""
@@ -62,25 +84,77 @@ class CitationOccurrence:
     phil: str | None = None
     scra: str | None = None
     offg: str | None = None
+    _keys: dict[str, str | tuple] | None = dataclass_field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The `key()` of each scheme asked for, created on the first call."""
 
     @property
     def occurrence_key(self) -> str:
-        identity = "\0".join(
-            (
-                str(self.start),
-                str(self.end),
+        """The `sha256` `key()`."""
+        return self.key("sha256")  # type: ignore[return-value]
+
+    def key(self, scheme: OccurrenceKeyScheme = "sha256") -> str | tuple:
+        """A key of the offsets, raw text and parsed fields of this occurrence,
+        computed once per `scheme`.
+
+        Examples:
+            >>> item = CitationOccurrence("100 SCRA 1", 0, 10, scra="100 SCRA 1")
+            >>> item.key("tuple")
+            (0, 10, '100 SCRA 1', None, None, None, None, '100 SCRA 1', None)
+            >>> item.key("blake2b")
+            '1122422204b9460f2ea7ab8944615095'
+            >>> item.key() == item.occurrence_key
+            True
+
+        Args:
+            scheme (OccurrenceKeyScheme, optional): See `OccurrenceKeyScheme`. Defaults to "sha256".
+
+        Returns:
+            str | tuple: A hex digest, or the fields for the `tuple` scheme
+        """  # noqa: E501
+        keys = self._keys
+        if keys is None:
+            keys = {}
+            object.__setattr__(self, "_keys", keys)
+        elif (cached := keys.get(scheme)) is not None:
+            return cached
+        if scheme == "tuple":
+            value: str | tuple = (
+                self.start,
+                self.end,
                 self.raw_text,
-                self.category.name if self.category else "",
-                self.serial or "",
-                self.docket_date.isoformat() if self.docket_date else "",
-                self.phil or "",
-                self.scra or "",
-                self.offg or "",
+                self.category.name if self.category else None,
+                self.serial,
+                self.docket_date,
+                self.phil,
+                self.scra,
+                self.offg,
             )
-        )
-        return hashlib.sha256(identity.encode()).hexdigest()
+        else:
+            identity = "\0".join(
+                (
+                    str(self.start),
+                    str(self.end),
+                    self.raw_text,
+                    self.category.name if self.category else "",
+                    self.serial or "",
+                    self.docket_date.isoformat() if self.docket_date else "",
+                    self.phil or "",
+                    self.scra or "",
+                    self.offg or "",
+                )
+            ).encode()
+            if scheme == "sha256":
+                value = hashlib.sha256(identity).hexdigest()
+            elif scheme == "blake2b":
+                value = hashlib.blake2b(identity, digest_size=16).hexdigest()
+            else:
+                raise ValueError(f"Unknown occurrence key scheme {scheme!r}")
+        keys[scheme] = value
+        return value
 
-    def to_parts(self) -> CitationParts:
+    def to_parts(self, displayed: bool = False) -> CitationParts:
         return CitationParts(
             category=self.category,
             serial=self.serial,
@@ -89,6 +163,7 @@ class CitationOccurrence:
             scra=self.scra,
             offg=self.offg,
             start=self.start,
+            displayed=displayed,
         )
 
 
@@ -106,6 +181,7 @@ class CitationGroup:
             current = getattr(self.parts, field)
             if incoming and not current:
                 setattr(self.parts, field, incoming)
+                self.parts.displayed = self.parts.displayed and other.displayed
             elif incoming and current and incoming.casefold() != current.casefold():
                 logging.warning(
                     "Conflicting %s evidence for %s; retaining first-seen %r over %r",
@@ -116,13 +192,22 @@ class CitationGroup:
                 )
 
 
-def aggregate_occurrences(occurrences: Iterable[CitationParts]) -> list[CitationGroup]:
+def aggregate_occurrences(
+    occurrences: Iterable[CitationParts], profiler: "StageProfiler | None" = None
+) -> list[CitationGroup]:
     """Aggregate ordered source occurrences into deterministic normalized groups.
 
     Docket triples are primary identities.  A report-only occurrence can enrich
     a docket only if that qualified report identity is attached to exactly one
     docket identity in the same document.
+
+    A `profiler` records the aggregation, apart from producing `occurrences`,
+    as its `aggregate` stage.
     """
+    if profiler:
+        occurrences = list(occurrences)
+        with profiler.stage("aggregate"):
+            return aggregate_occurrences(occurrences)
     keyed_items = [(item, item.docket_key, item.report_keys) for item in occurrences]
     docket_groups: dict[tuple[str, str, str], CitationGroup] = {}
     report_to_dockets: dict[tuple[str, str], set[tuple[str, str, str]]] = {}
@@ -164,16 +249,58 @@ def aggregate_occurrences(occurrences: Iterable[CitationParts]) -> list[Citation
     )
 
 
-@lru_cache(maxsize=4096)
-def display_report(raw: str | None, field: str) -> str | None:
-    if not raw:
-        return None
+def _display_form(raw: str, field: str) -> str | None:
     report = next(Report.extract_reports(raw), None)
     if not report:
-        return raw
+        return None
     if field == "offg":
-        return report.qualified_offg or raw
-    return getattr(report, field) or raw
+        return report.qualified_offg
+    return getattr(report, field)
+
+
+_display_cache = LRUCache(_display_form, REPORT_DISPLAY_CACHE_SIZE)
+
+
+def report_display_form(raw: str, field: str) -> str | None:
+    """The `field` of the first `Report` in `raw`, e.g. `"100 Phil. 100"` for
+    `"100 phil. 100"`, or `None` if there is none; `offg` is qualified.
+    Results are kept in a bounded cache; see `configure_report_display_cache()`."""
+    return _display_cache(raw, field)
+
+
+def display_report(raw: str | None, field: str) -> str | None:
+    """`report_display_form()`, or `raw` itself if it has no report."""
+    if not raw:
+        return None
+    return _display_cache(raw, field) or raw
+
+
+# `display_report` keeps the cache attributes of a `functools.lru_cache`
+display_report.cache_info = _display_cache.cache_info  # type: ignore[attr-defined]
+display_report.cache_clear = _display_cache.cache_clear  # type: ignore[attr-defined]
+
+
+def report_display_cache_info() -> CacheInfo:
+    """Statistics of the `report_display_form()` cache since it was last
+    configured or cleared.
+
+    Examples:
+        >>> configure_report_display_cache(2)
+        >>> [display_report(raw, "scra") for raw in ("1 scra 1", "2 scra 2", "1 scra 1", "3 scra 3")]
+        ['1 SCRA 1', '2 SCRA 2', '1 SCRA 1', '3 SCRA 3']
+        >>> report_display_cache_info()
+        CacheInfo(hits=1, misses=3, evictions=1, currsize=2, maxsize=2)
+        >>> configure_report_display_cache()
+    """  # noqa: E501
+    return _display_cache.cache_info()
+
+
+def configure_report_display_cache(
+    maxsize: int | None = REPORT_DISPLAY_CACHE_SIZE,
+) -> None:
+    """Empty the `report_display_form()` cache and let it hold up to `maxsize`
+    reports; see `LRUCache.configure()`."""
+    _display_cache.configure(maxsize)
 
 
 def render_parts(parts: CitationParts) -> str:
@@ -0,0 +1,229 @@
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from citation_report import normalize_report_text
+
+from .dockets import DOCKET_DATE_PATTERN
+from .document import DOCKET_WINDOW, CitableDocument
+from .identity import CitationOccurrence, CitationParts
+
+SEAM_GUARD = 100
+"""Characters at each end of a re-scanned region whose occurrences are not used,
+since they may lack the context, e.g. a preceding docket, that the full text has.
+Longer than a report tail and the implicit GR ownership look-behind."""
+
+
+def _shift(item: CitationOccurrence, delta: int) -> CitationOccurrence:
+    if not delta:
+        return item
+    # positional rather than `dataclasses.replace()`, which is several times slower
+    return CitationOccurrence(
+        item.raw_text,
+        item.start + delta,
+        item.end + delta,
+        item.category,
+        item.serial,
+        item.docket_date,
+        item.phil,
+        item.scra,
+        item.offg,
+    )
+
+
+def _seam(position: int, occurrences: list[CitationOccurrence], forward: bool) -> int:
+    """Move `position` forward (or backward) until no occurrence crosses it."""
+    crossing = True
+    while crossing:
+        crossing = False
+        for item in occurrences:
+            if item.start < position < item.end:
+                position = item.end if forward else item.start
+                crossing = True
+    return position
+
+
+@dataclass
+class IncrementalDocument:
+    """Keeps the `CitableDocument.iter_occurrences()` of a text current across
+    edits, re-scanning only the region around each edit.
+
+    A docket citation ends with its date, so the region of an edit is padded by
+    `DOCKET_WINDOW` characters on each side and its ends are moved to the nearest
+    docket dates. The region is then re-scanned on its own and its occurrences
+    spliced between the kept occurrences before it and the shifted occurrences
+    after it. A splice is only made where the re-scan agrees with the kept
+    occurrences, i.e. no occurrence crosses a seam and the occurrences that
+    the edit cannot have changed are found again; otherwise the padding is
+    doubled, up to a re-scan of the whole text. The occurrences are always
+    the same as those of a new `CitableDocument` of the edited text.
+
+    Examples:
+        >>> doc = IncrementalDocument("See G.R. No. 1, Jan. 1, 2000; and 31 SCRA 562.")
+        >>> [item.raw_text for item in doc.occurrences]
+        ['G.R. No. 1, Jan. 1, 2000', '31 SCRA 562']
+        >>> doc.edit(28, 0, ", 100 SCRA 1")
+        >>> [(item.start, item.raw_text) for item in doc.occurrences]
+        [(4, 'G.R. No. 1, Jan. 1, 2000, 100 SCRA 1'), (46, '31 SCRA 562')]
+    """
+
+    text: str
+    window: int | None = field(default=None, kw_only=True)
+    occurrences: list[CitationOccurrence] = field(init=False)
+    _starts: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.text = normalize_report_text(self.text)
+        self._set(self._scan(self.text))
+
+    def _scan(self, text: str) -> list[CitationOccurrence]:
+        return list(CitableDocument(text, window=self.window).iter_occurrences())
+
+    def _set(self, occurrences: list[CitationOccurrence]) -> None:
+        self.occurrences = occurrences
+        self._starts = [item.start for item in occurrences]
+
+    def iter_occurrences(self) -> Iterator[CitationOccurrence]:
+        yield from self.occurrences
+
+    def iter_parts(self) -> Iterator[CitationParts]:
+        """Like `CitableDocument.iter_parts()`, reports in display form."""
+        for occurrence in self.occurrences:
+            yield occurrence.to_parts(displayed=True)
+
+    def edit(self, offset: int, deleted: int, inserted: str) -> None:
+        """Replace `deleted` characters at `offset` of `text` with `inserted`.
+
+        Args:
+            offset (int): Position of the edit in the current `text`
+            deleted (int): Number of characters removed at `offset`
+            inserted (str): Text added at `offset`
+        """
+        if not (0 <= offset and 0 <= deleted and offset + deleted <= len(self.text)):
+            raise ValueError(f"Edit {offset=} {deleted=} outside of text.")
+        inserted = normalize_report_text(inserted)
+        text = self.text[:offset] + inserted + self.text[offset + deleted :]
+        lo, hi, old_end = offset, offset + len(inserted), offset + deleted
+        if not unicodedata.is_normalized("NFC", text[max(0, lo - 1) : hi + 1]):
+            self.text = normalize_report_text(text)
+            self._set(self._scan(self.text))
+            return
+        self.text = text
+
+        # occurrences ending before `settled` cannot be changed by the edit; the
+        # others before its end are dirty, with their extent in the edited text
+        delta, settled = len(inserted) - deleted, lo - SEAM_GUARD
+        index = bisect_left(self._starts, lo)
+        left, right, dirty_start, dirty_end = [], [], lo, hi
+        for item in self.occurrences[:index]:
+            if item.end < settled:
+                left.append(item)
+            else:
+                dirty_start = min(dirty_start, item.start)
+                dirty_end = max(
+                    dirty_end, item.end + delta if item.end > old_end else hi
+                )
+        for item in self.occurrences[index:]:
+            if item.start > old_end:
+                right.append(_shift(item, delta))
+            elif item.end > old_end:
+                dirty_end = max(dirty_end, item.end + delta)
+
+        pad = DOCKET_WINDOW
+        while True:
+            start, end = self._region(text, lo, hi, pad)
+            found = [_shift(item, start) for item in self._scan(text[start:end])]
+            if (start, end) == (0, len(text)):
+                self._set(found)
+                return
+            spliced = self._splice(
+                left,
+                found,
+                right,
+                (start, end, len(text)),
+                (dirty_start, dirty_end),
+                settled,
+            )
+            if spliced is not None:
+                self._set(spliced)
+                return
+            pad *= 2
+
+    @staticmethod
+    def _region(text: str, lo: int, hi: int, pad: int) -> tuple[int, int]:
+        """Pad the edited `text[lo:hi]` by `pad`, then move the start back to the
+        end of a preceding docket date and the end forward past a following one."""
+        start = max(0, lo - pad)
+        if start:
+            dates = list(DOCKET_DATE_PATTERN.finditer(text, max(0, start - pad), start))
+            start = dates[-1].end() if dates else start
+        end = min(len(text), hi + pad)
+        if end < len(text):
+            date = DOCKET_DATE_PATTERN.search(text, end, end + pad)
+            end = min(len(text), (date.end() if date else end) + SEAM_GUARD)
+        return start, end
+
+    @staticmethod
+    def _splice(
+        left: list[CitationOccurrence],
+        found: list[CitationOccurrence],
+        right: list[CitationOccurrence],
+        region: tuple[int, int, int],
+        dirty: tuple[int, int],
+        settled: int,
+    ) -> list[CitationOccurrence] | None:
+        """Join the occurrences kept `left` of the edit, the occurrences `found` by
+        re-scanning the `region` and the shifted occurrences kept `right` of the
+        edit, or `None` if they disagree near the seams.
+
+        Args:
+            left (list[CitationOccurrence]): Kept occurrences, ending before `settled`
+            found (list[CitationOccurrence]): Occurrences of the re-scanned region
+            right (list[CitationOccurrence]): Kept occurrences after the edit, shifted
+            region (tuple[int, int, int]): Start and end of the re-scanned region,
+                and the length of the text
+            dirty (tuple[int, int]): Span of the edit and the occurrences it touched
+            settled (int): Occurrences that end before it are unchanged by the edit
+
+        Returns:
+            list[CitationOccurrence] | None: The occurrences of the edited text
+        """
+        (start, end, length), (dirty_start, dirty_end) = region, dirty
+        # occurrences after `reach` are neither touched by nor look behind to the edit
+        reach = max(
+            [dirty_end + SEAM_GUARD]
+            + [
+                item.end
+                for item in found
+                if item.start <= dirty_end and item.end >= dirty_start
+            ]
+        )
+        seam_start, seam_end = 0, length
+        if start:
+            near = [item for item in left if item.end > start]
+            near += [item for item in found if item.start < dirty_start]
+            seam_start = _seam(start + SEAM_GUARD, near, forward=True)
+            if seam_start > dirty_start:
+                return None
+        if end < length:
+            near = [item for item in right if item.start < end]
+            near += [item for item in found if item.end > reach]
+            seam_end = _seam(end - SEAM_GUARD, near, forward=False)
+            if seam_end < reach:
+                return None
+        if [item for item in left if item.start >= seam_start] != [
+            item
+            for item in found
+            if seam_start <= item.start < dirty_start and item.end < settled
+        ]:
+            return None
+        if [item for item in right if reach <= item.start < seam_end] != [
+            item for item in found if reach <= item.start < seam_end
+        ]:
+            return None
+        return [
+            *(item for item in left if item.start < seam_start),
+            *(item for item in found if seam_start <= item.start < seam_end),
+            *(item for item in right if item.start >= seam_end),
+        ]
@@ -0,0 +1,321 @@
+"""Corpus-level inverted lookup of citation identities.
+
+The identities are those of `CitationParts.docket_key` and `report_keys`. The
+report-to-docket rule of `aggregate_occurrences()` is applied across the whole
+corpus: a report-only occurrence stands for a docket only if that report is
+attached to exactly one docket identity in any indexed document.
+"""
+
+import datetime
+import gzip
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+from .columns import OccurrenceTable
+from .dockets import DocketCategory
+from .document import CitableDocument
+from .identity import CitationOccurrence
+
+DocketKey = tuple[str, str, str]
+ReportKey = tuple[str, str]
+CitationKey = DocketKey | ReportKey
+
+INDEX_FORMAT = "citation-utils/index"
+INDEX_VERSION = 1
+INDEX_FIELDS = (
+    "raw_text",
+    "category",
+    "serial",
+    "docket_date",
+    "phil",
+    "scra",
+    "offg",
+)
+"""The string fields of a `CitationOccurrence`, stored as indexes into a table."""
+
+
+def link_dockets(
+    dockets: tuple[DocketKey, ...], *more: DocketKey
+) -> tuple[DocketKey, ...]:
+    """The distinct dockets that carry a report, up to two: `dockets` and then
+    any of `more` not among them. Partial links combine in any order.
+
+    Examples:
+        >>> link_dockets((), ("gr", "1", "2000-01-01"), ("gr", "1", "2000-01-01"))
+        (('gr', '1', '2000-01-01'),)
+        >>> len(link_dockets((("gr", "1", "2000-01-01"),), ("gr", "2", "2001-02-02"), ("gr", "3", "2003-03-03")))
+        2
+    """  # noqa: E501
+    for docket in more:
+        if len(dockets) < 2 and docket not in dockets:
+            dockets = (*dockets, docket)
+    return dockets
+
+
+def linked_docket(dockets: tuple[DocketKey, ...]) -> DocketKey | None:
+    """The docket that a report stands for: the only one that carries it. A
+    report carried by two dockets stands for neither."""
+    return dockets[0] if len(dockets) == 1 else None
+
+
+@dataclass
+class CitationIndex:
+    """Inverted lookup of the citation identities of many documents.
+
+    The occurrences of each added document are kept in an `OccurrenceTable`,
+    together with the posting lists of the documents in which each docket and
+    report identity occurs. `cited_by()` only reads those lists; `cites()` and
+    `occurrences()` read the rows of one document back from the table.
+
+    Examples:
+        >>> index = CitationIndex.from_sources(
+        ...     [
+        ...         ("a", "G.R. No. 1, Jan. 1, 2000, 100 SCRA 1"),
+        ...         ("b", "As held in 100 SCRA 1, ..."),
+        ...         ("c", "A.M. No. 2, Feb. 2, 2001"),
+        ...     ]
+        ... )
+        >>> index.cited_by(("gr", "1", "2000-01-01"))
+        ['a', 'b']
+        >>> index.cites("b")
+        {('gr', '1', '2000-01-01'): 1}
+    """
+
+    window: int | None = field(default=None, kw_only=True)
+    _table: OccurrenceTable = field(
+        default_factory=OccurrenceTable, init=False, repr=False
+    )
+    _positions: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _dockets: dict[DocketKey, list[int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _reports: dict[ReportKey, list[int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _standalone: dict[ReportKey, list[int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _report_dockets: dict[ReportKey, tuple[DocketKey, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _docket_reports: dict[DocketKey, set[ReportKey]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @property
+    def _ids(self) -> list[str]:
+        return self._table.documents  # type: ignore[return-value]
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, document_id: object) -> bool:
+        return document_id in self._positions
+
+    @classmethod
+    def from_sources(
+        cls, sources: Iterable[tuple[str, str]], window: int | None = None
+    ) -> Self:
+        """Index each `(document id, text)` pair of `sources` in order."""
+        index = cls(window=window)
+        for document_id, text in sources:
+            index.add(document_id, text)
+        return index
+
+    def add(self, document_id: str, text: str) -> None:
+        """Index the occurrences of `CitableDocument(text).iter_occurrences()`.
+
+        Args:
+            document_id (str): Unique identifier of the document
+            text (str): Text of the document
+        """
+        occurrences = CitableDocument(text, window=self.window).iter_occurrences()
+        self.add_occurrences(document_id, occurrences)
+
+    def add_occurrences(
+        self, document_id: str, occurrences: Iterable[CitationOccurrence]
+    ) -> None:
+        """Index the already extracted `occurrences` of a document.
+
+        Args:
+            document_id (str): Unique identifier of the document
+            occurrences (Iterable[CitationOccurrence]): Its source-ordered occurrences
+        """  # noqa: E501
+        if document_id in self._positions:
+            raise ValueError(f"Document {document_id!r} is already indexed.")
+        position = len(self._ids)
+        items = tuple(occurrences)
+        for item in items:
+            parts = item.to_parts()
+            docket_key, report_keys = parts.docket_key, parts.report_keys
+            for report_key in report_keys:
+                self._post(self._reports, report_key, position)
+            if docket_key:
+                self._post(self._dockets, docket_key, position)
+                for report_key in report_keys:
+                    self._report_dockets[report_key] = link_dockets(
+                        self._report_dockets.get(report_key, ()), docket_key
+                    )
+                    self._docket_reports.setdefault(docket_key, set()).add(report_key)
+            elif len(report_keys) == 1:
+                self._post(self._standalone, report_keys[0], position)
+        self._positions[document_id] = position
+        self._table.extend(items, document_id)
+
+    @staticmethod
+    def _post(postings: dict[Any, list[int]], key: Any, position: int) -> None:
+        documents = postings.setdefault(key, [])
+        if not documents or documents[-1] != position:
+            documents.append(position)
+
+    def resolve(self, key: CitationKey) -> CitationKey:
+        """The docket identity of a report `key` attached to exactly one docket in
+        the corpus; otherwise `key` itself."""
+        if len(key) == 2:
+            dockets = self._report_dockets.get(key, ())  # type: ignore[arg-type]
+            return linked_docket(dockets) or key
+        return key
+
+    def cited_by(self, key: CitationKey) -> list[str]:
+        """The ids of the documents citing `key`, in the order they were added.
+
+        A docket is cited by the documents with an occurrence of it and by those
+        with a report-only occurrence of a report that identifies it. A report
+        that identifies no single docket is cited by the documents with any
+        occurrence of it.
+
+        Args:
+            key (CitationKey): A `docket_key`, e.g. `("gr", "1", "2000-01-01")`,
+                or one of the `report_keys`, e.g. `("scra", "100 scra 1")`
+
+        Returns:
+            list[str]: Document ids
+        """
+        key = self.resolve(key)
+        if len(key) == 2:
+            return [self._ids[item] for item in self._reports.get(key, [])]  # type: ignore[arg-type]
+        positions = set(self._dockets.get(key, []))  # type: ignore[arg-type]
+        for report_key in self._docket_reports.get(key, ()):  # type: ignore[arg-type]
+            if linked_docket(self._report_dockets[report_key]):
+                positions.update(self._standalone.get(report_key, []))
+        return [self._ids[item] for item in sorted(positions)]
+
+    def cites(self, document_id: str) -> dict[CitationKey, int]:
+        """The identities cited by a document and their number of occurrences, in
+        the order first seen. A report-only occurrence counts towards the docket it
+        identifies; occurrences that `aggregate_occurrences()` would skip, i.e.
+        without a docket identity or a single report, are not counted.
+
+        Args:
+            document_id (str): Id of an added document
+
+        Returns:
+            dict[CitationKey, int]: Docket and standalone report identities
+        """  # noqa: E501
+        cited: dict[CitationKey, int] = {}
+        for item in self.occurrences(document_id):
+            parts = item.to_parts()
+            docket_key, report_keys = parts.docket_key, parts.report_keys
+            if docket_key:
+                key: CitationKey = docket_key
+            elif len(report_keys) == 1:
+                key = self.resolve(report_keys[0])
+            else:
+                continue
+            cited[key] = cited.get(key, 0) + 1
+        return cited
+
+    def occurrences(self, document_id: str) -> tuple[CitationOccurrence, ...]:
+        """The source-ordered occurrences of an added document, built from its
+        rows in the table."""
+        if document_id not in self._positions:
+            raise KeyError(document_id)
+        return tuple(self._table.iter_document(document_id))
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to `path` as gzip-compressed JSON.
+
+        Each distinct string is stored once in a table. An occurrence is a row of
+        `start`, `end` and the table position of each of its `INDEX_FIELDS`, with
+        0 for an empty field. The posting lists are rebuilt by `load()`.
+
+        Args:
+            path (str | Path): File to write
+        """
+        strings: dict[str, int] = {"": 0}
+
+        def intern(value: Any) -> int:
+            if value is None:
+                return 0
+            if isinstance(value, datetime.date):
+                value = value.isoformat()
+            elif isinstance(value, DocketCategory):
+                value = value.name
+            return strings.setdefault(value, len(strings))
+
+        documents = [
+            [
+                document_id,
+                [
+                    [item.start, item.end]
+                    + [intern(getattr(item, name)) for name in INDEX_FIELDS]
+                    for item in self._table.iter_document(document_id)
+                ],
+            ]
+            for document_id in self._ids
+        ]
+        data = {
+            "format": INDEX_FORMAT,
+            "version": INDEX_VERSION,
+            "window": self.window,
+            "strings": list(strings),
+            "documents": documents,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as fp:
+            json.dump(data, fp, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """Read an index written by `save()`.
+
+        Args:
+            path (str | Path): File to read
+
+        Returns:
+            Self: The index, with the same documents and lookups
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as fp:
+            data = json.load(fp)
+        if data.get("format") != INDEX_FORMAT or data.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path} is not a version {INDEX_VERSION} index.")
+        strings = [value or None for value in data["strings"]]
+        dates = {
+            value: datetime.date.fromisoformat(value)
+            for value in {
+                strings[row[5]] for _, rows in data["documents"] for row in rows
+            }
+            if value
+        }
+        index = cls(window=data["window"])
+        for document_id, rows in data["documents"]:
+            index.add_occurrences(
+                document_id,
+                (
+                    CitationOccurrence(
+                        strings[raw_text] or "",
+                        start,
+                        end,
+                        DocketCategory[strings[category]] if category else None,
+                        strings[serial],
+                        dates.get(strings[docket_date]),  # type: ignore[arg-type]
+                        strings[phil],
+                        strings[scra],
+                        strings[offg],
+                    )
+                    for start, end, raw_text, category, serial, docket_date, phil, scra, offg in rows  # noqa: E501
+                ),
+            )
+        return index
@@ -0,0 +1,94 @@
+"""A least-recently-used cache of a function that can be resized at run time.
+
+`functools.lru_cache` fixes its size when it wraps a function and reports no
+evictions; `LRUCache` counts each eviction as it happens. The counts stay exact
+when threads miss the same key at once: both calls count as misses, but only
+the first result is stored.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int | None
+
+
+@dataclass
+class LRUCache(Generic[T]):
+    """Remember `func` of up to `maxsize` distinct positional arguments, least
+    recently used first out; `None` is unbounded and `0` disables caching.
+
+    Examples:
+        >>> cache = LRUCache(str.upper, maxsize=2)
+        >>> [cache(text) for text in ("a", "b", "a", "c")]
+        ['A', 'B', 'A', 'C']
+        >>> cache.cache_info()
+        CacheInfo(hits=1, misses=3, evictions=1, currsize=2, maxsize=2)
+        >>> cache.configure(None)
+        >>> cache.cache_info()
+        CacheInfo(hits=0, misses=0, evictions=0, currsize=0, maxsize=None)
+    """
+
+    func: Callable[..., T]
+    maxsize: int | None = 128
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    evictions: int = field(default=0, init=False)
+    _entries: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __call__(self, *args: Hashable) -> T:
+        with self._lock:
+            entries = self._entries
+            value = entries.get(args, _MISSING)
+            if value is not _MISSING:
+                entries.move_to_end(args)
+                self.hits += 1
+                return value  # type: ignore[return-value]
+            self.misses += 1
+        value = self.func(*args)
+        with self._lock:
+            # skipped if `configure()` or `cache_clear()` ran meanwhile
+            if entries is self._entries and self.maxsize != 0 and args not in entries:
+                entries[args] = value
+                if self.maxsize is not None and len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        """Statistics since the cache was last configured or cleared."""
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self._entries),
+                self.maxsize,
+            )
+
+    def cache_clear(self) -> None:
+        """Empty the cache and reset its statistics."""
+        self.configure(self.maxsize)
+
+    def configure(self, maxsize: int | None) -> None:
+        """Empty the cache, reset its statistics and hold up to `maxsize` entries
+        from now on. Calls from other threads keep working throughout."""
+        with self._lock:
+            self.maxsize = maxsize
+            self.hits = self.misses = self.evictions = 0
+            self._entries = OrderedDict()
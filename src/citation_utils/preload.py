@@ -0,0 +1,12 @@
+"""Importing this module compiles every docket and report pattern.
+
+The fork server of the `fork` batch backend imports it once, before it forks
+any worker, so that the workers share the imported modules and compiled
+patterns with the server rather than each build its own; see `BatchBackend`.
+"""
+
+from .citation import warm_up
+from .dockets import docket_scanner
+
+warm_up()
+docket_scanner.precompile()
@@ -0,0 +1,98 @@
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TypeVar
+
+T = TypeVar("T")
+
+PROMETHEUS_PREFIX = "citation_utils_stage"
+
+
+@dataclass
+class StageProfiler:
+    """Accumulates the time and the number of calls of each extraction stage.
+
+    Pass one to `CitableDocument(text, profiler=...)` and, for the aggregation of
+    its occurrences, to `aggregate_occurrences(..., profiler=...)`. The same
+    profiler can be passed to many documents to total their stages.
+
+    Stage | Time spent in
+    :--|:--
+    `normalize` | `normalize_report_text()`
+    `dockets.dates` | finding docket dates, i.e. the prefilter or the `window` intervals
+    `dockets.hint` | the single pass over the hint patterns of every docket style
+    `dockets.search` | the alternation of the hinted docket styles
+    `dockets.match.<category>` | a style's own anchored match and its `detect_match()`
+    `dockets.implicit_gr_owner` | `_implicit_gr_is_owned()` checks
+    `span_index` | building a `_SpanIndex`
+    `reports` | the report pattern and report identities
+    `occurrences.merge` | the source-ordered merge of `iter_occurrences()`
+    `aggregate` | `aggregate_occurrences()`
+
+    Stages do not overlap, so their times can be summed.
+
+    Examples:
+        >>> from citation_utils import CitableDocument
+        >>> profiler = StageProfiler()
+        >>> document = CitableDocument("G.R. No. 1, Jan. 1, 2000", profiler=profiler)
+        >>> len(list(document.iter_occurrences()))
+        1
+        >>> profiler.to_dict()["dockets.match.GR"]["calls"]
+        1
+        >>> print(profiler.to_prometheus().splitlines()[0])
+        # HELP citation_utils_stage_seconds_total Seconds spent in each stage.
+    """  # noqa: E501
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+
+    def add(self, stage: str, seconds: float, calls: int = 1) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one call of stage `name`."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - start)
+
+    def iterate(self, name: str, items: Iterable[T]) -> Iterator[T]:
+        """Yield from `items`, timing only the work of producing each item as stage
+        `name`, not that of the consumer; one call per item."""
+        iterator = iter(items)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(name, perf_counter() - start, 0)
+                return
+            self.add(name, perf_counter() - start)
+            yield item
+
+    def to_dict(self) -> dict[str, dict[str, float | int]]:
+        """The `seconds` and `calls` of each stage, in the order first recorded."""
+        return {
+            stage: {"seconds": seconds, "calls": self.calls[stage]}
+            for stage, seconds in self.seconds.items()
+        }
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """The stages in the Prometheus text exposition format, as two counters
+        labelled by `stage`: `<prefix>_seconds_total` and `<prefix>_calls_total`."""
+        lines = []
+        for metric, description, values in (
+            ("seconds_total", "Seconds spent in each stage.", self.seconds),
+            ("calls_total", "Calls of each stage.", self.calls),
+        ):
+            name = f"{prefix}_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} counter")
+            for stage, value in values.items():
+                label = stage.replace("\\", r"\\").replace('"', r"\"")
+                lines.append(f'{name}{{stage="{label}"}} {value}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,257 @@
+"""Write citations of many documents to SQLite and run the review queries of the
+SQLite analysis guide over them.
+
+The `dockets` table holds one row per decision, keyed by the `Citation.set_slug()`
+of its `cat`, `num` and `date`; `citations` holds the `CountedCitation` rows of
+each document and `occurrences` every `CitationOccurrence`, so that a flagged
+row can be traced back to its source text.
+"""
+
+import sqlite3
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .citation import dump_parts
+from .document import CitableDocument
+from .identity import aggregate_occurrences
+
+SQLITE_BATCH_SIZE = 500
+"""Documents written per transaction by `export_sources()`."""
+
+SCHEMA = """
+create table if not exists documents (
+    id primary key
+);
+create table if not exists dockets (
+    id text primary key, -- `Citation.set_slug()`, e.g. gr-1-2000-01-01
+    cat text not null,
+    num text not null,
+    date text not null,
+    phil text,
+    scra text,
+    offg text
+);
+create table if not exists citations (
+    document_id not null references documents (id),
+    docket_id text references dockets (id),
+    cat text,
+    num text,
+    date text,
+    phil text,
+    scra text,
+    offg text,
+    mentions integer not null
+);
+create index if not exists citations_docket on citations (docket_id);
+create table if not exists occurrences (
+    document_id not null references documents (id),
+    docket_id text references dockets (id),
+    start integer not null,
+    "end" integer not null,
+    raw_text text not null,
+    cat text,
+    num text,
+    date text,
+    phil text,
+    scra text,
+    offg text
+);
+"""
+
+INSERT_DOCUMENT = "insert into documents (id) values (?)"
+UPSERT_DOCKET = """
+insert into dockets (id, cat, num, date, phil, scra, offg)
+values (?, ?, ?, ?, ?, ?, ?)
+on conflict (id) do update set
+    phil = coalesce(phil, excluded.phil),
+    scra = coalesce(scra, excluded.scra),
+    offg = coalesce(offg, excluded.offg)
+"""
+INSERT_CITATION = "insert into citations values (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+INSERT_OCCURRENCE = "insert into occurrences values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+def connect(path: str | Path = ":memory:", wal: bool = True) -> sqlite3.Connection:
+    """Open a database at `path` with the citation tables.
+
+    Args:
+        path (str | Path, optional): Database file. Defaults to an in-memory database.
+        wal (bool, optional): Use write-ahead logging, with `synchronous=NORMAL`. Defaults to True.
+
+    Returns:
+        sqlite3.Connection: The open connection
+    """  # noqa: E501
+    conn = sqlite3.connect(path)
+    if wal:
+        conn.execute("pragma journal_mode = wal")
+        conn.execute("pragma synchronous = normal")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def make_slug(cat: str | None, num: str | None, date: str | None) -> str | None:
+    """The `Citation.set_slug()` of dumped `cat`, `num` and `date` values.
+
+    Examples:
+        >>> make_slug("gr", "138570", "2000-10-10")
+        'gr-138570-2000-10-10'
+        >>> make_slug(None, None, None) is None
+        True
+    """
+    if cat and num and date:
+        return f"{cat}-{num}-{date}"
+    return None
+
+
+def export_sources(
+    conn: sqlite3.Connection,
+    sources: Iterable[tuple[str | int, str]],
+    window: int | None = None,
+    occurrences: bool = True,
+    batch_size: int = SQLITE_BATCH_SIZE,
+) -> int:
+    """Write the citations of each `(document id, text)` pair of `sources`.
+
+    The rows of `batch_size` documents are inserted with `executemany()` in one
+    transaction. A docket cited by several documents is stored once, with the
+    first report of each kind that is found for it.
+
+    Examples:
+        >>> conn = connect()
+        >>> export_sources(conn, [("a", "G.R. No. 1, Jan. 1, 2000"), ("b", "G.R. No. 1, Jan. 1, 2000, 100 SCRA 1")])
+        2
+        >>> conn.execute("select * from dockets").fetchall()
+        [('gr-1-2000-01-01', 'gr', '1', '2000-01-01', None, '100 scra 1', None)]
+
+    Args:
+        conn (sqlite3.Connection): A connection from `connect()`
+        sources (Iterable[tuple[str | int, str]]): Pairs of a document id, stored as the `documents.id` value, and its text
+        window (int | None, optional): See `CitableDocument`. Defaults to None.
+        occurrences (bool, optional): Also write every occurrence. Defaults to True.
+        batch_size (int, optional): Documents per transaction. Defaults to `SQLITE_BATCH_SIZE`.
+
+    Returns:
+        int: Number of documents written
+    """  # noqa: E501
+    rows: dict[str, list[tuple[Any, ...]]] = {
+        INSERT_DOCUMENT: [],
+        UPSERT_DOCKET: [],
+        INSERT_CITATION: [],
+        INSERT_OCCURRENCE: [],
+    }
+    written = 0
+    for document_id, text in sources:
+        items = list(CitableDocument(text, window=window).iter_occurrences())
+        rows[INSERT_DOCUMENT].append((document_id,))
+        for group in aggregate_occurrences(item.to_parts() for item in items):
+            dumped = dump_parts(group.parts)
+            slug = make_slug(*dumped[:3])
+            if slug:
+                rows[UPSERT_DOCKET].append((slug, *dumped))
+            rows[INSERT_CITATION].append((document_id, slug, *dumped, group.mentions))
+        if occurrences:
+            for item in items:
+                dumped = dump_parts(item.to_parts())
+                rows[INSERT_OCCURRENCE].append(
+                    (
+                        document_id,
+                        make_slug(*dumped[:3]),
+                        item.start,
+                        item.end,
+                        item.raw_text,
+                        *dumped,
+                    )
+                )
+        written += 1
+        if written % batch_size == 0:
+            _write(conn, rows)
+    _write(conn, rows)
+    return written
+
+
+def _write(conn: sqlite3.Connection, rows: dict[str, list[tuple[Any, ...]]]) -> None:
+    with conn:
+        for statement, values in rows.items():
+            if values:
+                conn.executemany(statement, values)
+                values.clear()
+
+
+def same_serial(conn: sqlite3.Connection, cat: str, num: str) -> list[tuple]:
+    """The dockets of a category and serial, latest first; a valid state for
+    connected decisions, e.g. a resolution of a motion for reconsideration.
+
+    Examples:
+        >>> conn = connect()
+        >>> _ = export_sources(conn, [("a", "GR 1, Jan. 1, 2000; GR 1, Mar. 3, 2003")])
+        >>> same_serial(conn, "gr", "1")
+        [('gr', '1', '2003-03-03'), ('gr', '1', '2000-01-01')]
+    """
+    return conn.execute(
+        "select cat, num, date from dockets where cat = ? and num = ? "
+        "order by date desc",
+        (cat, num),
+    ).fetchall()
+
+
+def improprieties(conn: sqlite3.Connection) -> list[tuple]:
+    """Review queue of category and serial pairs with several docket dates, the
+    widest spans of days first. A large span suggests a typographic error in at
+    least one of the pairs; compare each with its source before correcting it.
+
+    Each row is the number of dates, `cat`, `num`, earliest and latest dates, their
+    difference in days, and JSON arrays of the dates and citing document ids.
+
+    Examples:
+        >>> conn = connect()
+        >>> _ = export_sources(conn, [("a", "GR 1, Jan. 1, 2000"), ("b", "GR 1, Jan. 1, 1950")])
+        >>> improprieties(conn)
+        [(2, 'gr', '1', '1950-01-01', '2000-01-01', 18262, '["1950-01-01","2000-01-01"]', '["a","b"]')]
+    """  # noqa: E501
+    return conn.execute(
+        """
+        select
+            count(d.date) total,
+            d.cat,
+            d.num,
+            min(d.date) earliest,
+            max(d.date) latest,
+            cast(julianday(max(d.date)) - julianday(min(d.date)) as integer) diff,
+            json_group_array(d.date) dates,
+            (
+                select json_group_array(distinct c.document_id)
+                from citations c join dockets x on c.docket_id = x.id
+                where x.cat = d.cat and x.num = d.num
+            ) origins
+        from
+            (select * from dockets order by date) d
+        group by
+            d.cat,
+            d.num
+        having
+            total >= 2
+        order by
+            diff desc, total desc
+        """
+    ).fetchall()
+
+
+def sc_administrative_matters(conn: sqlite3.Connection) -> list[tuple]:
+    """Administrative Matter dockets whose serial ends in `-sc`, latest first. Such
+    a serial is not by itself a rule; review each against its source.
+
+    Examples:
+        >>> conn = connect()
+        >>> _ = export_sources(conn, [("a", "A.M. No. 99-8-01-SC, Jan. 1, 2010")])
+        >>> sc_administrative_matters(conn)
+        [('a', 'am', '99-8-01-sc', '2010-01-01')]
+    """
+    return conn.execute(
+        """
+        select c.document_id, d.cat, d.num, d.date
+        from dockets d join citations c on c.docket_id = d.id
+        where d.cat = 'am' and d.num like '%-sc'
+        order by d.date desc
+        """
+    ).fetchall()
@@ -0,0 +1,124 @@
+import gc
+import pickle
+import random
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from citation_utils import CitableDocument, CorpusAggregator
+from citation_utils.dockets import DocketCategory
+from citation_utils.identity import CitationParts, aggregate_occurrences
+
+TEXTS = [
+    "G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; 100 SCRA 1; 5 Phil. 5",
+    "See 100 SCRA 1 and 200 SCRA 2; G.R. No. 2, Feb. 2, 2001, 200 SCRA 2",
+    "G.R. No. 3, Mar. 3, 2003, 300 SCRA 3; G.R. No. 4, Apr. 4, 2004, 300 SCRA 3",
+    "300 SCRA 3; A.M. No. RTJ-12-2317, Jan 1, 2000; 5 Phil. 5",
+]
+
+
+def summarize(groups):
+    return sorted(
+        (
+            (
+                str(group.parts.category),
+                group.parts.serial,
+                group.parts.docket_date,
+                group.parts.phil,
+                group.parts.scra,
+                group.mentions,
+            )
+            for group in groups
+        ),
+        key=repr,
+    )
+
+
+def aggregate(texts, **kwargs):
+    aggregator = CorpusAggregator(**kwargs)
+    for text in texts:
+        aggregator.add(CitableDocument(text).iter_parts())
+    return aggregator
+
+
+def test_single_document_matches_aggregate_occurrences():
+    for text in TEXTS:
+        with aggregate([text]) as aggregator:
+            assert summarize(aggregator.groups()) == summarize(
+                aggregate_occurrences(CitableDocument(text).iter_parts())
+            )
+
+
+def test_report_links_apply_across_the_corpus():
+    with aggregate(TEXTS) as aggregator:
+        groups = summarize(aggregator.groups())
+
+    assert groups == [
+        ("AM", "rtj-12-2317", date(2000, 1, 1), None, None, 1),
+        ("GR", "1", date(2000, 1, 1), None, "100 SCRA 1", 3),
+        ("GR", "2", date(2001, 2, 2), None, "200 SCRA 2", 2),
+        ("GR", "3", date(2003, 3, 3), None, "300 SCRA 3", 1),
+        ("GR", "4", date(2004, 4, 4), None, "300 SCRA 3", 1),
+        ("None", None, None, "5 Phil. 5", None, 2),
+        # 300 SCRA 3 belongs to two G.R. numbers, so its own mention stays apart
+        ("None", None, None, None, "300 SCRA 3", 1),
+    ]
+
+
+def test_spilled_partitions_give_the_same_groups(tmp_path: Path):
+    rng = random.Random(0)
+    texts = [rng.choice(TEXTS) for _ in range(40)]
+    expected = summarize(aggregate(texts).groups())
+
+    with aggregate(texts, partitions=3, max_entries=2, spill_dir=tmp_path) as spilled:
+        assert spilled._files
+        assert summarize(spilled.groups()) == expected
+        # reading the groups leaves the state unchanged
+        assert summarize(spilled.groups()) == expected
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_groups_hold_one_partition_in_memory(tmp_path: Path):
+    from citation_utils.aggregator import _DocketPartial
+
+    parts = [
+        CitationParts(DocketCategory.GR, str(serial), date(2000, 1, 1), scra=scra)
+        for serial in range(400)
+        for scra in (f"{serial} SCRA 1", None)
+    ] + [CitationParts(scra=f"{serial} SCRA 1") for serial in range(400)]
+    with CorpusAggregator(partitions=8, max_entries=50, spill_dir=tmp_path) as spill:
+        spill.add(parts)
+        peak, groups = 0, []
+        for group in spill.groups():
+            groups.append(group)
+            gc.collect()
+            held = sum(type(item) is _DocketPartial for item in gc.get_objects())
+            peak = max(peak, held)
+    assert len(groups) == 400
+    assert {group.mentions for group in groups} == {3}
+    # a partition of dockets, about 400 / 8, and fewer linked mentions than
+    # `max_entries`, rather than every linked mention of the corpus
+    assert peak < 150
+
+
+def test_merged_workers_equal_a_single_aggregator(tmp_path: Path):
+    expected = summarize(aggregate(TEXTS).groups())
+    workers = [CorpusAggregator(max_entries=1, spill_dir=tmp_path) for _ in range(2)]
+    for order, text in enumerate(TEXTS):
+        workers[order % 2].add(CitableDocument(text).iter_parts(), order=order)
+
+    merged = CorpusAggregator(spill_dir=tmp_path)
+    for worker in workers:
+        merged.merge(pickle.loads(pickle.dumps(worker)))
+    assert merged.documents == len(TEXTS)
+    assert summarize(merged.groups()) == expected
+    assert min(group.first for group in merged.groups()) == (0, 0)
+    merged.close()
+    for worker in workers:
+        worker.close()
+
+
+def test_partitions_must_agree():
+    with pytest.raises(ValueError):
+        CorpusAggregator(partitions=2).merge(CorpusAggregator(partitions=3))
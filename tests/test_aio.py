@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from citation_utils import CitableDocument, Citation, StageProfiler
+from citation_utils.aio import (
+    ExtractionCancelled,
+    _Cancellation,
+    get_executor,
+    run_cancellable,
+    set_executor,
+)
+
+TEXT = (
+    "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000; "
+    "Bar Matter No. L-363, Jan. 1, 2000; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; "
+    "31 SCRA 562"
+)
+
+
+def test_async_citations_equal_sync_ones():
+    results = asyncio.run(Citation.aextract_citations(TEXT))
+
+    assert results == list(Citation.extract_citations(TEXT))
+
+
+def test_async_occurrences_in_batches_equal_sync_ones():
+    profiler = StageProfiler()
+    document = CitableDocument(TEXT, window=400, profiler=profiler)
+
+    async def collect():
+        return [item async for item in document.aiter_occurrences(batch_size=2)]
+
+    assert asyncio.run(collect()) == list(
+        CitableDocument(TEXT, window=400).iter_occurrences()
+    )
+    assert document.profiler is profiler
+    assert profiler.calls["occurrences.merge"] > 0
+
+
+def test_cancelled_task_stops_its_worker():
+    started, stopped = threading.Event(), threading.Event()
+
+    def work(cancellation):
+        started.set()
+        try:
+            while True:
+                cancellation.add("dockets.search", 0.0)
+                time.sleep(0.001)
+        except ExtractionCancelled:
+            stopped.set()
+            raise
+
+    async def cancel():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            task = asyncio.create_task(run_cancellable(work, executor))
+            await asyncio.to_thread(started.wait)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(cancel())
+    assert stopped.wait(5)
+
+
+def test_cancellation_interrupts_an_extraction():
+    cancellation = _Cancellation()
+    cancellation.event.set()
+
+    with pytest.raises(ExtractionCancelled):
+        CitableDocument(TEXT, profiler=cancellation)
+
+
+def test_executor_can_be_replaced():
+    default = get_executor()
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        set_executor(executor)
+        assert get_executor() is executor
+        assert asyncio.run(Citation.aextract_citations("31 SCRA 562"))
+    finally:
+        set_executor(None)
+        executor.shutdown()
+    assert get_executor() is not default
+
+
+def test_only_thread_pools_can_run_the_extraction():
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=1) as executor, pytest.raises(TypeError):
+        set_executor(executor)
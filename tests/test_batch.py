@@ -0,0 +1,123 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from citation_utils import Citation, CountedCitation
+from citation_utils.dockets import DocketScanner, docket_scanner
+
+TEXTS = {
+    "bayan": "Zamora, G.R. Nos. 138570, 138572, October 10, 2000, 342 SCRA 449",
+    "empty": "",
+    "reports": "100 SCRA 1; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; 12 Phil. 24",
+    "oca": "OCA IPI No. 10-3450-P, Feb. 06, 2008; A.M. No. 123, Jan. 1, 2000",
+}
+
+
+def test_process_pool_matches_single_document_extraction() -> None:
+    citations = list(Citation.extract_citations_many(TEXTS.items(), workers=2))
+    counted = list(CountedCitation.from_sources(TEXTS.items(), workers=2, chunksize=2))
+
+    assert [key for key, _ in citations] == list(TEXTS)
+    assert [key for key, _ in counted] == list(TEXTS)
+    for key, text in TEXTS.items():
+        assert dict(citations)[key] == list(Citation.extract_citations(text))
+        assert [(str(item), item.mentions) for item in dict(counted)[key]] == [
+            (str(item), item.mentions) for item in CountedCitation.from_source(text)
+        ]
+
+
+def test_fork_server_pool_matches_single_document_extraction() -> None:
+    citations = dict(
+        Citation.extract_citations_many(TEXTS.items(), workers=2, backend="fork")
+    )
+
+    for key, text in TEXTS.items():
+        assert citations[key] == list(Citation.extract_citations(text))
+
+
+def test_thread_pool_matches_single_document_extraction() -> None:
+    texts = list(TEXTS.items()) * 25
+    citations = list(
+        Citation.extract_citations_many(texts, workers=4, backend="thread")
+    )
+    counted = list(CountedCitation.from_sources(texts, workers=4, backend="thread"))
+
+    assert [key for key, _ in citations] == [key for key, _ in texts]
+    for (key, text), (_, found), (_, counts) in zip(texts, citations, counted):
+        assert found == list(Citation.extract_citations(text))
+        assert [(str(item), item.mentions) for item in counts] == [
+            (str(item), item.mentions) for item in CountedCitation.from_source(text)
+        ]
+
+
+def test_sources_are_read_as_workers_take_them() -> None:
+    from citation_utils.citation import BATCH_PREFETCH
+
+    read = []
+
+    def sources():
+        for index in range(1000):
+            read.append(index)
+            yield index, "G.R. No. 1, Jan. 1, 2000"
+
+    results = Citation.extract_citations_many(sources(), workers=2, backend="thread")
+    next(results)
+    results.close()
+
+    assert len(read) <= 2 * (1 + BATCH_PREFETCH) + 1
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        list(Citation.extract_citations_many(TEXTS.items(), backend="fiber"))  # type: ignore[arg-type]
+
+
+def test_threads_share_one_compiled_alternation() -> None:
+    scanner = DocketScanner(docket_scanner.entries)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        patterns = set(map(id, executor.map(lambda _: scanner.pattern, range(32))))
+    assert len(patterns) == 1
+
+
+FORK_SCRIPT = """
+import logging, multiprocessing, sys
+from concurrent.futures import ProcessPoolExecutor
+
+from citation_utils import Citation
+
+
+def preloaded():
+    return "citation_utils.preload" in sys.modules
+
+
+if __name__ == "__main__":
+    multiprocessing.set_start_method("forkserver")
+    texts = [("a", "G.R. No. 1, Jan. 1, 2000")] * 2
+    if sys.argv[1] == "foreign":
+        with ProcessPoolExecutor(1) as executor:
+            executor.submit(preloaded).result()
+    else:
+        list(Citation.extract_citations_many(texts, workers=2, backend=sys.argv[1]))
+    list(Citation.extract_citations_many(texts, workers=2, backend="fork"))
+    with ProcessPoolExecutor(1) as executor:
+        print(executor.submit(preloaded).result())
+"""
+
+
+@pytest.mark.parametrize(
+    "first, shared",
+    [("fork", True), ("process", False), ("foreign", False)],
+    ids=["fork", "process", "other"],
+)
+def test_fork_backend_after_another_pool(tmp_path, first, shared) -> None:
+    script = tmp_path / "fork_after_pool.py"
+    script.write_text(FORK_SCRIPT)
+    run = subprocess.run(
+        [sys.executable, str(script), first], capture_output=True, text=True
+    )
+
+    assert run.returncode == 0, run.stderr
+    assert run.stdout.split() == [str(shared)]
+    assert ("was started without" in run.stderr) is not shared
@@ -0,0 +1,56 @@
+import logging
+import unicodedata
+from pathlib import Path
+
+from citation_utils import ByteOffsets, CitableDocument
+
+TEXT = (
+    "Señor v. Niño — “G.R. No. 1, Jan. 1, 2000, 100 SCRA 1”;\r\n"
+    "Peña, A.M. No. RTJ-12-2317, Jan. 1, 2000; ✓ 12 Phil. 24 𝔞 100 SCRA 1"
+)
+
+
+def test_from_path_matches_the_text(tmp_path: Path):
+    path = tmp_path / "decision.txt"
+    path.write_bytes(TEXT.encode())
+    document = CitableDocument.from_path(path)
+
+    assert document.text == TEXT
+    assert list(document.iter_occurrences()) == list(
+        CitableDocument(TEXT).iter_occurrences()
+    )
+    data = path.read_bytes()
+    for item in document.iter_occurrences():
+        start, end = document.byte_offsets.span(item.start, item.end)
+        assert data[start:end].decode() == item.raw_text
+        assert document.byte_offsets.to_chars(start) == item.start
+        assert document.byte_offsets.to_chars(end) == item.end
+
+
+def test_offsets_round_trip_every_character():
+    offsets = ByteOffsets.of(TEXT)
+    position = 0
+    for index, character in enumerate(TEXT):
+        assert offsets.to_bytes(index) == position
+        assert offsets.to_chars(position) == index
+        position += len(character.encode())
+    assert offsets.to_bytes(len(TEXT)) == len(TEXT.encode())
+
+
+def test_ascii_text_keeps_no_positions():
+    offsets = ByteOffsets.of("G.R. No. 1, Jan. 1, 2000")
+    assert len(offsets.chars) == 0
+    assert offsets.to_bytes(5) == offsets.to_chars(5) == 5
+
+
+def test_empty_and_unnormalized_files(tmp_path: Path, caplog):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert list(CitableDocument.from_path(empty).iter_occurrences()) == []
+
+    decomposed = tmp_path / "nfd.txt"
+    decomposed.write_bytes(unicodedata.normalize("NFD", TEXT).encode())
+    with caplog.at_level(logging.WARNING):
+        document = CitableDocument.from_path(decomposed)
+    assert "not NFC normalized" in caplog.text
+    assert document.text == TEXT
@@ -43,6 +43,21 @@ def test_category_ownership_prevents_phantom_gr_matches(fixture):
     assert [compact(citation) for citation in citations] == fixture["expected"]
 
 
+@pytest.mark.parametrize(
+    "fixture",
+    FIXTURES["normalization"] + FIXTURES["ownership"] + FIXTURES["reports"],
+)
+def test_rows_equal_model_dumps_without_building_models(fixture):
+    source = fixture["source"]
+
+    assert [row._asdict() for row in Citation.extract_rows(source)] == [
+        citation.model_dump() for citation in Citation.extract_citations(source)
+    ]
+    assert [row._asdict() for row in CountedCitation.extract_rows(source)] == [
+        citation.model_dump() for citation in CountedCitation.from_source(source)
+    ]
+
+
 @pytest.mark.parametrize("fixture", FIXTURES["rejected"])
 def test_malformed_serials_are_not_extracted(fixture):
     assert list(Citation.extract_citations(fixture["source"])) == []
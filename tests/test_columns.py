@@ -0,0 +1,82 @@
+from citation_utils import CitableDocument, OccurrenceTable
+from citation_utils.columns import CATEGORY_NAMES, EPOCH_ORDINAL, NO_CATEGORY, NO_DATE
+
+SOURCES = [
+    ("a", "G.R. No. 1, January 2, 2024, 900 Phil. 1; 100 SCRA 1"),
+    ("b", "Hello World"),
+    ("c", "A.M. No. RTJ-12-2317, Jan 1, 2000, 100 SCRA 1; 100 SCRA 1"),
+]
+
+
+def test_columns_hold_every_occurrence_field():
+    columns = CitableDocument.to_columns_many(SOURCES, window=400)
+    expected = [
+        (index, item)
+        for index, (_, text) in enumerate(SOURCES)
+        for item in CitableDocument(text, window=400).iter_occurrences()
+    ]
+
+    assert columns.documents == ["a", "b", "c"]
+    assert len(columns) == len(expected)
+    for row, (index, item) in enumerate(expected):
+        code, days = columns.category[row], columns.date[row]
+        assert columns.document[row] == index
+        assert (columns.start[row], columns.end[row]) == (item.start, item.end)
+        assert (CATEGORY_NAMES[code] if code != NO_CATEGORY else None) == (
+            item.category and item.category.name
+        )
+        assert (days + EPOCH_ORDINAL if days != NO_DATE else None) == (
+            item.docket_date and item.docket_date.toordinal()
+        )
+        assert [columns.serial[row], columns.phil[row]] == [item.serial, item.phil]
+        assert [columns.scra[row], columns.offg[row]] == [item.scra, item.offg]
+
+
+def test_equal_strings_are_stored_once():
+    columns = CitableDocument.to_columns_many(SOURCES)
+    reports = [value for value in columns.scra if value]
+
+    assert len(reports) == 3
+    assert len({id(value) for value in reports}) == 1
+
+
+def test_single_document_columns():
+    text = SOURCES[0][1]
+    columns = CitableDocument(text).to_columns()
+
+    assert columns.documents == [None]
+    assert list(columns.to_dict()["start"]) == [
+        item.start for item in CitableDocument(text).iter_occurrences()
+    ]
+
+
+def test_table_rows_read_back_as_the_same_occurrences():
+    table = OccurrenceTable.from_sources(SOURCES, window=400)
+    expected = [
+        item
+        for _, text in SOURCES
+        for item in CitableDocument(text, window=400).iter_occurrences()
+    ]
+
+    assert len(table) == len(expected)
+    assert list(table) == expected
+    assert table[-1] == expected[-1]
+    assert table[1:3] == expected[1:3]
+    assert list(table.iter_document("b")) == []
+    assert list(table.iter_document("c")) == expected[2:]
+
+
+def test_table_stores_each_string_once():
+    table = OccurrenceTable.from_sources(SOURCES)
+
+    assert sorted(table.strings) == sorted(set(table.strings))
+    assert table.scra.count(table.strings.index("100 SCRA 1")) == 3
+
+
+def test_table_shares_the_column_encoding():
+    table = OccurrenceTable.from_sources(SOURCES)
+    columns = CitableDocument.to_columns_many(SOURCES)
+
+    for name in ("document", "start", "end", "category", "date"):
+        assert getattr(table, name) == getattr(columns, name)
+    assert not hasattr(table, "texts")
@@ -0,0 +1,146 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+from citation_utils import CitableDocument
+from citation_utils.dockets import docket_scanner
+from citation_utils.dockets.models import DOCKET_TAIL_REGEX
+
+SOURCES = [
+    "A.C. No. L-363, Jan. 1, 2000; Bar Matter No. L-363, Jan. 1, 2000",
+    "AM OCA IPI No. P-07-2403, Feb. 06, 2008; OCA IPI No. 10-3450-P, Feb. 06, 2008",
+    (
+        "Bagong Alyansang Makabayan v. Zamora, G.R. Nos. 138570, 138572, 138587, "
+        "138680, 138698, October 10, 2000, 342 SCRA 449; L-5110, Jan. 1, 1960"
+    ),
+    (
+        "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000; "
+        "P.E.T. Case No. 001, February 13, 1996; UDK-1111, February 15, 2021; "
+        "JIB FPI No. 21-018-MTJ. August 17, 2022; CA G.R. No. L-363, Jan. 1, 2000"
+    ),
+    "A.M. No. 123 and A.M. No. , Jan 1, 2020; Adm. Case No. 129-J, July 30, 1976",
+]
+
+
+def summarize(result):
+    return (
+        result._source_span,
+        result.category.name,
+        result.ids,
+        result.docket_date,
+        result.volpubpage,
+        result._explicit_category,
+    )
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_single_pass_matches_each_category_search(source):
+    expected = sorted(
+        (
+            summarize(result)
+            for _, citation, _ in docket_scanner.entries
+            for result in citation.search(source)
+        ),
+        key=lambda item: item[0][0],
+    )
+
+    assert [summarize(result) for result in docket_scanner.search(source)] == expected
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_declared_initials_do_not_change_category_matches(source):
+    for constructor, _, _ in docket_scanner.entries:
+        unguarded = re.compile(
+            constructor.docket_regex + DOCKET_TAIL_REGEX, re.I | re.X
+        )
+        assert [match.span() for match in unguarded.finditer(source)] == [
+            match.span() for match in constructor.pattern.finditer(source)
+        ]
+
+
+def test_combined_alternation_is_compiled_once():
+    assert docket_scanner.pattern is docket_scanner.pattern
+    assert list(docket_scanner.search("no docket here, Jan. 1, 2000")) == []
+
+
+def test_import_compiles_no_docket_pattern():
+    script = (
+        "import sys, citation_utils\n"
+        "from citation_utils.dockets import docket_scanner\n"
+        "print(all(c._pattern_cache is None and c._key_num_pattern_cache is None"
+        " for c, _, _ in docket_scanner.entries), docket_scanner._hints,"
+        " 'citation_utils.aggregator' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.split() == ["True", "None", "False"]
+
+
+def test_styles_without_hints_are_not_matched():
+    from citation_utils import StageProfiler
+
+    profiler = StageProfiler()
+    source = "G.R. No. L-363, Jan. 1, 2000; UDK-1111, February 15, 2021"
+    found = list(docket_scanner.detect(source, profiler=profiler))
+
+    assert [citation.__name__ for citation, *_ in found] == [
+        "CitationGR",
+        "CitationUDK",
+    ]
+    assert {stage for stage in profiler.seconds if ".match." in stage} == {
+        "dockets.match.GR",
+        "dockets.match.UDK",
+    }
+
+
+def test_date_windows_find_the_same_dockets_in_long_prose():
+    prose = " The court examined the action on January 5, 2001. " * 40
+    source = prose.join(SOURCES)
+
+    assert [
+        summarize(result)
+        for result in CitableDocument.get_docketed_reports(source, False, 400)
+    ] == [
+        summarize(result)
+        for result in CitableDocument.get_docketed_reports(source, False)
+    ]
+
+
+def test_date_windows_skip_docket_phrases_longer_than_the_window():
+    source = "G.R. Nos. 138570, 138572, 138587, October 10, 2000"
+
+    assert CitableDocument(source, window=len(source)).docketed_reports
+    assert not CitableDocument(source, window=10).docketed_reports
+
+
+def test_each_distinct_date_is_decoded_once_per_document(monkeypatch):
+    from citation_utils.dockets.models import docket_dates
+
+    decoded = []
+    decode_date = docket_dates.decode_date
+    monkeypatch.setattr(
+        docket_dates,
+        "decode_date",
+        lambda raw, *args: decoded.append(raw) or decode_date(raw, *args),
+    )
+    source = "; ".join(SOURCES * 3)
+    expected = [
+        summarize(result) for result in CitableDocument.get_docketed_reports(source)
+    ]
+    decoded.clear()
+    document = CitableDocument(source, window=400)
+
+    assert [summarize(hit.to_model()) for hit in document._docket_hits] == expected
+    assert len(decoded) == len(set(decoded))
+    assert set(decoded) == set(document._docket_dates.decoded)
+
+
+def test_docket_date_pattern_is_still_importable_from_document():
+    from citation_utils.dockets.models.docket_dates import DOCKET_DATE_PATTERN
+    from citation_utils.document import DOCKET_DATE_PATTERN as reexported
+
+    assert reexported is DOCKET_DATE_PATTERN
@@ -0,0 +1,39 @@
+from citation_utils import CitableDocument, extract_guarded
+
+TEXT = (
+    "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000; "
+    "Bar Matter No. L-363, Jan. 1, 2000; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; "
+    "31 SCRA 562"
+)
+DOCKETS = "".join(f"A.M. No. RTJ-00-{i}, Jan. 1, 2000; " for i in range(1, 41))
+
+
+def test_unspent_budget_gives_the_same_occurrences():
+    result = extract_guarded(TEXT, seconds=None, window=400)
+    assert result.diagnostics.complete
+    assert result.diagnostics.reached == len(CitableDocument(TEXT).text)
+    assert result.occurrences == list(
+        CitableDocument(TEXT, window=400).iter_occurrences()
+    )
+
+
+def test_spent_step_budget_gives_a_complete_prefix():
+    expected = list(CitableDocument(DOCKETS).iter_occurrences())
+    result = extract_guarded(DOCKETS, seconds=None, steps=40, window=None)
+    diagnostics = result.diagnostics
+    assert not diagnostics.complete
+    assert diagnostics.stage.startswith("dockets.")
+    assert diagnostics.steps == 41
+    assert 0 < len(result.occurrences) < len(expected)
+    assert result.occurrences == expected[: len(result.occurrences)]
+    assert all(item.start < diagnostics.reached for item in result.occurrences)
+    assert diagnostics.category is not None
+
+
+def test_spent_time_budget_stops_at_the_first_docket_stage():
+    result = extract_guarded(DOCKETS, seconds=0, window=None)
+    assert not result.diagnostics.complete
+    assert result.diagnostics.stage == "dockets.dates"
+    assert result.diagnostics.reached == 0
+    assert result.occurrences == []
+    assert "dockets.search" not in result.diagnostics.stages
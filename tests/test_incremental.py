@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from citation_utils import CitableDocument, IncrementalDocument
+
+CITATIONS = [
+    "G.R. Nos. 138570, 138572, October 10, 2000, 342 SCRA 449",
+    "100 SCRA 1",
+    "A.C. No. L-363, Jan. 1, 2000",
+    "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000",
+    "Bar Matter No. 803, Jan. 1, 2000",
+    "47 O.G. Supp. 43",
+]
+INSERTS = ["G.R. No. 5, Jan. 1, 2000", ", 100 SCRA 1", "A.M. No. ", "L-", "1", "; "]
+
+
+@pytest.mark.parametrize("window", [None, 400])
+def test_edits_give_the_occurrences_of_a_new_document(window):
+    rng = random.Random(0)
+    prose = " The Court ruled on this matter in an earlier case. " * 3
+    document = IncrementalDocument(prose.join(CITATIONS * 20), window=window)
+
+    for _ in range(100):
+        offset = rng.randrange(len(document.text) + 1)
+        deleted = min(rng.choice([0, 1, 5, 30]), len(document.text) - offset)
+        document.edit(offset, deleted, rng.choice(INSERTS))
+
+        assert document.occurrences == list(
+            CitableDocument(document.text, window=window).iter_occurrences()
+        )
+
+
+def test_parts_match_those_of_a_new_document():
+    document = IncrementalDocument("G.R. No. 1, Jan. 1, 2000, 100 scra 1")
+    document.edit(len(document.text), 0, "; 1 phil. 1")
+
+    assert list(document.iter_parts()) == list(
+        CitableDocument(document.text).iter_parts()
+    )
+
+
+def test_edit_outside_text_is_rejected():
+    with pytest.raises(ValueError):
+        IncrementalDocument("100 SCRA 1").edit(5, 10, "")
@@ -0,0 +1,56 @@
+import pytest
+
+from citation_utils import CitableDocument, CitationIndex
+from citation_utils.identity import aggregate_occurrences
+
+SOURCES = [
+    ("a", "G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; A.M. No. 2, Feb. 2, 2001"),
+    ("b", "As held in 100 SCRA 1 and in 31 SCRA 562, the petition fails."),
+    ("c", "G.R. No. 3, Mar. 3, 2003, 31 SCRA 562; G.R. No. 4, Apr. 4, 2004"),
+    ("d", "Compare G.R. No. 5, May 5, 2005, 31 SCRA 562 with 100 SCRA 1."),
+    ("e", "No citation here."),
+]
+GR_1 = ("gr", "1", "2000-01-01")
+
+
+def test_report_only_occurrences_link_across_the_corpus():
+    index = CitationIndex.from_sources(SOURCES)
+
+    assert index.cited_by(GR_1) == ["a", "b", "d"]
+    assert index.cited_by(("scra", "100 scra 1")) == ["a", "b", "d"]
+    # attached to two dockets, so the report is its own identity
+    assert index.cited_by(("scra", "31 scra 562")) == ["b", "c", "d"]
+    assert index.cites("b") == {GR_1: 1, ("scra", "31 scra 562"): 1}
+    assert index.cites("e") == {}
+    assert index.cited_by(("gr", "9", "2000-01-01")) == []
+
+
+def test_a_single_document_index_follows_aggregate_occurrences():
+    for document_id, text in SOURCES:
+        index = CitationIndex.from_sources([(document_id, text)])
+        groups = aggregate_occurrences(CitableDocument(text).iter_parts())
+
+        assert list(index.cites(document_id).items()) == [
+            (group.parts.docket_key or group.parts.report_keys[0], group.mentions)
+            for group in groups
+        ]
+
+
+def test_saved_index_loads_the_same_occurrences(tmp_path):
+    index = CitationIndex.from_sources(SOURCES, window=400)
+    index.save(tmp_path / "index.json.gz")
+    loaded = CitationIndex.load(tmp_path / "index.json.gz")
+
+    assert loaded.window == 400
+    assert len(loaded) == len(SOURCES)
+    for document_id, _ in SOURCES:
+        assert loaded.occurrences(document_id) == index.occurrences(document_id)
+        assert loaded.cites(document_id) == index.cites(document_id)
+    assert loaded.cited_by(GR_1) == index.cited_by(GR_1)
+
+
+def test_document_ids_are_unique():
+    index = CitationIndex.from_sources(SOURCES[:1])
+
+    with pytest.raises(ValueError, match="already indexed"):
+        index.add("a", "")
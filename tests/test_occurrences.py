@@ -1,3 +1,10 @@
+import hashlib
+import io
+import pickle
+from dataclasses import replace
+
+import pytest
+
 from citation_utils import CitableDocument
 
 
@@ -12,3 +19,69 @@ def test_occurrences_preserve_order_spans_raw_text_and_duplicates() -> None:
     assert all(text[item.start : item.end] == item.raw_text for item in occurrences)
     assert occurrences[0].occurrence_key != occurrences[1].occurrence_key
     assert occurrences[1].phil == "900 Phil. 1"
+
+
+def test_stream_matches_whole_text_occurrences_across_chunk_boundaries() -> None:
+    text = " Prose between citations. ".join(
+        [
+            "G.R. Nos. 138570, 138572, October 10, 2000, 342 SCRA 449",
+            "100 SCRA 1",
+            "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000",
+            "Café v. José, G.R. No. 1, January 2, 2024, 900 Phil. 1",
+            "100 SCRA 1",
+        ]
+        * 5
+    )
+    expected = list(CitableDocument(text).iter_occurrences())
+
+    for chunk_size in (5, 64, 1000):
+        stream = CitableDocument.iter_occurrences_stream(
+            io.StringIO(text), chunk_size=chunk_size, overlap=200
+        )
+        assert list(stream) == expected
+
+
+def test_stream_without_whitespace_holds_a_bounded_buffer() -> None:
+    sizes = []
+
+    class Recorded(CitableDocument):
+        def __init__(self, text: str, **kwargs) -> None:
+            sizes.append(len(text))
+            super().__init__(text, **kwargs)
+
+    text = "e\u0301" * 3000 + " 100 SCRA 1 " + "ab;" * 3000 + " 12 Phil. 24"
+    stream = Recorded.iter_occurrences_stream(
+        io.StringIO(text), chunk_size=100, overlap=50
+    )
+
+    assert list(stream) == list(CitableDocument(text).iter_occurrences())
+    assert max(sizes) <= 100 + 3 * 50
+
+
+def test_occurrence_keys_by_scheme() -> None:
+    text = "G.R. No. 1, January 2, 2024, 900 Phil. 1; 100 SCRA 1; 100 SCRA 1"
+    occurrences = list(CitableDocument(text).iter_occurrences())
+    item = occurrences[0]
+    identity = "\0".join(
+        ["0", str(item.end), item.raw_text, "GR", "1", "2024-01-02", "900 Phil. 1"]
+        + ["", ""]
+    )
+
+    assert item.occurrence_key == hashlib.sha256(identity.encode()).hexdigest()
+    assert len(item.key("blake2b")) == 32
+    assert item.key("tuple") == (0, item.end, item.raw_text, "GR", "1") + (
+        item.docket_date,
+        "900 Phil. 1",
+        None,
+        None,
+    )
+    assert len({other.key("tuple") for other in occurrences}) == 3
+    assert item.key("sha256") is item.key("sha256")
+    sha256, blake2b = item.key("sha256"), item.key("blake2b")
+    item.key("tuple")
+    assert (item.key("sha256"), item.key("blake2b")) == (sha256, blake2b)
+    assert item.key("sha256") is sha256 and item.key("blake2b") is blake2b
+    assert replace(item, start=1).occurrence_key != item.occurrence_key
+    assert pickle.loads(pickle.dumps(item)) == item
+    with pytest.raises(ValueError):
+        item.key("md5")  # type: ignore[arg-type]
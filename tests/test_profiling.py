@@ -0,0 +1,47 @@
+from citation_utils import CitableDocument, StageProfiler
+from citation_utils.identity import aggregate_occurrences
+
+TEXT = (
+    "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000; "
+    "Bar Matter No. L-363, Jan. 1, 2000; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1; "
+    "31 SCRA 562"
+)
+
+
+def test_profiled_extraction_records_each_stage_without_changing_results():
+    profiler = StageProfiler()
+    document = CitableDocument(TEXT, window=400, profiler=profiler)
+    occurrences = list(document.iter_occurrences())
+    aggregate_occurrences(document.iter_parts(), profiler=profiler)
+
+    assert occurrences == list(CitableDocument(TEXT, window=400).iter_occurrences())
+    stages = profiler.to_dict()
+    assert {
+        "normalize",
+        "dockets.dates",
+        "dockets.hint",
+        "dockets.search",
+        "dockets.match.AM",
+        "dockets.implicit_gr_owner",
+        "span_index",
+        "reports",
+        "occurrences.merge",
+        "aggregate",
+    } <= set(stages)
+    assert stages["occurrences.merge"]["calls"] == 2 * len(occurrences)
+    assert all(stage["seconds"] >= 0 for stage in stages.values())
+
+
+def test_prometheus_text_has_a_sample_per_stage():
+    profiler = StageProfiler()
+    with profiler.stage('quoted "stage"'):
+        pass
+    profiler.add("normalize", 0.5, calls=2)
+
+    assert profiler.to_prometheus().splitlines()[-5:] == [
+        'citation_utils_stage_seconds_total{stage="normalize"} 0.5',
+        "# HELP citation_utils_stage_calls_total Calls of each stage.",
+        "# TYPE citation_utils_stage_calls_total counter",
+        'citation_utils_stage_calls_total{stage="quoted \\"stage\\""} 1',
+        'citation_utils_stage_calls_total{stage="normalize"} 2',
+    ]
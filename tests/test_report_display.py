@@ -0,0 +1,56 @@
+import pytest
+
+from citation_utils import Citation, CountedCitation
+from citation_utils.identity import (
+    configure_report_display_cache,
+    report_display_cache_info,
+)
+
+TEXT = "G.R. No. 1, Jan. 1, 2000, 100 Phil. 100, 12 SCRA 1-a; 5 O.G. Supp. 7"
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_report_display_cache()
+    yield
+    configure_report_display_cache()
+
+
+def test_extracted_citations_render_without_parsing():
+    citations = list(Citation.extract_citations(TEXT))
+    counted = CountedCitation.from_source(TEXT)
+    rendered = [str(citation) for citation in [*citations, *counted]]
+    assert report_display_cache_info().misses == 0
+
+    for citation in citations:
+        citation._displayed = None
+    assert [str(citation) for citation in citations] == rendered[: len(citations)]
+    assert report_display_cache_info().misses > 0
+
+
+def test_assignment_falls_back_to_parsing():
+    citation = next(Citation.extract_citations("100 Phil. 100"))
+    citation.phil = "200 phil. 200"
+    assert str(citation) == "200 Phil. 200"
+    assert report_display_cache_info().misses == 1
+
+
+def test_database_values_are_parsed_once():
+    row = dict(cat="gr", num="1", date="2000-01-01", scra="12 scra 1-a")
+    first = Citation.make_citation_string(**row)
+    assert (
+        Citation.make_citation_string(**row)
+        == first
+        == ("G.R. No. 1, Jan. 1, 2000, 12 SCRA 1-A")
+    )
+    info = report_display_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_disabled_cache_keeps_results():
+    expected = Citation.from_docket_row(
+        "gr", "1", "2000-01-01", "1 Phil. 1", None, None
+    )
+    configure_report_display_cache(0)
+    assert str(expected) == "GR No. 1, Jan. 01, 2000, 1 Phil. 1"
+    assert report_display_cache_info().currsize == 0
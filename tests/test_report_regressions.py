@@ -30,7 +30,7 @@ def test_statutory_dockets_can_be_included_explicitly():
 def test_document_properties_are_lazy_and_cached():
     document = CitableDocument("G.R. No. 1, Jan. 1, 2000, 100 SCRA 1")
 
-    assert set(document.__dict__) == {"text"}
+    assert set(document.__dict__) == {"text", "window", "profiler", "budget"}
     assert document.reports is document.reports
     assert document.docketed_reports is document.docketed_reports
     assert document.undocketed_reports is document.undocketed_reports
@@ -59,3 +59,33 @@ def test_span_index_handles_nested_overlapping_and_equal_start_intervals():
     assert nested.contains_span(3, 9)
     assert not overlapping.contains_span(2, 7)
     assert equal_start.contains_span(0, 9)
+
+
+def test_reports_inside_docket_spans_are_left_to_the_dockets():
+    pieces = [
+        "G.R. No. 1, Jan. 1, 2000, 100 SCRA 1",
+        "100 SCRA 1",
+        "A.M. No. P-13-3116, Jan. 1, 2000, 5 Phil. 5, 10",
+        "47 O.G. Supp. 43",
+        "A.C. No. L-363, Jan. 1, 2000, 2 SCRA 2",
+        "Prose, 7 Phil. 7",
+        "G.R. No. 2, Feb. 2, 2001",
+    ]
+    for rotation in range(len(pieces)):
+        text = "; ".join(pieces[rotation:] + pieces[:rotation])
+        document = CitableDocument(text)
+
+        assert sorted(
+            text[start:end] for (start, end), *_ in document._report_identities
+        ) == ["100 SCRA 1", "47 O.G. Supp. 43", "7 Phil. 7"]
+        assert sorted(
+            value
+            for occurrence in document.iter_occurrences()
+            for value in (occurrence.phil, occurrence.scra, occurrence.offg)
+            if value
+        ) == sorted(
+            value
+            for report in document.reports
+            for value in (report.phil, report.scra, report.qualified_offg)
+            if value
+        )
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from citation_utils.dockets import (
+    Docket,
+    DocketCategory,
+    configure_serial_cache,
+    serial_cache_info,
+)
+
+SERIALS = [
+    ("G.R. No. L-12345", DocketCategory.GR),
+    ("L-12345", "gr"),
+    ("RTJ-12-2317", DocketCategory.AM),
+    ("No. 10-3378-RTJ", "AM"),
+    ("P.E.T. 001", None),
+    ("138570, 138572", DocketCategory.GR),
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    configure_serial_cache()
+    yield
+    configure_serial_cache()
+
+
+def test_cached_serials_equal_uncached_ones():
+    configure_serial_cache(0)
+    expected = [Docket.clean_serial(text, category) for text, category in SERIALS]
+    assert serial_cache_info().currsize == 0
+
+    configure_serial_cache()
+    assert [Docket.clean_serial(*item) for item in SERIALS * 2] == expected * 2
+    info = serial_cache_info()
+    assert (info.hits, info.evictions) == (len(SERIALS), 0)
+
+
+def test_category_spellings_share_an_entry():
+    Docket.clean_serial("L-12345", DocketCategory.GR)
+    Docket.clean_serial("L-12345", "gr")
+    assert serial_cache_info().hits == 1
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    configure_serial_cache(2)
+    for text in ("1", "2", "1", "3", "2"):
+        Docket.clean_serial(text)
+    info = serial_cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+
+
+def test_concurrent_calls_agree():
+    configure_serial_cache(4)
+    items = SERIALS * 200
+    expected = [Docket.clean_serial(*item) for item in items]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda item: Docket.clean_serial(*item), items))
+    assert results == expected
+    info = serial_cache_info()
+    assert info.hits + info.misses == 2 * len(items)
+    assert info.currsize <= 4
+
+
+def test_concurrent_misses_of_one_key_are_not_evictions():
+    from threading import Barrier
+
+    from citation_utils.lru import LRUCache
+
+    barrier = Barrier(4)
+    cache = LRUCache(lambda key: (barrier.wait(), key)[1], maxsize=2)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(cache, ["a"] * 4))
+    info = cache.cache_info()
+    assert (info.misses, info.evictions, info.currsize) == (4, 0, 1)
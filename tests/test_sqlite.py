@@ -0,0 +1,51 @@
+from citation_utils import CitableDocument, Citation, CountedCitation
+from citation_utils.sqlite import connect, export_sources, improprieties, same_serial
+
+SOURCES = [
+    ("a", "G.R. No. 1, Jan. 1, 2000; 100 SCRA 1; G.R. No. 1, Jan. 1, 2000, 100 SCRA 1"),
+    (
+        "b",
+        "Bagong Alyansang Makabayan v. Zamora, G.R. Nos. 138570, 138572, 138587, "
+        "October 10, 2000, 342 SCRA 449",
+    ),
+    ("c", "As in 342 SCRA 449; compare G.R. No. 1, Jan. 1, 1950, 374 Phil. 1"),
+    ("d", "A.M. No. RTJ-12-2317 (Formerly OCA I.P.I. No. 10-3378-RTJ), Jan 1, 2000"),
+    ("e", "No citation here."),
+]
+
+
+def test_rows_equal_counted_citation_rows(tmp_path):
+    conn = connect(tmp_path / "citations.db")
+
+    assert export_sources(conn, SOURCES, batch_size=2) == len(SOURCES)
+    assert conn.execute("pragma journal_mode").fetchone() == ("wal",)
+    for document_id, text in SOURCES:
+        rows = conn.execute(
+            "select cat, num, date, phil, scra, offg, mentions from citations "
+            "where document_id = ? order by rowid",
+            (document_id,),
+        ).fetchall()
+        assert rows == [tuple(row) for row in CountedCitation.extract_rows(text)]
+        spans = conn.execute(
+            'select start, "end", raw_text from occurrences where document_id = ?',
+            (document_id,),
+        ).fetchall()
+        assert spans == [
+            (item.start, item.end, item.raw_text)
+            for item in CitableDocument(text).iter_occurrences()
+        ]
+
+
+def test_dockets_are_stored_once_by_slug():
+    conn = connect()
+    export_sources(conn, SOURCES, occurrences=False)
+
+    slugs = [row[0] for row in conn.execute("select id from dockets order by id")]
+    assert len(slugs) == len(set(slugs)) == 4
+    assert Citation.extract_citation(SOURCES[0][1]).set_slug() in slugs
+    assert conn.execute("select count(*) from occurrences").fetchone() == (0,)
+    assert same_serial(conn, "gr", "1") == [
+        ("gr", "1", "2000-01-01"),
+        ("gr", "1", "1950-01-01"),
+    ]
+    assert [row[1:3] for row in improprieties(conn)] == [("gr", "1")]